@@ -0,0 +1,185 @@
+"""Benchmark das rotas principais com o app real e bancos semeados em várias escalas.
+
+Para cada escala (quantidade de alunos) cria um banco novo, semeia com
+INSERTs em lote (as mesmas funções do ``flask seed``) e mede
+vazão e latência p50/p95 de cada rota. O resultado vai para um JSON com o
+commit atual, para comparar commits entre si.
+
+Uso (a partir de backend/):
+    python -m benchmarks.bench_endpoints --escalas 1000,10000,100000
+    python -m benchmarks.bench_endpoints --database-url postgresql://... --escalas 10000
+
+Por padrão o cache de respostas (ETag/LRU) fica desligado para medir o
+custo real de cada rota; use ``--com-cache`` para medir com ele.
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+SENHA_BENCH = 'senha-bench'
+EMAIL_BENCH = 'bench@karate.com'
+LOTE = 5000
+
+
+def _percentil(valores, p):
+    ordenados = sorted(valores)
+    return ordenados[min(len(ordenados) - 1, int(round(p / 100 * (len(ordenados) - 1))))]
+
+
+def _commit_atual():
+    try:
+        return subprocess.check_output(['git', 'rev-parse', '--short', 'HEAD'], text=True).strip()
+    except Exception:
+        return 'desconhecido'
+
+
+def semear(app, qtd_alunos, qtd_exames, inscricoes_por_exame, semente=42):
+    """Popula o banco do ``app``. Devolve um resumo do que foi criado."""
+    from src.commands.seed_command import semear_alunos, semear_aulas, semear_exames, semear_professores
+    from src.database import db
+    from src.models.exame_model import ExameModel
+    from src.models.user_model import UserModel
+
+    rnd = random.Random(semente)
+
+    with app.app_context():
+        db.create_all()
+
+        db.session.add(UserModel(nome='Bench', email=EMAIL_BENCH, senha=SENHA_BENCH, nivel_acesso='admin'))
+        db.session.commit()
+
+        qtd_professores = max(1, qtd_alunos // 100)
+        semear_alunos(qtd_alunos, rnd, LOTE)
+        semear_professores(qtd_professores, rnd, LOTE)
+        semear_aulas(qtd_professores * 3, rnd, LOTE)
+        semear_exames(qtd_exames, inscricoes_por_exame, rnd, LOTE)
+
+        exame_exemplo = db.session.query(ExameModel.id).order_by(ExameModel.id).limit(1).scalar()
+        return {'exame_exemplo': exame_exemplo}
+
+
+def medir(cliente, metodo, url, requisicoes, aquecimento=3, **kwargs):
+    chamar = getattr(cliente, metodo)
+    for _ in range(aquecimento):
+        chamar(url, **kwargs)
+    latencias = []
+    status = {}
+    inicio_total = time.perf_counter()
+    for _ in range(requisicoes):
+        inicio = time.perf_counter()
+        resp = chamar(url, **kwargs)
+        resp.get_data()
+        latencias.append(time.perf_counter() - inicio)
+        status[resp.status_code] = status.get(resp.status_code, 0) + 1
+    total = time.perf_counter() - inicio_total
+    return {
+        'requisicoes': requisicoes,
+        'req_por_s': round(requisicoes / total, 2),
+        'p50_ms': round(_percentil(latencias, 50) * 1000, 3),
+        'p95_ms': round(_percentil(latencias, 95) * 1000, 3),
+        'media_ms': round(statistics.mean(latencias) * 1000, 3),
+        'status': status,
+    }
+
+
+def rodar_escala(qtd_alunos, args, database_url):
+    os.environ['DATABASE_URL'] = database_url
+    from src.app import create_app
+
+    app = create_app()
+    inicio = time.perf_counter()
+    resumo = semear(app, qtd_alunos, args.exames, args.inscricoes_por_exame)
+    tempo_semeadura = time.perf_counter() - inicio
+
+    cliente = app.test_client()
+    login = cliente.post('/api/v1/users/login', json={'email': EMAIL_BENCH, 'senha': SENHA_BENCH})
+    headers = {'Authorization': f"Bearer {login.get_json()['token']}"}
+    exame_id = resumo['exame_exemplo']
+
+    rotas = {
+        'list_alunos': ('get', '/api/v1/alunos/', {}),
+        'list_alunos_pagina': ('get', '/api/v1/alunos/?limit=50', {}),
+        'list_alunos_stream': ('get', '/api/v1/alunos/?stream=1', {}),
+        'search_alunos': ('get', '/api/v1/alunos/?search=silva', {}),
+        'busca_alunos': ('get', '/api/v1/alunos/busca?q=joao%20silva', {}),
+        'list_professores': ('get', '/api/v1/professores/', {}),
+        'list_aulas': ('get', '/api/v1/aulas/', {}),
+        'list_aulas_hoje': ('get', '/api/v1/aulas/?dia=hoje', {}),
+        'list_exames': ('get', '/api/v1/exames/', {}),
+        'get_banca_exame': ('get', f'/api/v1/exames/{exame_id}/banca', {}),
+        'stats': ('get', '/api/v1/stats/', {}),
+        'login': ('post', '/api/v1/users/login', {'json': {'email': EMAIL_BENCH, 'senha': SENHA_BENCH}}),
+    }
+    resultados = {}
+    for nome, (metodo, url, extra) in rotas.items():
+        if nome in args.pular:
+            continue
+        kwargs = dict(extra)
+        if nome != 'login':
+            kwargs['headers'] = headers
+        resultados[nome] = medir(cliente, metodo, url, args.requisicoes, **kwargs)
+        r = resultados[nome]
+        print(f"  {nome:<20} {r['req_por_s']:>9.1f} req/s  p50 {r['p50_ms']:>9.2f} ms  p95 {r['p95_ms']:>9.2f} ms  {r['status']}")
+
+    return {'semeadura_s': round(tempo_semeadura, 2), **resumo, 'rotas': resultados}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--escalas', default='1000,10000,100000', help='quantidades de alunos, separadas por vírgula')
+    parser.add_argument('--exames', type=int, default=200)
+    parser.add_argument('--inscricoes-por-exame', type=int, default=60)
+    parser.add_argument('--requisicoes', type=int, default=20, help='requisições medidas por rota')
+    parser.add_argument('--database-url', default=None,
+                        help='banco vazio a usar em todas as escalas (padrão: um SQLite temporário por escala)')
+    parser.add_argument('--pular', default='', help='rotas a ignorar, separadas por vírgula')
+    parser.add_argument('--com-cache', action='store_true', help='mantém o cache de respostas ligado')
+    parser.add_argument('--saida', default=None, help='arquivo JSON de saída')
+    args = parser.parse_args()
+    args.pular = {r.strip() for r in args.pular.split(',') if r.strip()}
+
+    os.environ.setdefault('JWT_SECRET_KEY', 'chave-de-benchmark-com-32-bytes-no-minimo')
+    if not args.com_cache:
+        os.environ['CACHE_MAX_ITENS'] = '0'
+        os.environ['CACHE_TTL'] = '0'
+
+    commit = _commit_atual()
+    resultado = {
+        'commit': commit,
+        'data': datetime.utcnow().isoformat(timespec='seconds') + 'Z',
+        'python': sys.version.split()[0],
+        'plataforma': platform.platform(),
+        'com_cache': args.com_cache,
+        'escalas': {},
+    }
+
+    with tempfile.TemporaryDirectory() as pasta:
+        for qtd in [int(e) for e in args.escalas.split(',') if e.strip()]:
+            url = args.database_url or f"sqlite:///{os.path.join(pasta, f'bench_{qtd}.db')}"
+            resultado['banco'] = url.split(':', 1)[0]
+            print(f"Escala: {qtd} alunos")
+            resultado['escalas'][str(qtd)] = rodar_escala(qtd, args, url)
+            if args.database_url:
+                # Reaproveita o mesmo banco: limpa antes da próxima escala
+                from src.database import db
+                from src.app import create_app
+                with create_app().app_context():
+                    db.drop_all()
+
+    saida = args.saida or os.path.join(os.path.dirname(__file__), 'resultados', f'bench_{commit}.json')
+    os.makedirs(os.path.dirname(os.path.abspath(saida)), exist_ok=True)
+    with open(saida, 'w', encoding='utf-8') as arquivo:
+        json.dump(resultado, arquivo, ensure_ascii=False, indent=2)
+    print(f"Resultados gravados em {saida}")
+
+
+if __name__ == '__main__':
+    main()
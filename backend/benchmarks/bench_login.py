@@ -0,0 +1,115 @@
+"""Vazão de login sob carga concorrente: hash na thread da requisição
+(antes) vs. executor limitado de hash_service (depois).
+
+Simula as threads de um worker gunicorn (``--threads``) disparando logins
+ao mesmo tempo e mede também a latência de uma rota leve (``GET /``)
+atendida durante a rajada.
+
+Uso (a partir de backend/):
+    python -m benchmarks.bench_login --threads 16 --logins 200 --concorrencia 2
+"""
+import argparse
+import os
+import statistics
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+
+def _percentil(valores, p):
+    if not valores:
+        return 0.0
+    ordenados = sorted(valores)
+    return ordenados[min(len(ordenados) - 1, int(round(p / 100 * (len(ordenados) - 1))))]
+
+
+def _criar_app(caminho_db):
+    os.environ['DATABASE_URL'] = f'sqlite:///{caminho_db}'
+    os.environ.setdefault('JWT_SECRET_KEY', 'chave-de-benchmark-com-32-bytes-no-minimo')
+    from src.app import create_app
+    from src.database import db
+    from src.models.user_model import UserModel
+
+    app = create_app()
+    with app.app_context():
+        # Todas as tabelas: o login consulta também professores (papel e situação)
+        db.create_all()
+        if not UserModel.query.filter_by(email='bench@karate.com').first():
+            db.session.add(UserModel(nome='Bench', email='bench@karate.com', senha='senha-bench'))
+            db.session.commit()
+    return app
+
+
+def _rodar(app, threads, logins):
+    local = threading.local()
+
+    def cliente():
+        if not hasattr(local, 'cliente'):
+            local.cliente = app.test_client()
+        return local.cliente
+
+    def login(_):
+        inicio = time.perf_counter()
+        resp = cliente().post('/api/v1/users/login', json={'email': 'bench@karate.com', 'senha': 'senha-bench'})
+        return time.perf_counter() - inicio, resp.status_code
+
+    latencias_leves = []
+    parar = threading.Event()
+
+    def rota_leve():
+        c = app.test_client()
+        while not parar.is_set():
+            inicio = time.perf_counter()
+            c.get('/')
+            latencias_leves.append(time.perf_counter() - inicio)
+            time.sleep(0.005)
+
+    sonda = threading.Thread(target=rota_leve)
+    sonda.start()
+    inicio = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        resultados = list(pool.map(login, range(logins)))
+    duracao = time.perf_counter() - inicio
+    parar.set()
+    sonda.join()
+
+    latencias = [r[0] for r in resultados]
+    return {
+        'logins_por_s': logins / duracao,
+        'login_p50_ms': _percentil(latencias, 50) * 1000,
+        'login_p95_ms': _percentil(latencias, 95) * 1000,
+        'status': {s: sum(1 for r in resultados if r[1] == s) for s in {r[1] for r in resultados}},
+        'rota_leve_p95_ms': _percentil(latencias_leves, 95) * 1000,
+        'rota_leve_media_ms': (statistics.mean(latencias_leves) * 1000) if latencias_leves else 0.0,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--threads', type=int, default=16, help='threads concorrentes fazendo login')
+    parser.add_argument('--logins', type=int, default=200, help='total de logins por cenário')
+    parser.add_argument('--concorrencia', type=int, default=None, help='HASH_MAX_CONCURRENCY do cenário "depois"')
+    parser.add_argument('--timeout-fila', type=float, default=30.0, help='HASH_QUEUE_TIMEOUT do cenário "depois"')
+    args = parser.parse_args()
+
+    from src.services import hash_service
+
+    with tempfile.TemporaryDirectory() as pasta:
+        app = _criar_app(os.path.join(pasta, 'bench_login.db'))
+        cenarios = [
+            ('antes (hash na thread da requisição)', 0),
+            ('depois (executor limitado)', args.concorrencia or hash_service.MAX_CONCORRENCIA_PADRAO),
+        ]
+        for nome, concorrencia in cenarios:
+            hash_service.configurar(max_concorrencia=concorrencia, timeout_fila=args.timeout_fila)
+            r = _rodar(app, args.threads, args.logins)
+            if set(r['status']) != {200}:
+                raise SystemExit(f"❌ Erro: logins com status diferente de 200 em '{nome}': {r['status']}")
+            print(f"{nome} [concorrência de hash={concorrencia or 'sem limite'}]")
+            print(f"  logins/s: {r['logins_por_s']:.1f}  p50: {r['login_p50_ms']:.1f} ms  p95: {r['login_p95_ms']:.1f} ms  status: {r['status']}")
+            print(f"  GET / durante a rajada: média {r['rota_leve_media_ms']:.2f} ms  p95 {r['rota_leve_p95_ms']:.2f} ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,159 @@
+"""Benchmark da serialização das listagens (alunos e professores).
+
+Compara, com a mesma lista de N linhas, o caminho antigo (objetos ORM +
+``to_json`` + json da stdlib) com a projeção de colunas e com o orjson,
+separadamente e juntos, em linhas por segundo. No fim mede as rotas
+``GET /alunos/`` e ``GET /professores/`` de ponta a ponta (cache desligado).
+
+Uso (a partir de backend/):
+    python -m benchmarks.bench_serializacao --linhas 10000
+    python -m benchmarks.bench_serializacao --database-url postgresql://... --linhas 10000
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+from .bench_endpoints import EMAIL_BENCH, LOTE, SENHA_BENCH, _commit_atual, medir
+
+
+def _semear(app, linhas, semente=42):
+    from src.commands.seed_command import semear_alunos, semear_professores
+    from src.database import db
+    from src.models.user_model import UserModel
+
+    rnd = random.Random(semente)
+    with app.app_context():
+        db.create_all()
+        db.session.add(UserModel(nome='Bench', email=EMAIL_BENCH, senha=SENHA_BENCH, nivel_acesso='admin'))
+        db.session.commit()
+        semear_alunos(linhas, rnd, LOTE)
+        semear_professores(linhas, rnd, LOTE)
+
+
+def _codificadores():
+    """Mesmas opções do provider do Flask: chaves ordenadas, saída compacta."""
+    from src.json_provider import orjson, padrao_json
+
+    codificadores = {
+        'json': lambda obj: json.dumps(obj, default=padrao_json, sort_keys=True, separators=(',', ':')).encode(),
+    }
+    if orjson is not None:
+        opcoes = orjson.OPT_NON_STR_KEYS | orjson.OPT_SORT_KEYS
+        codificadores['orjson'] = lambda obj: orjson.dumps(obj, default=padrao_json, option=opcoes)
+    return codificadores
+
+
+def _estrategias():
+    from src.models.aluno_model import AlunoModel
+    from src.models.professor_model import ProfessorModel
+    from src.services.serializacao_service import ALUNO_JSON, PROFESSOR_JSON
+
+    return {
+        'alunos': {
+            'orm_to_json': lambda: [a.to_json() for a in AlunoModel.query.filter_by(ativo=True)
+                                    .order_by(AlunoModel.nome, AlunoModel.id).all()],
+            'projecao': lambda: ALUNO_JSON.linhas(ALUNO_JSON.select().where(AlunoModel.ativo.is_(True))
+                                                  .order_by(AlunoModel.nome, AlunoModel.id)),
+        },
+        'professores': {
+            'orm_to_json': lambda: [p.to_json() for p in ProfessorModel.query.filter_by(ativo=True)
+                                    .order_by(ProfessorModel.nome).all()],
+            'projecao': lambda: PROFESSOR_JSON.linhas(PROFESSOR_JSON.select().where(ProfessorModel.ativo.is_(True))
+                                                      .order_by(ProfessorModel.nome)),
+        },
+    }
+
+
+def medir_serializacao(app, repeticoes):
+    from src.database import db
+
+    resultados = {}
+    codificadores = _codificadores()
+    with app.app_context():
+        for lista, estrategias in _estrategias().items():
+            resultados[lista] = {}
+            base = None
+            for nome_estrategia, carregar in estrategias.items():
+                for nome_codificador, codificar in codificadores.items():
+                    tempos = []
+                    qtd = 0
+                    for i in range(repeticoes + 1):
+                        db.session.remove()  # sessão nova: sem identity map da rodada anterior
+                        inicio = time.perf_counter()
+                        linhas = carregar()
+                        codificar(linhas)
+                        if i:  # a primeira rodada é aquecimento
+                            tempos.append(time.perf_counter() - inicio)
+                        qtd = len(linhas)
+                    mediana = statistics.median(tempos)
+                    chave = f"{nome_estrategia}+{nome_codificador}"
+                    r = {'linhas': qtd, 'mediana_ms': round(mediana * 1000, 2), 'linhas_por_s': round(qtd / mediana)}
+                    base = base or r['linhas_por_s']
+                    r['ganho'] = round(r['linhas_por_s'] / base, 2)
+                    resultados[lista][chave] = r
+                    print(f"  {lista:<12} {chave:<22} {r['linhas_por_s']:>10} linhas/s  "
+                          f"{r['mediana_ms']:>9.2f} ms  x{r['ganho']}")
+    return resultados
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--linhas', type=int, default=10000, help='alunos e professores semeados')
+    parser.add_argument('--repeticoes', type=int, default=5, help='rodadas medidas por combinação')
+    parser.add_argument('--requisicoes', type=int, default=10, help='requisições medidas por rota')
+    parser.add_argument('--database-url', default=None, help='banco vazio a usar (padrão: SQLite temporário)')
+    parser.add_argument('--saida', default=None, help='arquivo JSON de saída')
+    args = parser.parse_args()
+
+    os.environ.setdefault('JWT_SECRET_KEY', 'chave-de-benchmark-com-32-bytes-no-minimo')
+    os.environ['CACHE_MAX_ITENS'] = '0'
+    os.environ['CACHE_TTL'] = '0'
+
+    commit = _commit_atual()
+    with tempfile.TemporaryDirectory() as pasta:
+        os.environ['DATABASE_URL'] = args.database_url or f"sqlite:///{os.path.join(pasta, 'bench_serializacao.db')}"
+        from src.app import create_app
+
+        app = create_app()
+        print(f"Semeando {args.linhas} alunos e {args.linhas} professores...")
+        _semear(app, args.linhas)
+
+        print("Serialização:")
+        serializacao = medir_serializacao(app, args.repeticoes)
+
+        print("Rotas (ponta a ponta):")
+        cliente = app.test_client()
+        login = cliente.post('/api/v1/users/login', json={'email': EMAIL_BENCH, 'senha': SENHA_BENCH})
+        headers = {'Authorization': f"Bearer {login.get_json()['token']}"}
+        rotas = {}
+        for nome, url in (('list_alunos', '/api/v1/alunos/'), ('list_professores', '/api/v1/professores/')):
+            rotas[nome] = r = medir(cliente, 'get', url, args.requisicoes, headers=headers)
+            r['linhas_por_s'] = round(args.linhas * r['req_por_s'])
+            print(f"  {nome:<20} {r['req_por_s']:>7.2f} req/s  {r['linhas_por_s']:>10} linhas/s  p50 {r['p50_ms']:>9.2f} ms")
+
+    resultado = {
+        'commit': commit,
+        'data': datetime.utcnow().isoformat(timespec='seconds') + 'Z',
+        'python': sys.version.split()[0],
+        'plataforma': platform.platform(),
+        'banco': os.environ['DATABASE_URL'].split(':', 1)[0],
+        'linhas': args.linhas,
+        'serializacao': serializacao,
+        'rotas': rotas,
+    }
+    saida = args.saida or os.path.join(os.path.dirname(__file__), 'resultados', f'bench_serializacao_{commit}.json')
+    os.makedirs(os.path.dirname(os.path.abspath(saida)), exist_ok=True)
+    with open(saida, 'w', encoding='utf-8') as arquivo:
+        json.dump(resultado, arquivo, ensure_ascii=False, indent=2)
+    print(f"Resultados gravados em {saida}")
+
+
+if __name__ == '__main__':
+    main()
@@ -1,5 +1,10 @@
 from flask import Flask, jsonify
-from .database import db
+from .database import db, configure_database, estatisticas_pool
+from .json_provider import ProviderJSON
+from .services.auth_service import autorizacao, papel_requerido
+from .services.cache_service import cache
+from .services.metrics_service import metricas
+from .services.revogacao_service import revogacao
 from flask_jwt_extended import JWTManager
 from flask_migrate import Migrate
 import os
@@ -21,12 +26,24 @@ from .controllers.aluno_controller import aluno_bp
 from .controllers.professor_controller import professor_bp
 from .controllers.aula_controller import aula_bp
 from .controllers.exame_controller import exame_bp
+from .controllers.stats_controller import stats_bp
+from .controllers.importacao_controller import importacao_bp
+from .controllers.exportacao_controller import exportacao_bp
+from .controllers.frequencia_controller import frequencia_bp
+
+# Comandos de linha (flask ...)
+from .commands.seed_command import seed_cli
+from .commands.importacao_command import importar_cli
+from .commands.frequencia_command import frequencia_cli
+from .commands.graduacao_command import graduacao_cli
+from .commands.usuario_command import usuarios_cli
 
 jwt = JWTManager()
 migrate = Migrate()
 
 def create_app():
     app = Flask(__name__)
+    app.json = ProviderJSON(app)
 
     # ------------------- CORS CORRIGIDO -------------------
     CORS(
@@ -37,7 +54,7 @@ def create_app():
             "https://gestao-projeto-karate.vercel.app"
         ]}},
         supports_credentials=True,
-        methods=["GET", "POST", "PUT", "DELETE", "OPTIONS"],
+        methods=["GET", "POST", "PUT", "PATCH", "DELETE", "OPTIONS"],
         allow_headers=["Content-Type", "Authorization"]
     )
     # -------------------------------------------------------
@@ -53,23 +70,14 @@ def create_app():
     app.config["JWT_HEADER_TYPE"] = "Bearer"
 
     jwt.init_app(app)
+    revogacao.init_app(app, jwt)
 
-    # BANCO
-    db_url = os.getenv("DATABASE_URL")
-    if not db_url:
-        db_url = (
-            f"postgresql+psycopg2://{os.getenv('DB_USER')}:{os.getenv('DB_PASSWORD')}@"
-            f"{os.getenv('DB_HOST')}:{os.getenv('DB_PORT')}/{os.getenv('DB_NAME')}"
-        )
-
-    if db_url.startswith("postgres://"):
-        db_url = db_url.replace("postgres://", "postgresql://")
-
-    app.config["SQLALCHEMY_DATABASE_URI"] = db_url
-    app.config["SQLALCHEMY_TRACK_MODIFICATIONS"] = False
-
-    db.init_app(app)
+    # BANCO (URL, pool, timeouts e réplica vêm das variáveis de ambiente)
+    configure_database(app)
     migrate.init_app(app, db)
+    cache.init_app(app)
+    autorizacao.init_app(app)
+    metricas.init_app(app)
 
     # ROTAS
     app.register_blueprint(user_bp, url_prefix="/api/v1/users")
@@ -77,11 +85,27 @@ def create_app():
     app.register_blueprint(professor_bp, url_prefix="/api/v1/professores")
     app.register_blueprint(aula_bp, url_prefix="/api/v1/aulas")
     app.register_blueprint(exame_bp, url_prefix="/api/v1/exames")
+    app.register_blueprint(stats_bp, url_prefix="/api/v1/stats")
+    app.register_blueprint(importacao_bp, url_prefix="/api/v1/importacao")
+    app.register_blueprint(exportacao_bp, url_prefix="/api/v1/exportacao")
+    app.register_blueprint(frequencia_bp, url_prefix="/api/v1/frequencias")
+
+    # COMANDOS
+    app.cli.add_command(seed_cli)
+    app.cli.add_command(importar_cli)
+    app.cli.add_command(frequencia_cli)
+    app.cli.add_command(graduacao_cli)
+    app.cli.add_command(usuarios_cli)
     
     @app.route("/")
     def index():
         return jsonify({"message": "API de Gestão de Karatê está online!"})
 
+    @app.route("/api/v1/status/pool")
+    @papel_requerido('admin')
+    def status_pool():
+        return jsonify(estatisticas_pool())
+
     return app
 
 app = create_app()
@@ -0,0 +1,27 @@
+"""``flask frequencia``: manutenção da tabela consolidada de frequência.
+
+Exemplo:
+    flask frequencia consolidar --mes 2026-09
+"""
+from datetime import date, datetime
+
+import click
+from flask.cli import AppGroup
+
+from ..database import db
+from ..services.frequencia_service import consolidar_mes
+
+frequencia_cli = AppGroup('frequencia', help='Manutenção dos registros de frequência.')
+
+
+@frequencia_cli.command('consolidar')
+@click.option('--mes', default=None, help='Mês no formato AAAA-MM (padrão: o atual).')
+def consolidar(mes):
+    """Recalcula os totais mensais a partir dos registros de presença."""
+    try:
+        dia = datetime.strptime(mes, '%Y-%m').date() if mes else date.today()
+    except ValueError:
+        raise click.BadParameter('Use o formato AAAA-MM.', param_hint='--mes')
+    linhas = consolidar_mes(dia)
+    db.session.commit()
+    click.echo(f"{linhas} totais recalculados para {dia:%Y-%m}.")
@@ -0,0 +1,20 @@
+"""``flask graduacao``: recálculo das datas de aptidão à próxima faixa.
+
+Exemplo:
+    flask graduacao recalcular
+"""
+import click
+from flask.cli import AppGroup
+
+from ..database import db
+from ..services.graduacao_service import recalcular
+
+graduacao_cli = AppGroup('graduacao', help='Datas de aptidão à próxima graduação.')
+
+
+@graduacao_cli.command('recalcular')
+def recalcular_todos():
+    """Recalcula data_proxima_graduacao de todos os alunos."""
+    atualizados = recalcular()
+    db.session.commit()
+    click.echo(f"{atualizados} alunos atualizados.")
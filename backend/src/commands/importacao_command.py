@@ -0,0 +1,29 @@
+"""``flask importar``: importação em massa pela linha de comando.
+
+Exemplo:
+    flask importar alunos turma_centro_comunitario.csv --nao-atualizar
+"""
+import click
+from flask.cli import AppGroup
+
+from ..services.importacao_service import TAMANHO_LOTE, importar_alunos_csv
+
+importar_cli = AppGroup('importar', help='Importa dados em massa de arquivos CSV.')
+
+
+@importar_cli.command('alunos')
+@click.argument('arquivo', type=click.File('r', encoding='utf-8-sig'))
+@click.option('--atualizar/--nao-atualizar', default=True, show_default=True,
+              help='Atualiza os alunos cujo CPF já está cadastrado.')
+@click.option('--lote', default=TAMANHO_LOTE, show_default=True, help='Linhas por lote.')
+def importar_alunos(arquivo, atualizar, lote):
+    """Importa alunos de um CSV (cabeçalho com nome, cpf, data_nascimento, ...)."""
+    relatorio = importar_alunos_csv(arquivo, atualizar=atualizar, tamanho_lote=lote)
+    for erro in relatorio['erros']:
+        click.echo(f"Linha {erro['linha']}: {'; '.join(erro['erros'])}", err=True)
+    click.echo(
+        f"{relatorio['total']} linhas: {relatorio['inseridos']} inseridos, "
+        f"{relatorio['atualizados']} atualizados, {len(relatorio['erros'])} com erro."
+    )
+    if relatorio['interrompido']:
+        raise click.ClickException("Importação interrompida: o arquivo precisa estar em UTF-8.")
@@ -0,0 +1,275 @@
+"""``flask seed``: gera grandes volumes de dados sintéticos válidos.
+
+Tudo é inserido com INSERTs em lote (executemany), sem criar um objeto ORM
+por linha, e a geração é determinística para a mesma ``--semente``. As
+linhas são geradas e gravadas um lote por vez, então a memória não cresce
+com a quantidade pedida.
+
+Exemplos:
+    flask seed tudo --alunos 100000 --exames 300 --semente 7
+    flask seed alunos --quantidade 1000000 --lote 20000
+"""
+import random
+from array import array
+from datetime import date, datetime, time, timedelta
+from itertools import islice
+
+import click
+from flask.cli import AppGroup
+from sqlalchemy import func, insert
+
+from ..database import db
+from ..models.aluno_model import AlunoModel, FAIXAS
+from ..models.aula_model import AulaModel, dias_para_mascara
+from ..models.exame_model import ExameModel
+from ..models.inscricao_model import InscricaoModel
+from ..models.professor_model import ProfessorModel
+from ..models.user_model import UserModel
+from ..services.graduacao_service import recalcular
+from ..services.hash_service import gerar_hash
+
+seed_cli = AppGroup('seed', help='Gera dados sintéticos em lote.')
+
+LOTE_PADRAO = 10000
+CONSULTA_CPFS = 1000  # CPFs conferidos por consulta (parâmetros do IN)
+SENHA_PADRAO = 'karate123'
+DIAS_SEMANA = ['Segunda', 'Terça', 'Quarta', 'Quinta', 'Sexta', 'Sábado']
+NOMES = ['Ana', 'Bruno', 'Carla', 'Davi', 'Eduarda', 'Felipe', 'Gabriela', 'Heitor', 'Isabela',
+         'João', 'Larissa', 'Miguel', 'Nicole', 'Otávio', 'Paula', 'Rafael', 'Sofia', 'Thiago']
+SOBRENOMES = ['Silva', 'Souza', 'Oliveira', 'Santos', 'Pereira', 'Lima', 'Costa', 'Ferreira',
+              'Almeida', 'Ribeiro', 'Carvalho', 'Gomes', 'Martins', 'Araújo', 'Barbosa']
+
+
+def gerar_cpf(base: int) -> str:
+    """CPF válido (só dígitos) a partir dos 9 primeiros dígitos em ``base``."""
+    numeros = [int(d) for d in f'{base % 10**9:09d}']
+    for tamanho in (9, 10):
+        soma = sum(a * b for a, b in zip(numeros, range(tamanho + 1, 1, -1)))
+        numeros.append((soma * 10 % 11) % 10)
+    return ''.join(map(str, numeros))
+
+
+def _nome(rnd):
+    return f'{rnd.choice(NOMES)} {rnd.choice(SOBRENOMES)} {rnd.choice(SOBRENOMES)}'
+
+
+def _inserir(modelo, linhas, lote):
+    """INSERT em lote, com commit a cada ``lote`` linhas.
+
+    ``linhas`` pode ser um gerador: só um lote fica na memória por vez.
+    Devolve quantas linhas foram inseridas.
+    """
+    linhas = iter(linhas)
+    total = 0
+    while True:
+        bloco = list(islice(linhas, lote))
+        if not bloco:
+            return total
+        db.session.execute(insert(modelo), bloco)
+        db.session.commit()
+        total += len(bloco)
+
+
+def _ids(coluna, *filtros):
+    """IDs da consulta em um ``array`` de inteiros (8 bytes por id, não um objeto)."""
+    ids = array('q')
+    for (id_,) in db.session.query(coluna).filter(*filtros).order_by(coluna).yield_per(LOTE_PADRAO):
+        ids.append(id_)
+    return ids
+
+
+def _cpfs_livres(modelo, rnd, quantidade):
+    """Gera ``quantidade`` CPFs válidos que ainda não existem na tabela do ``modelo``.
+
+    Os candidatos são sequenciais a partir de uma base aleatória e conferidos
+    no banco em blocos de ``CONSULTA_CPFS``, sem carregar todos os CPFs.
+    """
+    base = rnd.randrange(10**8, 9 * 10**8)
+    faltam = quantidade
+    while faltam > 0:
+        candidatos = []
+        while len(candidatos) < min(faltam, CONSULTA_CPFS):
+            cpf = gerar_cpf(base)
+            base += 1
+            if len(set(cpf[:9])) > 1:
+                candidatos.append(cpf)
+        existentes = {c for (c,) in db.session.query(modelo.cpf).filter(modelo.cpf.in_(candidatos))}
+        for cpf in candidatos:
+            if cpf not in existentes:
+                faltam -= 1
+                yield cpf
+
+
+def semear_alunos(quantidade, rnd, lote=LOTE_PADRAO):
+    hoje = date.today()
+
+    def linhas():
+        for cpf in _cpfs_livres(AlunoModel, rnd, quantidade):
+            nascimento = hoje - timedelta(days=rnd.randint(5 * 365, 45 * 365))
+            yield {
+                'nome': _nome(rnd),
+                'cpf': cpf,
+                'data_nascimento': nascimento,
+                'sexo': rnd.choice(['Masculino', 'Feminino']),
+                'telefone': f'119{rnd.randrange(10**7, 10**8)}',
+                'endereco': f'Rua {rnd.choice(SOBRENOMES)}, {rnd.randint(1, 2000)}',
+                'nome_pais': _nome(rnd),
+                'grau_atual': rnd.choice(FAIXAS),
+                'data_ultima_graduacao': hoje - timedelta(days=rnd.randint(0, 3 * 365)),
+                'ativo': rnd.random() > 0.05,
+            }
+
+    gerador = linhas()
+    total = 0
+    while True:
+        ultimo_id = db.session.query(func.max(AlunoModel.id)).scalar() or 0
+        inseridos = _inserir(AlunoModel, islice(gerador, lote), lote)
+        if not inseridos:
+            return total
+        # Preenche data_proxima_graduacao do lote recém-inserido
+        recalcular(AlunoModel.id > ultimo_id, AlunoModel.data_proxima_graduacao.is_(None))
+        db.session.commit()
+        total += inseridos
+
+
+def semear_professores(quantidade, rnd, lote=LOTE_PADRAO, senha=SENHA_PADRAO):
+    """Professores com conta de login (nivel_acesso='professor'), um lote por vez."""
+    # Um hash compartilhado: calcular um PBKDF2/scrypt por linha levaria horas
+    senha_hash = gerar_hash(senha)
+    inicio = (db.session.query(func.max(UserModel.id)).scalar() or 0) + 1
+    cpfs = _cpfs_livres(ProfessorModel, rnd, quantidade)
+    total = 0
+    for i in range(0, quantidade, lote):
+        emails = [f'professor{inicio + j}@seed.karate' for j in range(i, min(i + lote, quantidade))]
+        _inserir(UserModel, [{
+            'nome': _nome(rnd), 'email': email, 'senha_hash': senha_hash, 'nivel_acesso': 'professor'
+        } for email in emails], lote)
+
+        usuarios = (
+            db.session.query(UserModel.id, UserModel.nome)
+            .filter(UserModel.email.in_(emails))
+            .order_by(UserModel.id)
+            .all()
+        )
+        total += _inserir(ProfessorModel, [{
+            'nome': nome, 'cpf': cpf,
+            'data_nascimento': date(1960, 1, 1) + timedelta(days=rnd.randint(0, 30 * 365)),
+            'telefone': f'119{rnd.randrange(10**7, 10**8)}',
+            'grau_faixa': rnd.choice(['Marrom', 'Preta']),
+            'fk_usuario': usuario_id,
+        } for (usuario_id, nome), cpf in zip(usuarios, cpfs)], lote)
+    return total
+
+
+def semear_aulas(quantidade, rnd, lote=LOTE_PADRAO):
+    professores = _ids(ProfessorModel.id, ProfessorModel.ativo.is_(True))
+    if not professores:
+        raise click.ClickException('Cadastre professores antes das aulas (flask seed professores).')
+
+    def linhas():
+        for i in range(quantidade):
+            inicio = rnd.randint(6, 21)
+            yield {
+                'nome_turma': f'Turma {i + 1} - {rnd.choice(FAIXAS)}',
+                'modalidade': 'Karatê',
+                'dias_mask': dias_para_mascara(rnd.sample(DIAS_SEMANA, rnd.randint(1, 3))),
+                'horario_inicio': time(inicio),
+                'horario_fim': time(inicio + 1),
+                'fk_professor': rnd.choice(professores),
+            }
+
+    return _inserir(AulaModel, linhas(), lote)
+
+
+def semear_exames(quantidade, inscricoes_por_exame, rnd, lote=LOTE_PADRAO):
+    """Exames passados com inscrições já avaliadas."""
+    alunos = _ids(AlunoModel.id, AlunoModel.ativo.is_(True))
+    hoje = date.today()
+    primeiro_id = (db.session.query(func.max(ExameModel.id)).scalar() or 0) + 1
+    _inserir(ExameModel, ({
+        'nome_evento': f'Exame de Graduação {i + 1}',
+        'data': (hoje - timedelta(days=rnd.randint(0, 5 * 365))).isoformat(),
+        'hora': f'{rnd.randint(8, 18):02d}:00',
+        'local': f'Dojo {rnd.choice(SOBRENOMES)}',
+        'created_at': datetime.utcnow(),
+    } for i in range(quantidade)), lote)
+    exames = _ids(ExameModel.id, ExameModel.id >= primeiro_id)
+
+    def inscricoes():
+        for exame_id in exames:
+            for aluno_id in rnd.sample(alunos, min(inscricoes_por_exame, len(alunos))):
+                notas = [round(rnd.uniform(3, 10) * 2) / 2 for _ in range(4)]
+                media = round(sum(notas) / 4, 1)
+                yield {
+                    'fk_exame': exame_id, 'fk_aluno': aluno_id,
+                    'nota_kihon': notas[0], 'nota_kata': notas[1], 'nota_kumite': notas[2], 'nota_gerais': notas[3],
+                    'media_final': media, 'aprovado': media >= 6.0,
+                }
+
+    return len(exames), _inserir(InscricaoModel, inscricoes(), lote)
+
+
+# ==================== COMANDOS ====================
+opcao_semente = click.option('--semente', default=42, show_default=True, help='Semente do gerador aleatório.')
+opcao_lote = click.option('--lote', default=LOTE_PADRAO, show_default=True, help='Linhas por INSERT/commit.')
+
+
+@seed_cli.command('alunos')
+@click.option('--quantidade', default=1000, show_default=True)
+@opcao_semente
+@opcao_lote
+def seed_alunos(quantidade, semente, lote):
+    """Gera alunos com CPF válido."""
+    n = semear_alunos(quantidade, random.Random(semente), lote)
+    click.echo(f'{n} alunos criados.')
+
+
+@seed_cli.command('professores')
+@click.option('--quantidade', default=20, show_default=True)
+@click.option('--senha', default=SENHA_PADRAO, show_default=True, help='Senha de todas as contas geradas.')
+@opcao_semente
+@opcao_lote
+def seed_professores(quantidade, senha, semente, lote):
+    """Gera professores com conta de login vinculada."""
+    n = semear_professores(quantidade, random.Random(semente), lote, senha)
+    click.echo(f'{n} professores criados (senha: {senha}).')
+
+
+@seed_cli.command('aulas')
+@click.option('--quantidade', default=50, show_default=True)
+@opcao_semente
+@opcao_lote
+def seed_aulas(quantidade, semente, lote):
+    """Gera aulas para os professores ativos."""
+    n = semear_aulas(quantidade, random.Random(semente), lote)
+    click.echo(f'{n} aulas criadas.')
+
+
+@seed_cli.command('exames')
+@click.option('--quantidade', default=100, show_default=True)
+@click.option('--inscricoes-por-exame', default=40, show_default=True)
+@opcao_semente
+@opcao_lote
+def seed_exames(quantidade, inscricoes_por_exame, semente, lote):
+    """Gera exames com inscrições avaliadas."""
+    exames, inscricoes = semear_exames(quantidade, inscricoes_por_exame, random.Random(semente), lote)
+    click.echo(f'{exames} exames e {inscricoes} inscrições criados.')
+
+
+@seed_cli.command('tudo')
+@click.option('--alunos', default=1000, show_default=True)
+@click.option('--professores', default=20, show_default=True)
+@click.option('--aulas', default=50, show_default=True)
+@click.option('--exames', default=100, show_default=True)
+@click.option('--inscricoes-por-exame', default=40, show_default=True)
+@opcao_semente
+@opcao_lote
+def seed_tudo(alunos, professores, aulas, exames, inscricoes_por_exame, semente, lote):
+    """Gera alunos, professores, aulas, exames e inscrições."""
+    rnd = random.Random(semente)
+    click.echo(f'{semear_alunos(alunos, rnd, lote)} alunos criados.')
+    click.echo(f'{semear_professores(professores, rnd, lote)} professores criados (senha: {SENHA_PADRAO}).')
+    if aulas:
+        click.echo(f'{semear_aulas(aulas, rnd, lote)} aulas criadas.')
+    qtd_exames, qtd_inscricoes = semear_exames(exames, inscricoes_por_exame, rnd, lote)
+    click.echo(f'{qtd_exames} exames e {qtd_inscricoes} inscrições criados.')
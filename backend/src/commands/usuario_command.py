@@ -0,0 +1,59 @@
+"""``flask usuarios``: contas de acesso e níveis (admin, professor, aluno).
+
+Exemplos:
+    flask usuarios criar-admin admin@dojo.com --nome "Sensei"
+    flask usuarios nivel aluno@dojo.com professor
+    flask usuarios limpar-tokens
+
+O cadastro pela API só cria contas de aluno; o primeiro admin sai daqui.
+Os workers da API em execução enxergam a mudança de nível em até
+``AUTH_CACHE_TTL`` segundos.
+"""
+import click
+from flask.cli import AppGroup
+
+from ..database import db
+from ..models.user_model import UserModel
+from ..services.auth_service import PAPEIS
+from ..services.revogacao_service import limpar_expirados
+
+usuarios_cli = AppGroup('usuarios', help='Contas de acesso e níveis.')
+
+
+@usuarios_cli.command('criar-admin')
+@click.argument('email')
+@click.option('--nome', default='Administrador', show_default=True)
+@click.option('--senha', prompt=True, hide_input=True, confirmation_prompt=True)
+def criar_admin(email, nome, senha):
+    """Cria uma conta admin (ou promove a admin a conta de EMAIL, se existir)."""
+    usuario = UserModel.query.filter_by(email=email).first()
+    if usuario:
+        usuario.nivel_acesso = 'admin'
+        db.session.commit()
+        click.echo(f"Conta {email} promovida a admin.")
+        return
+
+    db.session.add(UserModel(nome=nome, email=email, senha=senha, nivel_acesso='admin'))
+    db.session.commit()
+    click.echo(f"Admin {email} criado.")
+
+
+@usuarios_cli.command('nivel')
+@click.argument('email')
+@click.argument('nivel', type=click.Choice(PAPEIS))
+def alterar_nivel(email, nivel):
+    """Altera o nível de acesso da conta de EMAIL."""
+    usuario = UserModel.query.filter_by(email=email).first()
+    if not usuario:
+        raise click.ClickException(f"Conta {email} não encontrada.")
+    usuario.nivel_acesso = nivel
+    db.session.commit()
+    click.echo(f"{email}: {nivel}.")
+
+
+@usuarios_cli.command('limpar-tokens')
+def limpar_tokens():
+    """Apaga da tabela de revogação os tokens que já expiraram (rodar no cron)."""
+    apagados = limpar_expirados()
+    db.session.commit()
+    click.echo(f"{apagados} revogações expiradas apagadas.")
@@ -1,9 +1,16 @@
-from flask import Blueprint, request, jsonify
+from flask import Blueprint, request, jsonify, Response, stream_with_context, current_app
 from ..models.aluno_model import AlunoModel
-from ..database import db
+from ..database import db, somente_leitura
+from ..services.cache_service import cache, pede_stream
+from ..services.busca_service import buscar_alunos, LIMITE_PADRAO as LIMITE_BUSCA
+from ..services.graduacao_service import consulta_elegiveis, proxima_faixa, recalcular, recalcular_alunos
+from ..services.serializacao_service import ALUNO_JSON
+from ..services.validacao import validar_cpf, limpar_e_validar_telefone
 from datetime import datetime
-from flask_jwt_extended import jwt_required
-from sqlalchemy import or_
+from ..services.auth_service import papel_requerido
+from sqlalchemy import or_, and_
+import base64
+import json
 import re  # regex para limpeza
 
 aluno_bp = Blueprint('aluno_bp', __name__)
@@ -11,30 +18,33 @@ aluno_bp = Blueprint('aluno_bp', __name__)
 # ==============================
 # 🔹 Funções auxiliares
 # ==============================
-def validar_cpf(cpf_str: str) -> bool:
-    """Valida um CPF brasileiro."""
-    if not isinstance(cpf_str, str):
-        return False
-    numeros = [int(d) for d in cpf_str if d.isdigit()]
-    if len(numeros) != 11 or len(set(numeros)) == 1:
-        return False
+LIMITE_MAXIMO_PAGINA = 500
+TAMANHO_LOTE_STREAM = 500
 
-    soma_produtos1 = sum(a * b for a, b in zip(numeros[0:9], range(10, 1, -1)))
-    digito_esperado1 = (soma_produtos1 * 10 % 11) % 10
-    if numeros[9] != digito_esperado1:
-        return False
 
-    soma_produtos2 = sum(a * b for a, b in zip(numeros[0:10], range(11, 1, -1)))
-    digito_esperado2 = (soma_produtos2 * 10 % 11) % 10
-    return numeros[10] == digito_esperado2
+def codificar_cursor(nome: str, aluno_id: int) -> str:
+    """Gera o cursor opaco (keyset nome + id) da próxima página."""
+    bruto = json.dumps([nome, aluno_id], ensure_ascii=False).encode('utf-8')
+    return base64.urlsafe_b64encode(bruto).decode('ascii')
 
 
-def limpar_e_validar_telefone(telefone_str: str) -> str | None:
-    """Limpa e valida o número de telefone (10 ou 11 dígitos)."""
-    if not isinstance(telefone_str, str):
-        return None
-    numeros = re.sub(r'\D', '', telefone_str)
-    return numeros if 10 <= len(numeros) <= 11 else None
+def decodificar_cursor(cursor: str) -> tuple[str, int]:
+    """Lê o cursor recebido na query string. Lança ValueError se for inválido."""
+    try:
+        nome, aluno_id = json.loads(base64.urlsafe_b64decode(cursor.encode('ascii')))
+        return str(nome), int(aluno_id)
+    except Exception:
+        raise ValueError("Cursor inválido.")
+
+
+def _gerar_stream_json(consulta):
+    """Gera um array JSON linha a linha direto do cursor do banco."""
+    yield '['
+    primeiro = True
+    for aluno in ALUNO_JSON.iterar(consulta, TAMANHO_LOTE_STREAM):
+        yield ('' if primeiro else ',') + current_app.json.dumps(aluno)
+        primeiro = False
+    yield ']'
 
 
 # ==============================
@@ -42,32 +52,152 @@ def limpar_e_validar_telefone(telefone_str: str) -> str | None:
 # ==============================
 
 @aluno_bp.route('/', methods=['GET'])
-@jwt_required()
+@papel_requerido('admin', 'professor')
+@somente_leitura
+@cache.listagem('alunos')
 def list_alunos():
-    """Lista todos os alunos ativos, com opção de busca."""
+    """Lista os alunos ativos, com busca, paginação por cursor (keyset) e modo stream.
+
+    Sem ``limit``/``cursor`` devolve o array completo (compatível com o frontend).
+    Com ``limit`` devolve ``{"alunos": [...], "next_cursor": ...}``.
+    Com ``stream=1`` envia o array JSON à medida que as linhas saem do banco.
+    As linhas vêm de um SELECT só das colunas do JSON (sem objetos ORM).
+    """
     try:
         search_term = request.args.get('search', None, type=str)
-        query = AlunoModel.query.filter_by(ativo=True)
+        cursor = request.args.get('cursor', None, type=str)
+        limit = request.args.get('limit')
+        stream = pede_stream()
+
+        # Mesma validação para página e stream: inteiro positivo, até LIMITE_MAXIMO_PAGINA
+        if limit is not None:
+            try:
+                limit = int(limit)
+            except ValueError:
+                limit = 0
+            if limit < 1:
+                return jsonify({"message": "O parâmetro limit deve ser um número inteiro positivo."}), 400
+            limit = min(limit, LIMITE_MAXIMO_PAGINA)
+
+        query = ALUNO_JSON.select().where(AlunoModel.ativo.is_(True))
 
         if search_term:
             search_like = f"%{search_term}%"
-            query = query.filter(
+            query = query.where(
                 or_(
                     AlunoModel.nome.ilike(search_like),
                     AlunoModel.cpf.ilike(search_like)
                 )
             )
 
-        alunos = query.order_by(AlunoModel.nome).all()
-        return jsonify([aluno.to_json() for aluno in alunos]), 200
+        if cursor:
+            try:
+                ultimo_nome, ultimo_id = decodificar_cursor(cursor)
+            except ValueError as ve:
+                return jsonify({"message": str(ve)}), 400
+            query = query.where(
+                or_(
+                    AlunoModel.nome > ultimo_nome,
+                    and_(AlunoModel.nome == ultimo_nome, AlunoModel.id > ultimo_id)
+                )
+            )
+
+        query = query.order_by(AlunoModel.nome, AlunoModel.id)
+
+        if stream:
+            if limit:
+                query = query.limit(limit)
+            return Response(stream_with_context(_gerar_stream_json(query)), mimetype='application/json')
+
+        if limit is None and cursor is None:
+            return jsonify(ALUNO_JSON.linhas(query)), 200
+
+        if limit is None:
+            limit = LIMITE_MAXIMO_PAGINA
+
+        # Busca um a mais para saber se existe próxima página
+        alunos = ALUNO_JSON.linhas(query.limit(limit + 1))
+        next_cursor = None
+        if len(alunos) > limit:
+            alunos = alunos[:limit]
+            next_cursor = codificar_cursor(alunos[-1]['nome'], alunos[-1]['id'])
+
+        return jsonify({
+            "alunos": alunos,
+            "next_cursor": next_cursor
+        }), 200
 
     except Exception as e:
         print(f"❌ Erro ao listar alunos: {e}")
         return jsonify({"message": "Erro interno ao buscar alunos."}), 500
 
 
+@aluno_bp.route('/busca', methods=['GET'])
+@papel_requerido('admin', 'professor')
+@somente_leitura
+def busca_alunos():
+    """Busca aproximada por nome (sem acento/erros de digitação) ou prefixo de CPF,
+    ordenada por relevância."""
+    termo = request.args.get('q', '', type=str).strip()
+    limite = request.args.get('limit', LIMITE_BUSCA, type=int)
+    if not termo:
+        return jsonify({"message": "Informe o termo de busca (q)."}), 400
+
+    try:
+        resultado = []
+        for aluno, relevancia in buscar_alunos(termo, limite):
+            aluno_json = aluno.to_json()
+            aluno_json['relevancia'] = round(relevancia, 3)
+            resultado.append(aluno_json)
+        return jsonify(resultado), 200
+    except Exception as e:
+        print(f"❌ Erro na busca de alunos: {e}")
+        return jsonify({"message": "Erro interno na busca."}), 500
+
+
+@aluno_bp.route('/elegiveis', methods=['GET'])
+@papel_requerido('admin', 'professor')
+@somente_leitura
+@cache.listagem('alunos')
+def list_elegiveis():
+    """Alunos ativos aptos à próxima faixa até ``?data=`` (padrão hoje),
+    opcionalmente só da ``faixa`` atual informada. Usado na criação de exames."""
+    data_str = request.args.get('data', None, type=str)
+    faixa = request.args.get('faixa', None, type=str)
+    try:
+        ate = datetime.strptime(data_str, '%Y-%m-%d').date() if data_str else None
+    except ValueError:
+        return jsonify({"message": "Data inválida. Use AAAA-MM-DD."}), 400
+
+    try:
+        resultado = []
+        for aluno in consulta_elegiveis(ate, faixa):
+            aluno_json = aluno.to_json()
+            aluno_json['proxima_faixa'] = proxima_faixa(aluno.grau_atual)
+            resultado.append(aluno_json)
+        return jsonify(resultado), 200
+    except Exception as e:
+        print(f"❌ Erro ao listar alunos elegíveis: {e}")
+        return jsonify({"message": "Erro interno ao buscar alunos elegíveis."}), 500
+
+
+@aluno_bp.route('/graduacao/recalcular', methods=['POST'])
+@papel_requerido('admin')
+def recalcular_graduacao():
+    """Recalcula a data da próxima graduação de todos os alunos (ex.: após mudar as carências)."""
+    try:
+        atualizados = recalcular()
+        db.session.commit()
+        cache.invalidar('alunos')
+        return jsonify({"message": "Datas de graduação recalculadas.", "atualizados": atualizados}), 200
+    except Exception as e:
+        db.session.rollback()
+        print(f"❌ Erro ao recalcular graduações: {e}")
+        return jsonify({"message": "Erro interno ao recalcular graduações."}), 500
+
+
 @aluno_bp.route('/', methods=['POST'])
-@jwt_required()
+@papel_requerido('admin', 'professor')
 def create_aluno():
     """Cria um novo aluno."""
     data = request.get_json()
@@ -119,7 +249,10 @@ def create_aluno():
         )
 
         db.session.add(new_aluno)
+        db.session.flush()
+        recalcular_alunos([new_aluno.id])
         db.session.commit()
+        cache.invalidar('alunos')
 
         return jsonify({
             "message": "Aluno cadastrado com sucesso!",
@@ -136,7 +269,7 @@ def create_aluno():
 
 
 @aluno_bp.route('/<int:aluno_id>', methods=['GET'])
-@jwt_required()
+@papel_requerido('admin', 'professor')
 def get_aluno(aluno_id):
     """Obtém um aluno pelo ID."""
     try:
@@ -148,7 +281,7 @@ def get_aluno(aluno_id):
 
 
 @aluno_bp.route('/<int:aluno_id>', methods=['PUT'])
-@jwt_required()
+@papel_requerido('admin', 'professor')
 def update_aluno(aluno_id):
     """Atualiza os dados de um aluno."""
     data = request.get_json()
@@ -207,7 +340,10 @@ def update_aluno(aluno_id):
                 if ult_grad_str else None
             )
 
+        db.session.flush()
+        recalcular_alunos([aluno.id])
         db.session.commit()
+        cache.invalidar('alunos')
 
         return jsonify({
             "message": "Dados atualizados com sucesso!",
@@ -224,13 +360,14 @@ def update_aluno(aluno_id):
 
 
 @aluno_bp.route('/<int:aluno_id>', methods=['DELETE'])
-@jwt_required()
+@papel_requerido('admin', 'professor')
 def delete_aluno(aluno_id):
     """Marca o aluno como inativo (soft delete)."""
     aluno = AlunoModel.query.get_or_404(aluno_id)
     try:
         aluno.ativo = False
         db.session.commit()
+        cache.invalidar('alunos')
         return jsonify({"message": f"Aluno '{aluno.nome}' inativado."}), 200
     except Exception as e:
         db.session.rollback()
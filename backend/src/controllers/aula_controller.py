@@ -1,30 +1,112 @@
-from flask import Blueprint, request, jsonify
-from ..models.aula_model import AulaModel
+from flask import Blueprint, request, jsonify, Response
+from ..models.aula_model import AulaModel, bit_do_dia, dias_para_mascara
 from ..models.professor_model import ProfessorModel
-from ..database import db
-from datetime import datetime
-from flask_jwt_extended import jwt_required
+from ..models.frequencia_model import FrequenciaModel
+from ..database import db, somente_leitura
+from ..services.cache_service import cache
+from ..services.agenda_service import montar_grade, gerar_ical
+from datetime import date, datetime
+from ..services.auth_service import papel_requerido
+from functools import wraps
+import hmac
+import os
 
 aula_bp = Blueprint('aula_bp', __name__)
 
+MAX_AGE_ICAL = 3600  # segundos; apps de calendário consultam o feed periodicamente
+
+
+def _ler_horario(valor):
+    """'HH:MM' (ou 'HH:MM:SS', como o <input type="time"> às vezes envia) -> time."""
+    formato = '%H:%M:%S' if valor.count(':') == 2 else '%H:%M'
+    return datetime.strptime(valor, formato).time()
+
+
+def _ler_dias(dias):
+    """Lista de nomes de dias -> máscara de bits. Lança ValueError se vazia ou inválida."""
+    if not isinstance(dias, list) or not dias:
+        raise ValueError("dias_semana deve ser uma lista com pelo menos um dia.")
+    return dias_para_mascara(dias)
+
+
+def buscar_conflitos(fk_professor, dias_mask, inicio, fim, ignorar_id=None):
+    """Aulas do professor que se sobrepõem a [inicio, fim) em algum dos dias de ``dias_mask``.
+
+    Usa o índice (fk_professor, horario_inicio, horario_fim): só as aulas do
+    professor cujo intervalo cruza o novo são lidas, nunca a tabela inteira.
+    """
+    query = AulaModel.query.filter(
+        AulaModel.fk_professor == fk_professor,
+        AulaModel.horario_inicio < fim,
+        AulaModel.horario_fim > inicio,
+        AulaModel.filtro_dias(dias_mask)
+    )
+    if ignorar_id is not None:
+        query = query.filter(AulaModel.id != ignorar_id)
+    return query.order_by(AulaModel.horario_inicio).all()
+
+
+def _ler_professor_id(valor):
+    """fk_professor do corpo -> int. Lança ValueError se não for um id válido."""
+    try:
+        professor_id = int(valor)
+    except (TypeError, ValueError):
+        raise ValueError("fk_professor inválido.")
+    if isinstance(valor, (bool, float)) or professor_id < 1:
+        raise ValueError("fk_professor inválido.")
+    return professor_id
+
+
+def _resposta_conflito(conflitos):
+    return jsonify({
+        "message": "O professor já tem aula nesse horário.",
+        "conflitos": [aula.to_json() for aula in conflitos]
+    }), 409
+
+
+def _travar_professor(fk_professor):
+    """Busca o professor com SELECT ... FOR UPDATE: duas gravações simultâneas
+    para o mesmo professor esperam uma pela outra antes de checar conflitos."""
+    return ProfessorModel.query.filter_by(id=fk_professor).with_for_update().first()
+
+
 @aula_bp.route('/', methods=['POST'])
-@jwt_required()
+@papel_requerido('admin')
 def create_aula():
     data = request.get_json() or {}
     required = ['nome_turma', 'modalidade', 'horario_inicio', 'horario_fim', 'fk_professor', 'dias_semana']
     missing = [f for f in required if not data.get(f)]
     if missing:
         return jsonify({"message": f"Campos faltando: {', '.join(missing)}"}), 400
+    try:
+        dias_mask = _ler_dias(data['dias_semana'])
+    except ValueError as ve:
+        return jsonify({"message": str(ve)}), 400
 
     try:
-        inicio = datetime.strptime(data['horario_inicio'], '%H:%M').time()
-        fim = datetime.strptime(data['horario_fim'], '%H:%M').time()
-        if fim <= inicio:
-            return jsonify({"message": "Horário final deve ser após o inicial."}), 400
+        inicio = _ler_horario(data['horario_inicio'])
+        fim = _ler_horario(data['horario_fim'])
+    except (TypeError, ValueError):
+        return jsonify({"message": "Horário inválido. Use HH:MM."}), 400
+    if fim <= inicio:
+        return jsonify({"message": "Horário final deve ser após o inicial."}), 400
+    try:
+        professor_id = _ler_professor_id(data['fk_professor'])
+    except ValueError as ve:
+        return jsonify({"message": str(ve)}), 400
 
-        prof = ProfessorModel.query.get(int(data['fk_professor']))
+    try:
+        prof = _travar_professor(professor_id)
         if not prof:
             return jsonify({"message": "Professor não encontrado."}), 404
+        if not prof.ativo:
+            db.session.rollback()
+            return jsonify({"message": "Professor inativo não pode receber aulas."}), 400
+
+        conflitos = buscar_conflitos(prof.id, dias_mask, inicio, fim)
+        if conflitos:
+            db.session.rollback()
+            return _resposta_conflito(conflitos)
 
         nova_aula = AulaModel(
             nome_turma=data['nome_turma'],
@@ -32,11 +114,12 @@ def create_aula():
             horario_inicio=inicio,
             horario_fim=fim,
             fk_professor=prof.id,
-            dias_semana=data['dias_semana']
+            dias_mask=dias_mask
         )
 
         db.session.add(nova_aula)
         db.session.commit()
+        cache.invalidar('aulas')
 
         aula_json = nova_aula.to_json()
         aula_json['professor_nome'] = prof.nome
@@ -49,13 +132,96 @@ def create_aula():
         return jsonify({"message": "Erro interno ao criar aula."}), 500
 
 
+@aula_bp.route('/<int:id>', methods=['PUT', 'PATCH'])
+@papel_requerido('admin')
+def update_aula(id):
+    """Atualiza a aula (só os campos enviados), checando conflito de horário."""
+    data = request.get_json() or {}
+    aula = AulaModel.query.get(id)
+    if not aula:
+        return jsonify({"message": "Aula não encontrada."}), 404
+
+    vazios = [f for f in ('nome_turma', 'modalidade', 'horario_inicio', 'horario_fim', 'fk_professor', 'dias_semana')
+              if f in data and not data[f]]
+    if vazios:
+        return jsonify({"message": f"Campos vazios: {', '.join(vazios)}"}), 400
+    try:
+        dias_mask = _ler_dias(data['dias_semana']) if 'dias_semana' in data else aula.dias_mask
+    except ValueError as ve:
+        return jsonify({"message": str(ve)}), 400
+
+    try:
+        inicio = _ler_horario(data['horario_inicio']) if 'horario_inicio' in data else aula.horario_inicio
+        fim = _ler_horario(data['horario_fim']) if 'horario_fim' in data else aula.horario_fim
+    except (TypeError, ValueError):
+        return jsonify({"message": "Horário inválido. Use HH:MM."}), 400
+    if fim <= inicio:
+        return jsonify({"message": "Horário final deve ser após o inicial."}), 400
+    try:
+        professor_id = _ler_professor_id(data['fk_professor']) if 'fk_professor' in data else aula.fk_professor
+    except ValueError as ve:
+        return jsonify({"message": str(ve)}), 400
+
+    try:
+        prof = _travar_professor(professor_id)
+        if not prof:
+            return jsonify({"message": "Professor não encontrado."}), 404
+        # Aula que já era de um professor inativo ainda pode ser editada ou trocada de professor
+        if not prof.ativo and prof.id != aula.fk_professor:
+            db.session.rollback()
+            return jsonify({"message": "Professor inativo não pode receber aulas."}), 400
+        conflitos = buscar_conflitos(prof.id, dias_mask, inicio, fim, ignorar_id=aula.id)
+        if conflitos:
+            db.session.rollback()
+            return _resposta_conflito(conflitos)
+
+        aula.nome_turma = data.get('nome_turma', aula.nome_turma)
+        aula.modalidade = data.get('modalidade', aula.modalidade)
+        aula.horario_inicio = inicio
+        aula.horario_fim = fim
+        aula.fk_professor = prof.id
+        aula.dias_mask = dias_mask
+
+        db.session.commit()
+        cache.invalidar('aulas')
+
+        aula_json = aula.to_json()
+        aula_json['professor_nome'] = prof.nome
+        return jsonify({"message": "Aula atualizada com sucesso!", "aula": aula_json}), 200
+
+    except Exception as e:
+        db.session.rollback()
+        print(f"Erro ao atualizar aula: {e}")
+        return jsonify({"message": "Erro interno ao atualizar aula."}), 500
+
+
 @aula_bp.route('/', methods=['GET'])
-@jwt_required()
+@papel_requerido()
+@somente_leitura
+@cache.listagem('aulas')
 def list_aulas():
+    """Lista as aulas. ``?dia=seg`` (ou ``seg,qua``, ``Terça``, ``hoje``) filtra
+    pelos dias da semana, ordenando por horário."""
+    dia = request.args.get('dia', None, type=str)
     try:
-        aulas = db.session.query(AulaModel, ProfessorModel.nome).join(ProfessorModel).order_by(AulaModel.id).all()
+        query = db.session.query(AulaModel, ProfessorModel.nome).join(ProfessorModel)
+
+        if dia:
+            try:
+                mascara = 0
+                for nome in dia.split(','):
+                    if nome.strip().lower() == 'hoje':
+                        mascara |= 1 << date.today().weekday()
+                    else:
+                        mascara |= bit_do_dia(nome)
+            except ValueError as ve:
+                return jsonify({"message": str(ve)}), 400
+            query = query.filter(AulaModel.filtro_dias(mascara)).order_by(AulaModel.horario_inicio, AulaModel.id)
+        else:
+            query = query.order_by(AulaModel.id)
+
         result = []
-        for aula, prof_nome in aulas:
+        for aula, prof_nome in query.all():
             a = aula.to_json()
             a['professor_nome'] = prof_nome
             result.append(a)
@@ -65,15 +231,60 @@ def list_aulas():
         return jsonify({"message": "Erro interno ao listar aulas."}), 500
 
 
+# ==================== AGENDA ====================
+@aula_bp.route('/agenda', methods=['GET'])
+@papel_requerido()
+@somente_leitura
+@cache.listagem('aulas')
+def agenda_aulas():
+    """Grade semanal: aulas agrupadas por dia e faixa de horário, com o professor."""
+    try:
+        return jsonify(montar_grade()), 200
+    except Exception as e:
+        print(f"Erro ao montar agenda: {e}")
+        return jsonify({"message": "Erro interno ao montar agenda."}), 500
+
+
+def _exigir_token_agenda(view):
+    """O feed exige ``?token=<AGENDA_ICS_TOKEN>`` (apps de calendário não enviam
+    cabeçalho Authorization). Sem AGENDA_ICS_TOKEN definido o feed fica desligado."""
+    @wraps(view)
+    def wrapper(*args, **kwargs):
+        token = os.getenv('AGENDA_ICS_TOKEN')
+        if not token:
+            return Response('Agenda não disponível\n', status=404, mimetype='text/plain')
+        if not hmac.compare_digest(request.args.get('token', ''), token):
+            return Response('Não autorizado\n', status=401, mimetype='text/plain')
+        return view(*args, **kwargs)
+    return wrapper
+
+
+@aula_bp.route('/agenda.ics', methods=['GET'])
+@_exigir_token_agenda
+@somente_leitura
+@cache.listagem('aulas', max_age=MAX_AGE_ICAL)
+def agenda_ical():
+    """Feed iCalendar para assinar a agenda no celular (sem login, com o token na URL)."""
+    try:
+        return Response(gerar_ical(), mimetype='text/calendar')
+    except Exception as e:
+        print(f"Erro ao gerar feed iCalendar: {e}")
+        return Response('Erro ao gerar agenda\n', status=500, mimetype='text/plain')
+
+
 @aula_bp.route('/<int:id>', methods=['DELETE'])
-@jwt_required()
+@papel_requerido('admin')
 def delete_aula(id):
     aula = AulaModel.query.get(id)
     if not aula:
         return jsonify({"success": False, "message": "Aula não encontrada."}), 404
+    # A frequência é histórica (só INSERT): aula com chamada não é apagada
+    if db.session.query(FrequenciaModel.id).filter_by(fk_aula=id).first():
+        return jsonify({"success": False, "message": "Aula possui frequência registrada e não pode ser excluída."}), 409
     try:
         db.session.delete(aula)
         db.session.commit()
+        cache.invalidar('aulas')
         return jsonify({"success": True, "message": "Aula excluída com sucesso."}), 200
     except Exception as e:
         db.session.rollback()
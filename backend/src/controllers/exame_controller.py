@@ -1,14 +1,100 @@
 from flask import Blueprint, request, jsonify
-from ..database import db
+from ..database import db, somente_leitura
+from ..services.cache_service import cache
 from ..models.exame_model import ExameModel
 from ..models.inscricao_model import InscricaoModel
-from flask_jwt_extended import jwt_required
+from ..models.aluno_model import AlunoModel, FAIXAS
+from ..services.estatisticas_exame_service import estatisticas_exame, HISTORICO_PADRAO
+from ..services.graduacao_service import recalcular_alunos
+from ..services.auth_service import papel_requerido
+from sqlalchemy import case, func, insert, select, update
+from datetime import datetime
 
 exame_bp = Blueprint('exame_bp', __name__)
 
-# ==================== CRIAR EXAME (VERSÃO DEBUG) ====================
+# ==================== INSCRIÇÃO EM LOTE ====================
+def _inscrever_alunos(exame_id, alunos_ids):
+    """Inscreve vários alunos no exame com uma validação e um INSERT em lote.
+
+    Retorna ``(qtd_inscritos, relatorio)``, com um item do relatório por id
+    recebido e o status: inscrito, duplicado, ja_inscrito, inativo,
+    inexistente ou invalido. Não faz commit.
+    """
+    relatorio = []
+    candidatos = []
+    vistos = set()
+    for bruto in alunos_ids:
+        try:
+            aluno_id = int(bruto)
+        except (TypeError, ValueError):
+            relatorio.append({'aluno_id': bruto, 'status': 'invalido'})
+            continue
+        if aluno_id in vistos:
+            relatorio.append({'aluno_id': aluno_id, 'status': 'duplicado'})
+            continue
+        vistos.add(aluno_id)
+        candidatos.append(aluno_id)
+        relatorio.append({'aluno_id': aluno_id, 'status': None})
+
+    # Uma consulta para existência/atividade e outra para inscrições já feitas
+    ativos = dict(
+        db.session.query(AlunoModel.id, AlunoModel.ativo)
+        .filter(AlunoModel.id.in_(candidatos))
+        .all()
+    ) if candidatos else {}
+    ja_inscritos = {
+        fk_aluno for (fk_aluno,) in
+        db.session.query(InscricaoModel.fk_aluno)
+        .filter(InscricaoModel.fk_exame == exame_id, InscricaoModel.fk_aluno.in_(candidatos))
+        .all()
+    } if candidatos else set()
+
+    novas = []
+    for item in relatorio:
+        if item['status'] is not None:
+            continue
+        aluno_id = item['aluno_id']
+        if aluno_id not in ativos:
+            item['status'] = 'inexistente'
+        elif not ativos[aluno_id]:
+            item['status'] = 'inativo'
+        elif aluno_id in ja_inscritos:
+            item['status'] = 'ja_inscrito'
+        else:
+            item['status'] = 'inscrito'
+            novas.append({
+                'fk_exame': exame_id, 'fk_aluno': aluno_id,
+                'nota_kihon': 0.0, 'nota_kata': 0.0, 'nota_kumite': 0.0, 'nota_gerais': 0.0,
+                'media_final': 0.0, 'aprovado': False
+            })
+
+    if novas:
+        # executemany: um único INSERT preparado para todas as linhas
+        db.session.execute(insert(InscricaoModel), novas)
+
+    return len(novas), relatorio
+
+
+def _exame_encerrado(exame_id):
+    """Lê ``encerrado`` travando a linha do exame (FOR SHARE) até o commit.
+
+    O encerramento pega FOR UPDATE na mesma linha: uma gravação de notas ou
+    inscrições que já passou daqui termina antes dele, e as seguintes veem o
+    exame encerrado.
+    """
+    return bool(
+        db.session.query(ExameModel.encerrado).filter(ExameModel.id == exame_id)
+        .with_for_update(read=True).scalar()
+    )
+
+
+def _resposta_encerrado():
+    return jsonify({'message': 'Exame encerrado: notas e inscrições não podem mais ser alteradas.'}), 409
+
+
+# ==================== CRIAR EXAME ====================
 @exame_bp.route('/', methods=['POST'])
-@jwt_required()
+@papel_requerido('admin', 'professor')
 def create_exame():
     data = request.get_json() or {}
 
@@ -17,116 +103,503 @@ def create_exame():
     if not all(k in data for k in required):
         return jsonify({'message': 'Faltam dados obrigatórios.'}), 400
 
-    if not data['alunos_ids']:
+    if not data['alunos_ids'] or not isinstance(data['alunos_ids'], list):
         return jsonify({'message': 'A lista de alunos está vazia.'}), 400
 
     try:
         # 2. Cria o Exame
-        print("Tentando criar exame...") # Log no terminal
         novo_exame = ExameModel(
             nome_evento=data['nome_evento'],
             data=data['data'],
             hora=data['hora'],
             local=data['local']
         )
-        
         db.session.add(novo_exame)
-        db.session.flush() # Força a criação do ID do exame
-        print(f"Exame criado com ID: {novo_exame.id}")
-
-        # 3. Cria as Inscrições
-        count = 0
-        for aluno_id in data['alunos_ids']:
-            print(f"Inscrevendo aluno ID: {aluno_id}")
-            nova_inscricao = InscricaoModel(
-                fk_exame=novo_exame.id,
-                fk_aluno=int(aluno_id), # Garante que é número
-                # Valores padrão
-                nota_kihon=0, nota_kata=0, nota_kumite=0, nota_gerais=0, 
-                media_final=0, aprovado=False
-            )
-            db.session.add(nova_inscricao)
-            count += 1
+        db.session.flush()  # Gera o ID do exame
+
+        # 3. Inscrições em lote, na mesma transação
+        count, relatorio = _inscrever_alunos(novo_exame.id, data['alunos_ids'])
+        if count == 0:
+            db.session.rollback()
+            return jsonify({'message': 'Nenhum aluno válido para inscrever.', 'relatorio': relatorio}), 400
 
         db.session.commit()
-        return jsonify({'message': f'Sucesso! Exame criado com {count} alunos.'}), 201
+        cache.invalidar('exames')
+        return jsonify({
+            'message': f'Sucesso! Exame criado com {count} alunos.',
+            'exame_id': novo_exame.id,
+            'inscritos': count,
+            'relatorio': relatorio
+        }), 201
 
     except Exception as e:
         db.session.rollback()
-        # AQUI ESTÁ O SEGREDO: Mandamos o erro real para o Frontend
-        error_msg = str(e)
-        print(f"ERRO FATAL: {error_msg}")
-        return jsonify({'message': f'ERRO TÉCNICO: {error_msg}'}), 500
+        print(f"Erro ao criar exame: {e}")
+        return jsonify({'message': f'Erro ao criar exame: {e}'}), 500
+
+
+@exame_bp.route('/<int:exame_id>/inscricoes', methods=['POST'])
+@papel_requerido('admin', 'professor')
+def add_inscricoes(exame_id):
+    """Inscreve mais alunos em um exame existente."""
+    data = request.get_json() or {}
+    alunos_ids = data.get('alunos_ids')
+    if not alunos_ids or not isinstance(alunos_ids, list):
+        return jsonify({'message': 'A lista de alunos está vazia.'}), 400
+
+    exame = db.session.query(ExameModel).filter(ExameModel.id == exame_id).with_for_update(read=True).first()
+    if not exame:
+        return jsonify({'message': 'Exame não encontrado'}), 404
+    if exame.encerrado:
+        db.session.rollback()
+        return _resposta_encerrado()
+
+    try:
+        count, relatorio = _inscrever_alunos(exame_id, alunos_ids)
+        db.session.commit()
+        cache.invalidar('exames', f'exames:{exame_id}')
+        return jsonify({
+            'message': f'{count} alunos inscritos.',
+            'inscritos': count,
+            'relatorio': relatorio
+        }), 200
+    except Exception as e:
+        db.session.rollback()
+        print(f"Erro ao inscrever alunos: {e}")
+        return jsonify({'message': f'Erro ao inscrever: {e}'}), 500
 
 # ==================== LISTAR EXAMES ====================
 @exame_bp.route('/', methods=['GET'])
-@jwt_required()
+@papel_requerido('admin', 'professor')
+@somente_leitura
+@cache.listagem('exames')
 def list_exames():
+    """Lista os exames com as contagens de inscritos em uma única consulta.
+
+    Filtros opcionais: ``data_inicio`` e ``data_fim`` (YYYY-MM-DD, inclusivos).
+    """
+    data_inicio = request.args.get('data_inicio', None, type=str)
+    data_fim = request.args.get('data_fim', None, type=str)
+    try:
+        for valor in (data_inicio, data_fim):
+            if valor:
+                datetime.strptime(valor, '%Y-%m-%d')
+    except ValueError:
+        return jsonify({'message': 'Datas devem estar no formato AAAA-MM-DD.'}), 400
+
     try:
-        exames = ExameModel.query.order_by(ExameModel.data.desc()).all()
+        # Contagens agregadas por exame (um GROUP BY em vez de um COUNT por exame)
+        contagens = (
+            db.session.query(
+                InscricaoModel.fk_exame.label('fk_exame'),
+                func.count(InscricaoModel.id).label('qtd_alunos'),
+                func.sum(case((InscricaoModel.aprovado.is_(True), 1), else_=0)).label('qtd_aprovados')
+            )
+            .group_by(InscricaoModel.fk_exame)
+            .subquery()
+        )
+
+        query = (
+            db.session.query(
+                ExameModel,
+                func.coalesce(contagens.c.qtd_alunos, 0),
+                func.coalesce(contagens.c.qtd_aprovados, 0)
+            )
+            .outerjoin(contagens, contagens.c.fk_exame == ExameModel.id)
+        )
+        # A data é gravada como texto ISO, então a comparação léxica é cronológica
+        if data_inicio:
+            query = query.filter(ExameModel.data >= data_inicio)
+        if data_fim:
+            query = query.filter(ExameModel.data <= data_fim)
+
         result = []
-        for ex in exames:
-            # Conta quantos alunos tem nesse exame
-            qtd = InscricaoModel.query.filter_by(fk_exame=ex.id).count()
+        for ex, qtd, aprovados in query.order_by(ExameModel.data.desc()).all():
             ex_json = ex.to_json()
-            ex_json['qtd_alunos'] = qtd
+            ex_json['qtd_alunos'] = int(qtd)
+            ex_json['qtd_aprovados'] = int(aprovados)
+            ex_json['qtd_pendentes'] = int(qtd) - int(aprovados)
             result.append(ex_json)
         return jsonify(result), 200
     except Exception as e:
+        print(f"Erro ao listar exames: {e}")
         return jsonify({'message': 'Erro ao listar'}), 500
 
 # ==================== LISTAR BANCA ====================
+ORDENS_BANCA = {'media_desc', 'media_asc', 'nome', 'faixa'}
+
+
+def _consulta_banca(exame_id):
+    """SELECT único com só as colunas da banca (inscrição + nome/faixa do aluno)."""
+    return (
+        db.session.query(
+            InscricaoModel.id,
+            InscricaoModel.nota_kihon,
+            InscricaoModel.nota_kata,
+            InscricaoModel.nota_kumite,
+            InscricaoModel.nota_gerais,
+            InscricaoModel.media_final,
+            InscricaoModel.aprovado,
+            InscricaoModel.observacao,
+            AlunoModel.nome.label('aluno_nome'),
+            AlunoModel.grau_atual.label('aluno_faixa')
+        )
+        .join(AlunoModel, AlunoModel.id == InscricaoModel.fk_aluno)
+        .filter(InscricaoModel.fk_exame == exame_id)
+    )
+
+
+def _linha_banca_json(linha):
+    """Mesmo formato de InscricaoModel.to_json, a partir da linha projetada."""
+    return {
+        "id": linha.id,
+        "aluno_nome": linha.aluno_nome,
+        "aluno_faixa": linha.aluno_faixa,
+        "notas": {
+            "kihon": linha.nota_kihon,
+            "kata": linha.nota_kata,
+            "kumite": linha.nota_kumite,
+            "gerais": linha.nota_gerais
+        },
+        "media": linha.media_final,
+        "aprovado": linha.aprovado,
+        "observacao": linha.observacao
+    }
+
+
 @exame_bp.route('/<int:exame_id>/banca', methods=['GET'])
-@jwt_required()
+@papel_requerido('admin', 'professor')
+@somente_leitura
 def get_banca_exame(exame_id):
+    """Banca do exame. Filtros: ``status`` (aprovado|pendente), ``faixa``;
+    ``ordem``: media_desc (padrão), media_asc, nome ou faixa."""
+    status = request.args.get('status', None, type=str)
+    faixa = request.args.get('faixa', None, type=str)
+    ordem = request.args.get('ordem', 'media_desc', type=str)
+
+    if status not in (None, 'aprovado', 'pendente'):
+        return jsonify({'message': "Status deve ser 'aprovado' ou 'pendente'."}), 400
+    if ordem not in ORDENS_BANCA:
+        return jsonify({'message': f"Ordem inválida. Use: {', '.join(sorted(ORDENS_BANCA))}."}), 400
+
     try:
-        inscricoes = InscricaoModel.query.filter_by(fk_exame=exame_id).order_by(InscricaoModel.media_final.desc()).all()
-        return jsonify([i.to_json() for i in inscricoes]), 200
+        query = _consulta_banca(exame_id)
+
+        if status == 'aprovado':
+            query = query.filter(InscricaoModel.aprovado.is_(True))
+        elif status == 'pendente':
+            query = query.filter(InscricaoModel.aprovado.isnot(True))
+        if faixa:
+            query = query.filter(func.lower(AlunoModel.grau_atual) == faixa.strip().lower())
+
+        if ordem == 'media_asc':
+            query = query.order_by(InscricaoModel.media_final.asc(), AlunoModel.nome)
+        elif ordem == 'nome':
+            query = query.order_by(AlunoModel.nome, InscricaoModel.id)
+        elif ordem == 'faixa':
+            peso_faixa = case(
+                {f.lower(): i for i, f in enumerate(FAIXAS)},
+                value=func.lower(AlunoModel.grau_atual),
+                else_=len(FAIXAS)
+            )
+            query = query.order_by(peso_faixa, AlunoModel.nome)
+        else:
+            query = query.order_by(InscricaoModel.media_final.desc(), AlunoModel.nome)
+
+        return jsonify([_linha_banca_json(linha) for linha in query.all()]), 200
     except Exception as e:
+        print(f"Erro ao carregar banca: {e}")
         return jsonify({'message': 'Erro ao carregar banca'}), 500
 
+# ==================== ESTATÍSTICAS ====================
+# Cache por exame: salvar notas de um exame não descarta as estatísticas dos
+# outros. 'exames_historico' muda quando um exame encerrado entra/sai do
+# histórico e 'alunos' cobre nome e faixa exibidos no ranking.
+@exame_bp.route('/<int:exame_id>/estatisticas', methods=['GET'])
+@papel_requerido('admin', 'professor')
+@somente_leitura
+@cache.listagem(('exames:{exame_id}', 'exames_historico', 'alunos'))
+def get_estatisticas_exame(exame_id):
+    """Ranking (posição, posição na faixa, percentil), médias por critério,
+    aprovação por faixa e comparação com exames anteriores.
+
+    ``historico`` (padrão 5) limita quantos exames anteriores são listados.
+    """
+    historico = request.args.get('historico', HISTORICO_PADRAO, type=int)
+
+    exame = db.session.get(ExameModel, exame_id)
+    if not exame:
+        return jsonify({'message': 'Exame não encontrado'}), 404
+
+    try:
+        return jsonify(estatisticas_exame(exame, historico)), 200
+    except Exception as e:
+        print(f"❌ Erro ao calcular estatísticas do exame: {e}")
+        return jsonify({'message': 'Erro ao calcular estatísticas'}), 500
+
 # ==================== SALVAR NOTAS (IMPORTANTE: POST) ====================
+NOTA_MINIMA = 0.0
+NOTA_MAXIMA = 10.0
+MEDIA_APROVACAO = 6.0
+# Chave no JSON -> coluna de InscricaoModel
+CAMPOS_NOTAS = {
+    'kihon': 'nota_kihon',
+    'kata': 'nota_kata',
+    'kumite': 'nota_kumite',
+    'gerais': 'nota_gerais'
+}
+
+
+def _converter_nota(val):
+    """Converte a nota recebida (vazio conta como 0). Lança ValueError fora de 0–10."""
+    if val is None or val == "":
+        return 0.0
+    try:
+        nota = float(val)
+    except TypeError:
+        # Lista, objeto etc. no JSON: erro da linha, não do lote inteiro
+        raise ValueError("Nota inválida")
+    if not NOTA_MINIMA <= nota <= NOTA_MAXIMA:
+        raise ValueError(f"Nota {nota} fora do intervalo {NOTA_MINIMA:g}–{NOTA_MAXIMA:g}.")
+    return nota
+
+
+def _calcular_notas(atuais, data):
+    """Aplica as notas de ``data`` sobre ``atuais`` ({coluna: valor}) e
+    recalcula media_final/aprovado. Retorna os novos valores das colunas."""
+    novos = {coluna: atuais.get(coluna) or 0.0 for coluna in CAMPOS_NOTAS.values()}
+    for chave, coluna in CAMPOS_NOTAS.items():
+        if chave in data:
+            novos[coluna] = _converter_nota(data[chave])
+
+    soma = sum(novos.values())
+    novos['media_final'] = round(soma / len(CAMPOS_NOTAS), 1)
+    novos['aprovado'] = novos['media_final'] >= MEDIA_APROVACAO
+    return novos
+
+
 @exame_bp.route('/notas/<int:inscricao_id>', methods=['POST'])
-@jwt_required()
+@papel_requerido('admin', 'professor')
 def update_notas(inscricao_id):
-    data = request.get_json()
+    data = request.get_json() or {}
     inscricao = InscricaoModel.query.get(inscricao_id)
 
     if not inscricao:
         return jsonify({'message': 'Inscrição não encontrada'}), 404
+    if _exame_encerrado(inscricao.fk_exame):
+        db.session.rollback()
+        return _resposta_encerrado()
 
     try:
-        # Função auxiliar para não quebrar se vier vazio
-        def safe_float(val):
-            if val is None or val == "": return 0.0
-            return float(val)
-
-        # Atualiza notas
-        if 'kihon' in data: inscricao.nota_kihon = safe_float(data['kihon'])
-        if 'kata' in data: inscricao.nota_kata = safe_float(data['kata'])
-        if 'kumite' in data: inscricao.nota_kumite = safe_float(data['kumite'])
-        if 'gerais' in data: inscricao.nota_gerais = safe_float(data['gerais'])
-        
-        # Recalcula Média (Lógica no Python)
-        soma = inscricao.nota_kihon + inscricao.nota_kata + inscricao.nota_kumite + inscricao.nota_gerais
-        inscricao.media_final = round(soma / 4, 1)
-        inscricao.aprovado = inscricao.media_final >= 6.0
-        
+        atuais = {coluna: getattr(inscricao, coluna) for coluna in CAMPOS_NOTAS.values()}
+        for coluna, valor in _calcular_notas(atuais, data).items():
+            setattr(inscricao, coluna, valor)
+
         db.session.commit()
-        
+        cache.invalidar('exames', f'exames:{inscricao.fk_exame}')
+
         return jsonify({
             'message': 'Notas salvas', 
             'media': inscricao.media_final, 
             'aprovado': inscricao.aprovado
         }), 200
 
+    except ValueError as ve:
+        db.session.rollback()
+        return jsonify({'message': f'Nota inválida: {ve}'}), 400
     except Exception as e:
         db.session.rollback()
         print(f"Erro notas: {e}")
         return jsonify({'message': f'Erro ao salvar: {e}'}), 500
+
+
+@exame_bp.route('/<int:exame_id>/notas', methods=['POST'])
+@papel_requerido('admin', 'professor')
+def update_notas_lote(exame_id):
+    """Salva as notas de várias inscrições do exame em uma transação.
+
+    Corpo: ``{"notas": [{"inscricao_id": 1, "kihon": 7, ...}, ...]}``.
+    Linhas inválidas são reportadas e as demais são gravadas.
+    """
+    data = request.get_json() or {}
+    itens = data.get('notas')
+    if not itens or not isinstance(itens, list):
+        return jsonify({'message': 'A lista de notas está vazia.'}), 400
+    if _exame_encerrado(exame_id):
+        db.session.rollback()
+        return _resposta_encerrado()
+
+    try:
+        ids = []
+        for item in itens:
+            try:
+                ids.append(int(item.get('inscricao_id')))
+            except (AttributeError, TypeError, ValueError):
+                continue
+
+        # Notas atuais de todas as inscrições pedidas, em uma consulta
+        colunas = [getattr(InscricaoModel, c) for c in CAMPOS_NOTAS.values()]
+        atuais = {
+            linha.id: dict(linha._mapping)
+            for linha in db.session.query(InscricaoModel.id, *colunas)
+            .filter(InscricaoModel.fk_exame == exame_id, InscricaoModel.id.in_(ids))
+            .all()
+        } if ids else {}
+
+        resultados = []
+        alteracoes = {}
+        for item in itens:
+            try:
+                inscricao_id = int(item.get('inscricao_id'))
+            except (AttributeError, TypeError, ValueError):
+                resultados.append({'inscricao_id': None, 'status': 'erro', 'message': 'inscricao_id inválido.'})
+                continue
+            if inscricao_id not in atuais:
+                resultados.append({'inscricao_id': inscricao_id, 'status': 'nao_encontrada'})
+                continue
+            try:
+                novos = _calcular_notas(atuais[inscricao_id], item)
+            except ValueError as ve:
+                resultados.append({'inscricao_id': inscricao_id, 'status': 'erro', 'message': str(ve)})
+                continue
+            # Repetições do mesmo id: vale a última, acumulando sobre a anterior
+            atuais[inscricao_id] = novos
+            alteracoes[inscricao_id] = {'id': inscricao_id, **novos}
+            resultados.append({
+                'inscricao_id': inscricao_id, 'status': 'salvo',
+                'media': novos['media_final'], 'aprovado': novos['aprovado']
+            })
+
+        if alteracoes:
+            # UPDATE em lote pela chave primária (executemany)
+            db.session.execute(update(InscricaoModel), list(alteracoes.values()))
+        db.session.commit()
+        cache.invalidar('exames', f'exames:{exame_id}')
+
+        return jsonify({
+            'message': f'{len(alteracoes)} inscrições atualizadas.',
+            'salvos': len(alteracoes),
+            'resultados': resultados
+        }), 200
+
+    except Exception as e:
+        db.session.rollback()
+        print(f"Erro notas em lote: {e}")
+        return jsonify({'message': f'Erro ao salvar: {e}'}), 500
+
+
+# ==================== ENCERRAR EXAME ====================
+def _expressao_proxima_faixa(coluna):
+    """CASE que leva cada faixa à seguinte (NULL na última ou em faixa desconhecida)."""
+    return case(
+        {faixa.lower(): seguinte for faixa, seguinte in zip(FAIXAS, FAIXAS[1:])},
+        value=func.lower(coluna),
+        else_=None
+    )
+
+
+def _relatorio_encerramento(exame_id):
+    linhas = (
+        db.session.query(
+            InscricaoModel.fk_aluno, AlunoModel.nome, InscricaoModel.aprovado,
+            InscricaoModel.faixa_anterior, InscricaoModel.faixa_nova
+        )
+        .join(AlunoModel, AlunoModel.id == InscricaoModel.fk_aluno)
+        .filter(InscricaoModel.fk_exame == exame_id)
+        .order_by(AlunoModel.nome)
+        .all()
+    )
+    promovidos = [{
+        'aluno_id': linha.fk_aluno, 'aluno_nome': linha.nome,
+        'faixa_anterior': linha.faixa_anterior, 'faixa_nova': linha.faixa_nova
+    } for linha in linhas if linha.faixa_nova]
+    return {
+        'promovidos': promovidos,
+        'qtd_promovidos': len(promovidos),
+        'qtd_reprovados': sum(1 for linha in linhas if not linha.aprovado),
+        # Aprovados sem faixa seguinte (faixa preta ou faixa fora da lista)
+        'sem_proxima_faixa': [linha.fk_aluno for linha in linhas if linha.aprovado and not linha.faixa_nova],
+    }
+
+
+@exame_bp.route('/<int:exame_id>/encerrar', methods=['POST'])
+@papel_requerido('admin', 'professor')
+def encerrar_exame(exame_id):
+    """Encerra o exame: promove todos os aprovados à faixa seguinte, grava a
+    data da graduação e trava as notas, tudo em uma transação.
+
+    ``data_graduacao`` (opcional, AAAA-MM-DD) padrão é a data do exame.
+    Encerrar de novo não altera nada e devolve o mesmo relatório.
+    """
+    data = request.get_json(silent=True) or {}
+
+    # FOR UPDATE: dois encerramentos simultâneos não promovem duas vezes
+    exame = db.session.query(ExameModel).filter(ExameModel.id == exame_id).with_for_update().first()
+    if not exame:
+        return jsonify({'message': 'Exame não encontrado'}), 404
+
+    if exame.encerrado:
+        db.session.rollback()
+        return jsonify({
+            'message': 'Exame já estava encerrado.',
+            'encerrado_em': exame.encerrado_em.isoformat() if exame.encerrado_em else None,
+            **_relatorio_encerramento(exame_id)
+        }), 200
+
+    origem = 'data_graduacao' if data.get('data_graduacao') else 'data do exame'
+    try:
+        data_graduacao = datetime.strptime(data.get('data_graduacao') or exame.data, '%Y-%m-%d').date()
+    except (TypeError, ValueError):
+        # Sem data válida não promove: ela iria para todos os aprovados
+        db.session.rollback()
+        return jsonify({'message': f'Data de graduação inválida ({origem}). Use AAAA-MM-DD.'}), 400
+
+    try:
+        aprovados = select(InscricaoModel.fk_aluno).where(
+            InscricaoModel.fk_exame == exame_id, InscricaoModel.aprovado.is_(True)
+        )
+
+        # 1) Histórico na inscrição: faixa atual e a seguinte, lidas do aluno
+        faixa_do_aluno = select(AlunoModel.grau_atual).where(AlunoModel.id == InscricaoModel.fk_aluno).scalar_subquery()
+        db.session.execute(
+            update(InscricaoModel)
+            .where(InscricaoModel.fk_exame == exame_id, InscricaoModel.aprovado.is_(True))
+            .values(faixa_anterior=faixa_do_aluno, faixa_nova=_expressao_proxima_faixa(faixa_do_aluno))
+            .execution_options(synchronize_session=False)
+        )
+
+        # 2) Promoção de todos os aprovados em um único UPDATE
+        db.session.execute(
+            update(AlunoModel)
+            .where(
+                AlunoModel.id.in_(aprovados),
+                func.lower(AlunoModel.grau_atual).in_([f.lower() for f in FAIXAS[:-1]])
+            )
+            .values(grau_atual=_expressao_proxima_faixa(AlunoModel.grau_atual), data_ultima_graduacao=data_graduacao)
+            .execution_options(synchronize_session=False)
+        )
+
+        exame.encerrado = True
+        exame.encerrado_em = datetime.utcnow()
+
+        relatorio = _relatorio_encerramento(exame_id)
+        recalcular_alunos([p['aluno_id'] for p in relatorio['promovidos']])
+        db.session.commit()
+        cache.invalidar('exames', 'alunos', f'exames:{exame_id}', 'exames_historico')
+
+        return jsonify({
+            'message': f"Exame encerrado: {relatorio['qtd_promovidos']} alunos promovidos.",
+            'data_graduacao': data_graduacao.isoformat(),
+            **relatorio
+        }), 200
+    except Exception as e:
+        db.session.rollback()
+        print(f"❌ Erro ao encerrar exame: {e}")
+        return jsonify({'message': 'Erro interno ao encerrar exame.'}), 500
+
 # ==================== ATUALIZAR EXAME (PUT) ====================
 @exame_bp.route('/<int:id>', methods=['PUT'])
-@jwt_required()
+@papel_requerido('admin', 'professor')
 def update_exame(id):
     exame = ExameModel.query.get(id)
     if not exame:
@@ -141,6 +614,7 @@ def update_exame(id):
         if 'local' in data: exame.local = data['local']
         
         db.session.commit()
+        cache.invalidar('exames', f'exames:{id}', 'exames_historico')
         return jsonify({'message': 'Exame atualizado com sucesso!'}), 200
     except Exception as e:
         db.session.rollback()
@@ -148,13 +622,14 @@ def update_exame(id):
     
 # ==================== DELETAR EXAME ====================
 @exame_bp.route('/<int:id>', methods=['DELETE'])
-@jwt_required()
+@papel_requerido('admin')
 def delete_exame(id):
     try:
         exame = ExameModel.query.get(id)
         if exame:
             db.session.delete(exame)
             db.session.commit()
+            cache.invalidar('exames', f'exames:{id}', 'exames_historico')
             return jsonify({'message': 'Exame excluído'}), 200
         return jsonify({'message': 'Não encontrado'}), 404
     except Exception:
@@ -0,0 +1,79 @@
+from flask import Blueprint, request, jsonify, Response, stream_with_context, send_file
+from datetime import datetime
+
+from ..database import db, somente_leitura
+from ..models.exame_model import ExameModel
+from ..services.auth_service import papel_requerido
+from ..services.exportacao_service import (
+    COLUNAS_ALUNOS, COLUNAS_RESULTADOS, consulta_alunos, consulta_resultados, gerar_csv, gerar_xlsx
+)
+
+exportacao_bp = Blueprint('exportacao_bp', __name__)
+
+FORMATOS = {'csv', 'xlsx'}
+MIMETYPE_XLSX = 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
+
+
+def _ler_booleano(nome):
+    """``?nome=1/0`` -> True/False; ausente -> None. Lança ValueError se inválido."""
+    valor = request.args.get(nome, None, type=str)
+    if valor is None or valor == '':
+        return None
+    valor = valor.strip().lower()
+    if valor in ('1', 'true', 'sim'):
+        return True
+    if valor in ('0', 'false', 'nao', 'não'):
+        return False
+    raise ValueError(f"Valor inválido para {nome}: use 1 ou 0.")
+
+
+def _responder(colunas, consulta, nome_arquivo, titulo_planilha):
+    formato = request.args.get('formato', 'csv', type=str).lower()
+    if formato not in FORMATOS:
+        return jsonify({"message": "Formato deve ser 'csv' ou 'xlsx'."}), 400
+
+    if formato == 'xlsx':
+        try:
+            arquivo = gerar_xlsx(colunas, consulta, titulo_planilha)
+        except ImportError:
+            return jsonify({"message": "Exportação XLSX indisponível (instale o openpyxl)."}), 501
+        return send_file(arquivo, mimetype=MIMETYPE_XLSX, as_attachment=True,
+                         download_name=f'{nome_arquivo}.xlsx')
+
+    resposta = Response(stream_with_context(gerar_csv(colunas, consulta)), mimetype='text/csv; charset=utf-8')
+    resposta.headers['Content-Disposition'] = f'attachment; filename="{nome_arquivo}.csv"'
+    return resposta
+
+
+# ==================== ALUNOS ====================
+@exportacao_bp.route('/alunos', methods=['GET'])
+@papel_requerido('admin', 'professor')
+@somente_leitura
+def exportar_alunos():
+    """Lista de alunos em CSV (padrão) ou XLSX. Filtros: ``ativo`` (1/0) e ``faixa``."""
+    try:
+        ativo = _ler_booleano('ativo')
+    except ValueError as ve:
+        return jsonify({"message": str(ve)}), 400
+
+    consulta = consulta_alunos(ativo=ativo, faixa=request.args.get('faixa', None, type=str))
+    nome_arquivo = f"alunos_{datetime.utcnow():%Y%m%d}"
+    return _responder(COLUNAS_ALUNOS, consulta, nome_arquivo, 'Alunos')
+
+
+# ==================== RESULTADOS DE EXAME ====================
+@exportacao_bp.route('/exames/<int:exame_id>/resultados', methods=['GET'])
+@papel_requerido('admin', 'professor')
+@somente_leitura
+def exportar_resultados(exame_id):
+    """Notas, média e aprovação de cada inscrito. Filtros: ``aprovado`` (1/0) e ``faixa``."""
+    try:
+        aprovado = _ler_booleano('aprovado')
+    except ValueError as ve:
+        return jsonify({"message": str(ve)}), 400
+
+    if not db.session.get(ExameModel, exame_id):
+        return jsonify({"message": "Exame não encontrado."}), 404
+
+    consulta = consulta_resultados(exame_id, aprovado=aprovado, faixa=request.args.get('faixa', None, type=str))
+    return _responder(COLUNAS_RESULTADOS, consulta, f"exame_{exame_id}_resultados", f'Exame {exame_id}')
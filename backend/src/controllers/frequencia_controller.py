@@ -0,0 +1,178 @@
+from flask import Blueprint, request, jsonify
+from ..models.aula_model import AulaModel
+from ..models.aluno_model import AlunoModel
+from ..models.frequencia_model import FrequenciaModel, FrequenciaMensalModel
+from ..database import db, somente_leitura
+from ..services.frequencia_service import registrar_chamada, inicio_do_mes
+from datetime import date, datetime, timedelta
+from ..services.auth_service import papel_requerido
+
+frequencia_bp = Blueprint('frequencia_bp', __name__)
+
+PERIODO_PADRAO_DIAS = 30
+
+
+def _ler_data(valor, padrao=None):
+    """'AAAA-MM-DD' -> date (vazio -> ``padrao``). Lança ValueError."""
+    if not valor:
+        return padrao
+    return datetime.strptime(valor, '%Y-%m-%d').date()
+
+
+# ==================== CHAMADA (CHECK-IN EM LOTE) ====================
+@frequencia_bp.route('/aulas/<int:aula_id>/chamada', methods=['POST'])
+@papel_requerido('admin', 'professor')
+def registrar_chamada_aula(aula_id):
+    """Registra a chamada da turma: ``{"data": "AAAA-MM-DD", "presentes": [ids], "ausentes": [ids]}``.
+
+    Sem ``data`` usa o dia de hoje. Registros já existentes não são alterados.
+    """
+    data = request.get_json() or {}
+    presentes = data.get('presentes') or []
+    ausentes = data.get('ausentes') or []
+    if not isinstance(presentes, list) or not isinstance(ausentes, list):
+        return jsonify({"message": "presentes e ausentes devem ser listas de IDs."}), 400
+    if not presentes and not ausentes:
+        return jsonify({"message": "Informe os alunos presentes e/ou ausentes."}), 400
+
+    try:
+        dia = _ler_data(data.get('data'), date.today())
+    except ValueError:
+        return jsonify({"message": "Data inválida. Use AAAA-MM-DD."}), 400
+    if dia > date.today():
+        return jsonify({"message": "Não é possível registrar chamada em data futura."}), 400
+
+    aula = db.session.get(AulaModel, aula_id)
+    if not aula:
+        return jsonify({"message": "Aula não encontrada."}), 404
+    if not aula.dias_mask & (1 << dia.weekday()):
+        return jsonify({"message": "A aula não acontece nesse dia da semana."}), 400
+
+    try:
+        gravados, relatorio = registrar_chamada(aula, dia, presentes, ausentes)
+        db.session.commit()
+        return jsonify({
+            "message": f"Chamada registrada: {gravados} aluno(s).",
+            "data": dia.isoformat(),
+            "registrados": gravados,
+            "relatorio": relatorio
+        }), 201
+    except Exception as e:
+        db.session.rollback()
+        print(f"❌ Erro ao registrar chamada: {e}")
+        return jsonify({"message": "Erro interno ao registrar chamada."}), 500
+
+
+# ==================== CONSULTAS ====================
+@frequencia_bp.route('/aulas/<int:aula_id>', methods=['GET'])
+@papel_requerido('admin', 'professor')
+@somente_leitura
+def frequencia_aula(aula_id):
+    """Chamada da aula numa data (``?data=``, padrão hoje)."""
+    try:
+        dia = _ler_data(request.args.get('data'), date.today())
+    except ValueError:
+        return jsonify({"message": "Data inválida. Use AAAA-MM-DD."}), 400
+
+    try:
+        linhas = (
+            db.session.query(FrequenciaModel.fk_aluno, AlunoModel.nome, FrequenciaModel.presente, FrequenciaModel.registrado_em)
+            .join(AlunoModel, AlunoModel.id == FrequenciaModel.fk_aluno)
+            .filter(FrequenciaModel.fk_aula == aula_id, FrequenciaModel.data == dia)
+            .order_by(AlunoModel.nome)
+            .all()
+        )
+        return jsonify({
+            "aula_id": aula_id,
+            "data": dia.isoformat(),
+            "presentes": sum(1 for linha in linhas if linha.presente),
+            "ausentes": sum(1 for linha in linhas if not linha.presente),
+            "alunos": [{
+                "aluno_id": linha.fk_aluno,
+                "aluno_nome": linha.nome,
+                "presente": linha.presente,
+                "registrado_em": linha.registrado_em.isoformat() if linha.registrado_em else None
+            } for linha in linhas]
+        }), 200
+    except Exception as e:
+        print(f"❌ Erro ao consultar chamada: {e}")
+        return jsonify({"message": "Erro interno ao consultar chamada."}), 500
+
+
+@frequencia_bp.route('/alunos/<int:aluno_id>', methods=['GET'])
+@papel_requerido('admin', 'professor')
+@somente_leitura
+def frequencia_aluno(aluno_id):
+    """Histórico do aluno no período ``?inicio=&fim=`` (padrão: últimos 30 dias)."""
+    try:
+        fim = _ler_data(request.args.get('fim'), date.today())
+        inicio = _ler_data(request.args.get('inicio'), fim - timedelta(days=PERIODO_PADRAO_DIAS))
+    except ValueError:
+        return jsonify({"message": "Data inválida. Use AAAA-MM-DD."}), 400
+    if inicio > fim:
+        return jsonify({"message": "A data inicial deve ser anterior à final."}), 400
+
+    try:
+        linhas = (
+            db.session.query(FrequenciaModel.data, FrequenciaModel.presente, FrequenciaModel.fk_aula, AulaModel.nome_turma)
+            .join(AulaModel, AulaModel.id == FrequenciaModel.fk_aula)
+            .filter(FrequenciaModel.fk_aluno == aluno_id, FrequenciaModel.data.between(inicio, fim))
+            .order_by(FrequenciaModel.data.desc(), AulaModel.horario_inicio)
+            .all()
+        )
+        presencas = sum(1 for linha in linhas if linha.presente)
+        return jsonify({
+            "aluno_id": aluno_id,
+            "inicio": inicio.isoformat(),
+            "fim": fim.isoformat(),
+            "presencas": presencas,
+            "faltas": len(linhas) - presencas,
+            "percentual_presenca": round(presencas / len(linhas) * 100, 1) if linhas else None,
+            "registros": [{
+                "data": linha.data.isoformat(),
+                "aula_id": linha.fk_aula,
+                "nome_turma": linha.nome_turma,
+                "presente": linha.presente
+            } for linha in linhas]
+        }), 200
+    except Exception as e:
+        print(f"❌ Erro ao consultar frequência do aluno: {e}")
+        return jsonify({"message": "Erro interno ao consultar frequência."}), 500
+
+
+@frequencia_bp.route('/mensal', methods=['GET'])
+@papel_requerido('admin', 'professor')
+@somente_leitura
+def frequencia_mensal():
+    """Totais do mês (``?mes=AAAA-MM``, padrão o atual) por aluno e aula,
+    lidos da tabela consolidada. Filtros: ``aula_id``, ``aluno_id``."""
+    try:
+        mes_str = request.args.get('mes')
+        mes = datetime.strptime(mes_str, '%Y-%m').date() if mes_str else inicio_do_mes(date.today())
+    except ValueError:
+        return jsonify({"message": "Mês inválido. Use AAAA-MM."}), 400
+    aula_id = request.args.get('aula_id', None, type=int)
+    aluno_id = request.args.get('aluno_id', None, type=int)
+
+    try:
+        query = (
+            db.session.query(FrequenciaMensalModel, AlunoModel.nome, AulaModel.nome_turma)
+            .join(AlunoModel, AlunoModel.id == FrequenciaMensalModel.fk_aluno)
+            .join(AulaModel, AulaModel.id == FrequenciaMensalModel.fk_aula)
+            .filter(FrequenciaMensalModel.mes == mes)
+        )
+        if aula_id:
+            query = query.filter(FrequenciaMensalModel.fk_aula == aula_id)
+        if aluno_id:
+            query = query.filter(FrequenciaMensalModel.fk_aluno == aluno_id)
+
+        resultado = []
+        for total, aluno_nome, nome_turma in query.order_by(AlunoModel.nome, AulaModel.nome_turma):
+            item = total.to_json()
+            item['aluno_nome'] = aluno_nome
+            item['nome_turma'] = nome_turma
+            resultado.append(item)
+        return jsonify({"mes": mes.strftime('%Y-%m'), "totais": resultado}), 200
+    except Exception as e:
+        print(f"❌ Erro ao consultar frequência mensal: {e}")
+        return jsonify({"message": "Erro interno ao consultar frequência mensal."}), 500
@@ -0,0 +1,38 @@
+from flask import Blueprint, request, jsonify
+import io
+
+from ..services.auth_service import papel_requerido
+from ..services.importacao_service import importar_alunos_csv
+
+importacao_bp = Blueprint('importacao_bp', __name__)
+
+
+@importacao_bp.route('/alunos', methods=['POST'])
+@papel_requerido('admin', 'professor')
+def importar_alunos():
+    """Importa alunos de um CSV enviado como multipart (campo ``arquivo``).
+
+    ``?atualizar=0`` rejeita CPFs já cadastrados em vez de atualizá-los.
+    Devolve os totais e os erros de cada linha rejeitada.
+    """
+    arquivo = request.files.get('arquivo')
+    if not arquivo or not arquivo.filename:
+        return jsonify({"message": "Envie o arquivo CSV no campo 'arquivo'."}), 400
+
+    atualizar = request.args.get('atualizar', '1').lower() not in ('0', 'false', 'nao', 'não')
+
+    try:
+        # Lê direto do stream do upload, sem carregar o arquivo inteiro
+        texto = io.TextIOWrapper(arquivo.stream, encoding='utf-8-sig', newline='')
+        relatorio = importar_alunos_csv(texto, atualizar=atualizar)
+    except UnicodeDecodeError:
+        return jsonify({"message": "O arquivo precisa estar em UTF-8."}), 400
+    except Exception as e:
+        print(f"❌ Erro ao importar alunos: {e}")
+        return jsonify({"message": "Erro interno ao importar o arquivo."}), 500
+
+    if relatorio['interrompido']:
+        mensagem = "Importação interrompida: o arquivo precisa estar em UTF-8. As linhas anteriores foram processadas."
+    else:
+        mensagem = "Importação concluída."
+    return jsonify({"message": mensagem, **relatorio}), 200
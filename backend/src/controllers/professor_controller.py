@@ -1,9 +1,13 @@
 from flask import Blueprint, request, jsonify
 from ..models.professor_model import ProfessorModel
 from ..models.user_model import UserModel
-from ..database import db
+from ..database import db, somente_leitura
+from ..services.cache_service import cache
+from ..services.hash_service import HashIndisponivelError
+from ..services.revogacao_service import revogacao, revogar_usuario
+from ..services.serializacao_service import PROFESSOR_JSON
 from datetime import datetime
-from flask_jwt_extended import jwt_required, get_jwt_identity, get_jwt
+from ..services.auth_service import autorizacao, papel_requerido
 import re
 
 professor_bp = Blueprint('professor_bp', __name__)
@@ -22,7 +26,7 @@ def validar_cpf(cpf_str: str) -> bool:
     return True
 
 @professor_bp.route('/', methods=['POST'])
-@jwt_required()
+@papel_requerido('admin')
 def create_professor():
     data = request.get_json()
     if not data:
@@ -69,6 +73,8 @@ def create_professor():
         )
         db.session.add(new_professor)
         db.session.commit()
+        cache.invalidar('professores', 'aulas')
+        autorizacao.invalidar(new_user.id)
 
         return jsonify({
             "message": "Professor cadastrado com sucesso.",
@@ -78,6 +84,9 @@ def create_professor():
     except ValueError as ve:
          db.session.rollback()
          return jsonify({"message": f"Erro no formato dos dados: {ve}."}), 400
+    except HashIndisponivelError as he:
+        db.session.rollback()
+        return jsonify({"message": str(he)}), 503, {"Retry-After": "1"}
     except Exception as e:
         db.session.rollback()
         print(f"Erro ao cadastrar professor: {e}")
@@ -85,17 +94,20 @@ def create_professor():
         return jsonify({"message": "Erro interno ao processar o cadastro do professor."}), 500
 
 @professor_bp.route('/', methods=['GET'])
-@jwt_required()
+@papel_requerido('admin', 'professor')
+@somente_leitura
+@cache.listagem('professores')
 def list_professores():
     try:
-        professores = ProfessorModel.query.filter_by(ativo=True).order_by(ProfessorModel.nome).all()
-        return jsonify([p.to_json() for p in professores]), 200
+        # Só as colunas do JSON, sem carregar objetos ORM
+        consulta = PROFESSOR_JSON.select().where(ProfessorModel.ativo.is_(True)).order_by(ProfessorModel.nome)
+        return jsonify(PROFESSOR_JSON.linhas(consulta)), 200
     except Exception as e:
         print(f"Erro ao listar professores: {e}")
         return jsonify({"message": "Erro interno ao buscar professores."}), 500
 
 @professor_bp.route('/<int:professor_id>', methods=['GET'])
-@jwt_required()
+@papel_requerido('admin', 'professor')
 def get_professor(professor_id):
     professor = ProfessorModel.query.get(professor_id) # Usar get é mais simples que get_or_404 aqui
     if not professor:
@@ -104,7 +116,7 @@ def get_professor(professor_id):
     return jsonify(professor.to_json()), 200
 
 @professor_bp.route('/<int:professor_id>', methods=['PUT'])
-@jwt_required()
+@papel_requerido('admin')
 def update_professor(professor_id):
     professor = ProfessorModel.query.get(professor_id)
     if not professor:
@@ -134,7 +146,10 @@ def update_professor(professor_id):
         if 'telefone' in data: professor.telefone = data.get('telefone')
         if 'endereco' in data: professor.endereco = data.get('endereco')
         if 'grau' in data: professor.grau_faixa = data.get('grau') # Assume que frontend envia 'grau'
-        if 'ativo' in data: professor.ativo = bool(data['ativo'])
+        if 'ativo' in data:
+            if professor.ativo and not data['ativo']:
+                revogar_usuario(professor.fk_usuario)
+            professor.ativo = bool(data['ativo'])
 
         if 'data_nascimento' in data and data['data_nascimento']:
              try:
@@ -143,6 +158,9 @@ def update_professor(professor_id):
                   return jsonify({"message": "Formato inválido para Data de Nascimento."}), 400
 
         db.session.commit()
+        cache.invalidar('professores', 'aulas')
+        autorizacao.invalidar(professor.fk_usuario)
+        revogacao.sincronizar()
         return jsonify({
             "message": "Professor atualizado com sucesso.",
             "professor": professor.to_json()
@@ -156,7 +174,7 @@ def update_professor(professor_id):
         return jsonify({"message": "Erro interno ao atualizar professor."}), 500
 
 @professor_bp.route('/<int:professor_id>', methods=['DELETE'])
-@jwt_required()
+@papel_requerido('admin')
 def delete_professor(professor_id):
     professor = ProfessorModel.query.get(professor_id)
     if not professor:
@@ -164,7 +182,13 @@ def delete_professor(professor_id):
 
     try:
         professor.ativo = False
+        # Tokens já emitidos deixam de valer em todos os workers, não só no papel em cache
+        revogar_usuario(professor.fk_usuario)
         db.session.commit()
+        cache.invalidar('professores', 'aulas')
+        # O login do professor deixa de valer já na próxima requisição
+        autorizacao.invalidar(professor.fk_usuario)
+        revogacao.sincronizar()
         return jsonify({"message": f"Professor '{professor.nome}' foi inativado."}), 200
     except Exception as e:
         db.session.rollback()
@@ -0,0 +1,72 @@
+from flask import Blueprint, request, jsonify
+from ..models.aluno_model import AlunoModel
+from ..models.professor_model import ProfessorModel
+from ..database import db, somente_leitura
+from datetime import datetime
+from ..services.auth_service import papel_requerido
+from sqlalchemy import case, extract, func
+
+stats_bp = Blueprint('stats_bp', __name__)
+
+# Mesmas faixas usadas nos gráficos do dashboard
+FAIXAS_ETARIAS = ["Até 10", "11-15", "16-18", "19+"]
+SEXOS = ["Masculino", "Feminino"]
+CACHE_MAX_AGE = 60  # segundos
+
+
+def _expressao_faixa_etaria(ano_atual: int):
+    """CASE em SQL que classifica a idade (ano atual - ano de nascimento)."""
+    idade = ano_atual - extract('year', AlunoModel.data_nascimento)
+    return case(
+        (idade <= 10, FAIXAS_ETARIAS[0]),
+        (idade <= 15, FAIXAS_ETARIAS[1]),
+        (idade <= 18, FAIXAS_ETARIAS[2]),
+        else_=FAIXAS_ETARIAS[3]
+    )
+
+
+@stats_bp.route('/', methods=['GET'])
+@papel_requerido('admin', 'professor')
+@somente_leitura
+def get_stats():
+    """Totais, histograma de faixa etária e distribuição por sexo dos alunos ativos."""
+    try:
+        faixa = _expressao_faixa_etaria(datetime.utcnow().year).label('faixa')
+
+        # Um único GROUP BY (faixa, sexo) alimenta os dois gráficos
+        linhas = (
+            db.session.query(faixa, AlunoModel.sexo, func.count(AlunoModel.id))
+            .filter(AlunoModel.ativo.is_(True))
+            .group_by(faixa, AlunoModel.sexo)
+            .all()
+        )
+        total_professores = (
+            db.session.query(func.count(ProfessorModel.id))
+            .filter(ProfessorModel.ativo.is_(True))
+            .scalar()
+        )
+
+        faixas = {f: 0 for f in FAIXAS_ETARIAS}
+        sexos = {s: 0 for s in SEXOS}
+        total_alunos = 0
+        for faixa_nome, sexo, qtd in linhas:
+            total_alunos += qtd
+            faixas[faixa_nome] += qtd
+            if sexo in sexos:
+                sexos[sexo] += qtd
+
+        response = jsonify({
+            "total_alunos": total_alunos,
+            "total_professores": total_professores or 0,
+            "faixa_etaria": faixas,
+            "sexo": sexos
+        })
+        response.cache_control.private = True
+        response.cache_control.max_age = CACHE_MAX_AGE
+        response.add_etag()
+        # Responde 304 quando o If-None-Match bate com o ETag
+        return response.make_conditional(request)
+
+    except Exception as e:
+        print(f"❌ Erro ao calcular estatísticas: {e}")
+        return jsonify({"message": "Erro interno ao calcular estatísticas."}), 500
@@ -1,7 +1,10 @@
 from flask import Blueprint, request, jsonify
 from ..models.user_model import UserModel
 from ..database import db
-from flask_jwt_extended import create_access_token 
+from ..services.auth_service import autorizacao
+from ..services.hash_service import HashIndisponivelError
+from ..services.revogacao_service import revogacao, revogar_token, revogar_usuario
+from flask_jwt_extended import create_access_token, get_jwt, jwt_required
 
 user_bp = Blueprint('user_bp', __name__)
 
@@ -25,12 +28,16 @@ def register_user():
 
         db.session.add(new_user)
         db.session.commit()
+        autorizacao.invalidar(new_user.id)
         
         return jsonify({
             "message": "Usuário cadastrado com sucesso.",
             "user": new_user.to_json()
         }), 201
 
+    except HashIndisponivelError as he:
+        db.session.rollback()
+        return jsonify({"message": str(he)}), 503, {"Retry-After": "1"}
     except Exception as e:
         db.session.rollback()
         return jsonify({"message": "Erro interno do servidor ao cadastrar."}), 500
@@ -44,8 +51,18 @@ def login_user():
 
     user = UserModel.query.filter_by(email=data['email']).first()
 
-    if user and user.check_password(data['senha']):
-        
+    try:
+        senha_ok = user is not None and user.check_password(data['senha'])
+    except HashIndisponivelError as he:
+        return jsonify({"message": str(he)}), 503, {"Retry-After": "1"}
+
+    if senha_ok:
+        # Situação atual lida do banco; já fica no cache para as próximas requisições
+        autorizacao.invalidar(user.id)
+        _, ativo = autorizacao.situacao(user.id)
+        if not ativo:
+            return jsonify({"message": "Usuário inativo."}), 403
+
         # Correção: user.id é Integer, convertemos para String
         access_token = create_access_token(
             identity=str(user.id), 
@@ -63,10 +80,36 @@ def login_user():
     else:
         return jsonify({"message": "Credenciais inválidas."}), 401
     
+@user_bp.route('/logout', methods=['POST'])
+@jwt_required()
+def logout_user():
+    """Revoga o token da requisição. Com ``{"todos": true}`` revoga todos os
+    tokens do usuário (sair de todos os dispositivos)."""
+    data = request.get_json(silent=True) or {}
+    token = get_jwt()
+
+    try:
+        usuario_id = int(token['sub'])
+        # O token usado sempre pelo jti: o corte de "todos" não pega tokens do mesmo segundo
+        revogar_token(token['jti'], usuario_id, token['exp'])
+        if data.get('todos'):
+            revogar_usuario(usuario_id)
+        db.session.commit()
+        revogacao.sincronizar()
+        return jsonify({"message": "Sessão encerrada."}), 200
+    except Exception as e:
+        db.session.rollback()
+        print(f"❌ Erro ao revogar token: {e}")
+        return jsonify({"message": "Erro interno ao encerrar a sessão."}), 500
+
 @user_bp.route('/login', methods=['OPTIONS'])
 def login_options():
     return '', 200
 
 @user_bp.route('/register', methods=['OPTIONS'])
 def register_options():
+    return '', 200
+
+@user_bp.route('/logout', methods=['OPTIONS'])
+def logout_options():
     return '', 200
\ No newline at end of file
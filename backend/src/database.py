@@ -1,24 +1,198 @@
 import os
+import threading
+import time
+from functools import wraps
+
+from flask import g, has_app_context
 from flask_sqlalchemy import SQLAlchemy
+from flask_sqlalchemy.session import Session
+from sqlalchemy import event
+from sqlalchemy.pool import QueuePool
+from sqlalchemy.sql.dml import UpdateBase
 from dotenv import load_dotenv
 
 load_dotenv()
 
-db = SQLAlchemy()
+# Padrões do pool (sobrescritos por variáveis de ambiente DB_*)
+POOL_SIZE_PADRAO = 5
+MAX_OVERFLOW_PADRAO = 10
+POOL_TIMEOUT_PADRAO = 30        # segundos esperando uma conexão livre
+POOL_RECYCLE_PADRAO = 1800      # segundos até reabrir uma conexão
+CONNECT_TIMEOUT_PADRAO = 10     # segundos para abrir a conexão TCP
+# Depois de uma escrita, as leituras deste processo ficam no primário por
+# esse tempo, para não lerem da réplica um dado ainda não replicado
+JANELA_POS_ESCRITA_PADRAO = 2.0
 
-def configure_database(app):
-    # Pega a variável DATABASE_URL diretamente (Render fornece assim)
-    database_url = os.getenv('DATABASE_URL')
+_estatisticas = {}
+_estatisticas_lock = threading.Lock()
+_ultima_escrita = 0.0
+
+
+def _registrar(chave, campo, valor=1, maximo=None):
+    with _estatisticas_lock:
+        stats = _estatisticas.setdefault(chave, {
+            'checkouts': 0, 'conexoes_criadas': 0,
+            'espera_total_s': 0.0, 'espera_max_s': 0.0,
+            'conexao_total_s': 0.0, 'conexao_max_s': 0.0
+        })
+        stats[campo] += valor
+        if maximo:
+            stats[maximo] = max(stats[maximo], valor)
+
+
+class QueuePoolMedido(QueuePool):
+    """QueuePool que mede quanto cada checkout esperou por uma conexão
+    (inclui abrir uma nova quando o pool está vazio)."""
+
+    def _do_get(self):
+        inicio = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            _registrar(getattr(self, '_chave_stats', 'principal'), 'espera_total_s', time.perf_counter() - inicio, 'espera_max_s')
+
+
+class SessionRoteada(Session):
+    """Session que manda as leituras das rotas ``@somente_leitura`` para a réplica."""
 
+    def get_bind(self, mapper=None, clause=None, bind=None, **kwargs):
+        global _ultima_escrita
+        if bind is None:
+            if self._flushing or isinstance(clause, UpdateBase):
+                _ultima_escrita = time.monotonic()
+            elif (
+                has_app_context() and g.get('usar_replica')
+                and 'replica' in self._db.engines
+                and time.monotonic() - _ultima_escrita > float(os.getenv('DB_REPLICA_JANELA', JANELA_POS_ESCRITA_PADRAO))
+            ):
+                return self._db.engines['replica']
+        return super().get_bind(mapper=mapper, clause=clause, bind=bind, **kwargs)
+
+
+db = SQLAlchemy(session_options={'class_': SessionRoteada})
+
+
+def montar_url_banco() -> str:
+    """URL do banco principal: DATABASE_URL (Render) ou as variáveis DB_*."""
+    db_url = os.getenv("DATABASE_URL")
+    if not db_url:
+        db_url = (
+            f"postgresql+psycopg2://{os.getenv('DB_USER')}:{os.getenv('DB_PASSWORD')}@"
+            f"{os.getenv('DB_HOST')}:{os.getenv('DB_PORT')}/{os.getenv('DB_NAME')}"
+        )
+    return _corrigir_prefixo(db_url)
+
+
+def _corrigir_prefixo(url: str) -> str:
     # Render usa o prefixo "postgres://" às vezes — ajusta para SQLAlchemy
-    if database_url and database_url.startswith("postgres://"):
-        database_url = database_url.replace("postgres://", "postgresql://")
+    if url.startswith("postgres://"):
+        return url.replace("postgres://", "postgresql://", 1)
+    return url
+
+
+def _env_bool(nome: str, padrao: bool) -> bool:
+    valor = os.getenv(nome)
+    if valor is None:
+        return padrao
+    return valor.strip().lower() in ('1', 'true', 'sim', 'yes', 'on')
+
 
+def opcoes_engine(url: str) -> dict:
+    """Opções de pool/timeout para ``url``, lidas das variáveis DB_*.
+
+    SQLite (testes) fica com os padrões do Flask-SQLAlchemy.
+    """
+    if url.startswith('sqlite'):
+        return {}
+
+    opcoes = {
+        'poolclass': QueuePoolMedido,
+        'pool_size': int(os.getenv('DB_POOL_SIZE', POOL_SIZE_PADRAO)),
+        'max_overflow': int(os.getenv('DB_MAX_OVERFLOW', MAX_OVERFLOW_PADRAO)),
+        'pool_timeout': float(os.getenv('DB_POOL_TIMEOUT', POOL_TIMEOUT_PADRAO)),
+        'pool_recycle': int(os.getenv('DB_POOL_RECYCLE', POOL_RECYCLE_PADRAO)),
+        'pool_pre_ping': _env_bool('DB_POOL_PRE_PING', True),
+    }
+
+    if url.startswith('postgresql'):
+        connect_args = {'connect_timeout': int(os.getenv('DB_CONNECT_TIMEOUT', CONNECT_TIMEOUT_PADRAO))}
+        statement_timeout = int(os.getenv('DB_STATEMENT_TIMEOUT_MS', 0))
+        if statement_timeout > 0:
+            connect_args['options'] = f'-c statement_timeout={statement_timeout}'
+        opcoes['connect_args'] = connect_args
+
+    return opcoes
+
+
+def _instrumentar_engine(chave, engine):
+    engine.pool._chave_stats = chave
+    inicio_conexao = threading.local()
+
+    @event.listens_for(engine, 'do_connect')
+    def _antes_de_conectar(dialect, conn_rec, cargs, cparams):
+        inicio_conexao.valor = time.perf_counter()
+
+    @event.listens_for(engine, 'connect')
+    def _conectou(dbapi_connection, connection_record):
+        _registrar(chave, 'conexoes_criadas')
+        inicio = getattr(inicio_conexao, 'valor', None)
+        if inicio is not None:
+            _registrar(chave, 'conexao_total_s', time.perf_counter() - inicio, 'conexao_max_s')
+            inicio_conexao.valor = None
+
+    @event.listens_for(engine, 'checkout')
+    def _checkout(dbapi_connection, connection_record, connection_proxy):
+        _registrar(chave, 'checkouts')
+
+
+def configure_database(app):
+    """Configura URL, pool, timeouts e a réplica opcional (DATABASE_REPLICA_URL)."""
+    database_url = montar_url_banco()
     app.config['SQLALCHEMY_DATABASE_URI'] = database_url
     app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+    app.config['SQLALCHEMY_ENGINE_OPTIONS'] = opcoes_engine(database_url)
+
+    replica_url = os.getenv('DATABASE_REPLICA_URL')
+    if replica_url:
+        replica_url = _corrigir_prefixo(replica_url)
+        app.config['SQLALCHEMY_BINDS'] = {'replica': {'url': replica_url, **opcoes_engine(replica_url)}}
 
     db.init_app(app)
 
-    # Cria as tabelas automaticamente no primeiro start
     with app.app_context():
-        db.create_all()
+        for chave, engine in db.engines.items():
+            _instrumentar_engine(chave or 'principal', engine)
+
+
+def somente_leitura(view):
+    """Marca a rota como só leitura: as consultas podem ir para a réplica."""
+    @wraps(view)
+    def wrapper(*args, **kwargs):
+        g.usar_replica = True
+        return view(*args, **kwargs)
+    return wrapper
+
+
+def estatisticas_pool() -> dict:
+    """Contadores de checkout/espera/conexão e o estado atual de cada pool."""
+    resultado = {}
+    with _estatisticas_lock:
+        copia = {chave: dict(valores) for chave, valores in _estatisticas.items()}
+    for chave, engine in db.engines.items():
+        nome = chave or 'principal'
+        stats = copia.get(nome, {})
+        pool = engine.pool
+        stats['pool'] = pool.__class__.__name__
+        if isinstance(pool, QueuePool):
+            stats.update({
+                'tamanho': pool.size(),
+                'em_uso': pool.checkedout(),
+                'ociosas': pool.checkedin(),
+                'overflow': pool.overflow()
+            })
+        if stats.get('checkouts') and 'espera_total_s' in stats:
+            stats['espera_media_ms'] = round(stats['espera_total_s'] / stats['checkouts'] * 1000, 3)
+        if stats.get('conexoes_criadas'):
+            stats['conexao_media_ms'] = round(stats['conexao_total_s'] / stats['conexoes_criadas'] * 1000, 3)
+        resultado[nome] = stats
+    return resultado
@@ -0,0 +1,63 @@
+"""Provider JSON do Flask com orjson (C, bem mais rápido que o json da stdlib).
+
+Usado por ``jsonify``, ``request.get_json`` e ``current_app.json``. Sem o
+orjson instalado cai no provider padrão do Flask, com a mesma saída:
+datas e horários em ISO 8601 (como os ``to_json`` dos modelos já faziam),
+chaves não-string convertidas para texto e ``Decimal`` como string.
+"""
+import dataclasses
+import decimal
+import uuid
+from datetime import date, time
+
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depende do ambiente
+    orjson = None
+
+
+def padrao_json(valor):
+    """Tipos que o JSON não tem. Os mesmos do provider do Flask, mas com datas em
+    ISO (o Flask escreve date/datetime no formato HTTP)."""
+    if isinstance(valor, (date, time)):
+        return valor.isoformat()
+    if isinstance(valor, (decimal.Decimal, uuid.UUID)):
+        return str(valor)
+    if dataclasses.is_dataclass(valor) and not isinstance(valor, type):
+        return dataclasses.asdict(valor)
+    if hasattr(valor, '__html__'):
+        return str(valor.__html__())
+    raise TypeError(f"Objeto do tipo {type(valor).__name__} não é serializável em JSON")
+
+
+class ProviderJSON(DefaultJSONProvider):
+    default = staticmethod(padrao_json)
+
+    def _opcoes_orjson(self):
+        opcoes = orjson.OPT_NON_STR_KEYS
+        if self.sort_keys:
+            opcoes |= orjson.OPT_SORT_KEYS
+        if self.compact is False or (self.compact is None and self._app.debug):
+            opcoes |= orjson.OPT_INDENT_2
+        return opcoes
+
+    def dumps(self, obj, **kwargs):
+        # Argumentos extras (indent, separators...) só o json da stdlib entende
+        if orjson is None or kwargs:
+            return super().dumps(obj, **kwargs)
+        return orjson.dumps(obj, default=padrao_json, option=self._opcoes_orjson()).decode()
+
+    def loads(self, s, **kwargs):
+        if orjson is None or kwargs:
+            return super().loads(s, **kwargs)
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        if orjson is None:
+            return super().response(*args, **kwargs)
+        obj = self._prepare_response_obj(args, kwargs)
+        # Direto em bytes: evita decodificar para str e codificar de novo
+        corpo = orjson.dumps(obj, default=padrao_json, option=self._opcoes_orjson())
+        return self._app.response_class(corpo + b"\n", mimetype=self.mimetype)
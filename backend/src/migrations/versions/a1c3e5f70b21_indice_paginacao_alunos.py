@@ -0,0 +1,23 @@
+"""Índice composto (nome, id) para paginação por cursor de alunos
+
+Revision ID: a1c3e5f70b21
+Revises: 4147714e9285
+Create Date: 2026-10-18 09:00:00.000000
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# Identificadores da revisão
+revision = 'a1c3e5f70b21'
+down_revision = '4147714e9285'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index('ix_alunos_nome_id', 'alunos', ['nome', 'id'], unique=False)
+
+
+def downgrade():
+    op.drop_index('ix_alunos_nome_id', table_name='alunos')
@@ -0,0 +1,27 @@
+"""Índice em alunos.data_proxima_graduacao (alunos ativos) para a consulta de elegíveis
+
+Revision ID: a7c9e1f46b87
+Revises: f6b8d0e35a76
+Create Date: 2026-10-18 12:30:00.000000
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# Identificadores da revisão
+revision = 'a7c9e1f46b87'
+down_revision = 'f6b8d0e35a76'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Depois de aplicar, preencha as datas com: flask graduacao recalcular
+    op.create_index(
+        'ix_alunos_proxima_graduacao', 'alunos', ['data_proxima_graduacao'],
+        unique=False, postgresql_where=sa.text('ativo')
+    )
+
+
+def downgrade():
+    op.drop_index('ix_alunos_proxima_graduacao', table_name='alunos')
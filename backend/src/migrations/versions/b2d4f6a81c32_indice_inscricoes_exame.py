@@ -0,0 +1,23 @@
+"""Índice em inscricoes.fk_exame para as contagens por exame
+
+Revision ID: b2d4f6a81c32
+Revises: a1c3e5f70b21
+Create Date: 2026-10-18 09:30:00.000000
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# Identificadores da revisão
+revision = 'b2d4f6a81c32'
+down_revision = 'a1c3e5f70b21'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index('ix_inscricoes_fk_exame', 'inscricoes', ['fk_exame'], unique=False)
+
+
+def downgrade():
+    op.drop_index('ix_inscricoes_fk_exame', table_name='inscricoes')
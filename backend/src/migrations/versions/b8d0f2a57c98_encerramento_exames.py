@@ -0,0 +1,35 @@
+"""Encerramento de exames: exames.encerrado/encerrado_em e faixas na inscrição
+
+Revision ID: b8d0f2a57c98
+Revises: a7c9e1f46b87
+Create Date: 2026-10-18 13:00:00.000000
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# Identificadores da revisão
+revision = 'b8d0f2a57c98'
+down_revision = 'a7c9e1f46b87'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('exames', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('encerrado', sa.Boolean(), nullable=False, server_default=sa.false()))
+        batch_op.add_column(sa.Column('encerrado_em', sa.DateTime(), nullable=True))
+
+    with op.batch_alter_table('inscricoes', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('faixa_anterior', sa.String(length=50), nullable=True))
+        batch_op.add_column(sa.Column('faixa_nova', sa.String(length=50), nullable=True))
+
+
+def downgrade():
+    with op.batch_alter_table('inscricoes', schema=None) as batch_op:
+        batch_op.drop_column('faixa_nova')
+        batch_op.drop_column('faixa_anterior')
+
+    with op.batch_alter_table('exames', schema=None) as batch_op:
+        batch_op.drop_column('encerrado_em')
+        batch_op.drop_column('encerrado')
@@ -0,0 +1,46 @@
+"""Busca por trigramas (pg_trgm + unaccent) em alunos.nome e prefixo de CPF
+
+Revision ID: c3e5a7b92d43
+Revises: b2d4f6a81c32
+Create Date: 2026-10-18 10:00:00.000000
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# Identificadores da revisão
+revision = 'c3e5a7b92d43'
+down_revision = 'b2d4f6a81c32'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # ✅ Extensões e índices existem só no PostgreSQL
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.execute("CREATE EXTENSION IF NOT EXISTS unaccent")
+    # unaccent() não é IMMUTABLE; o wrapper permite usá-lo em índice
+    op.execute("""
+        CREATE OR REPLACE FUNCTION f_unaccent(text) RETURNS text
+        LANGUAGE sql IMMUTABLE PARALLEL SAFE STRICT
+        AS $$ SELECT public.unaccent('public.unaccent', $1) $$
+    """)
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_alunos_nome_trgm ON alunos "
+        "USING gin (f_unaccent(lower(nome)) gin_trgm_ops)"
+    )
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_alunos_cpf_prefixo ON alunos (cpf text_pattern_ops)"
+    )
+
+
+def downgrade():
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    op.execute("DROP INDEX IF EXISTS ix_alunos_cpf_prefixo")
+    op.execute("DROP INDEX IF EXISTS ix_alunos_nome_trgm")
+    op.execute("DROP FUNCTION IF EXISTS f_unaccent(text)")
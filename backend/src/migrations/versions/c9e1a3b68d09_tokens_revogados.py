@@ -0,0 +1,38 @@
+"""Tabela de tokens JWT revogados (logout e inativação de usuários)
+
+Revision ID: c9e1a3b68d09
+Revises: b8d0f2a57c98
+Create Date: 2026-10-18 12:00:00.000000
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# Identificadores da revisão
+revision = 'c9e1a3b68d09'
+down_revision = 'b8d0f2a57c98'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        'tokens_revogados',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('jti', sa.String(length=36), nullable=True),
+        sa.Column('fk_usuario', sa.Integer(), nullable=True),
+        sa.Column('revogado_em', sa.DateTime(), nullable=False),
+        sa.Column('expira_em', sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('jti')
+    )
+    op.create_index('ix_tokens_revogados_fk_usuario', 'tokens_revogados', ['fk_usuario'], unique=False)
+    op.create_index('ix_tokens_revogados_revogado_em', 'tokens_revogados', ['revogado_em'], unique=False)
+    op.create_index('ix_tokens_revogados_expira_em', 'tokens_revogados', ['expira_em'], unique=False)
+
+
+def downgrade():
+    op.drop_index('ix_tokens_revogados_expira_em', table_name='tokens_revogados')
+    op.drop_index('ix_tokens_revogados_revogado_em', table_name='tokens_revogados')
+    op.drop_index('ix_tokens_revogados_fk_usuario', table_name='tokens_revogados')
+    op.drop_table('tokens_revogados')
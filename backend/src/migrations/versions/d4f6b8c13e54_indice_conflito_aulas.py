@@ -0,0 +1,26 @@
+"""Índice (fk_professor, horario_inicio, horario_fim) para conflitos de horário
+
+Revision ID: d4f6b8c13e54
+Revises: c3e5a7b92d43
+Create Date: 2026-10-18 11:00:00.000000
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# Identificadores da revisão
+revision = 'd4f6b8c13e54'
+down_revision = 'c3e5a7b92d43'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index(
+        'ix_aulas_professor_horario', 'aulas',
+        ['fk_professor', 'horario_inicio', 'horario_fim'], unique=False
+    )
+
+
+def downgrade():
+    op.drop_index('ix_aulas_professor_horario', table_name='aulas')
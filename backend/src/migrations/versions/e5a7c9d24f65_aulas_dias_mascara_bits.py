@@ -0,0 +1,65 @@
+"""Troca aulas.dias_semana (ARRAY de nomes) por dias_mask (inteiro com bits)
+
+Revision ID: e5a7c9d24f65
+Revises: d4f6b8c13e54
+Create Date: 2026-10-18 11:30:00.000000
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# Identificadores da revisão
+revision = 'e5a7c9d24f65'
+down_revision = 'd4f6b8c13e54'
+branch_labels = None
+depends_on = None
+
+# Mesma ordem de DIAS_SEMANA em aula_model (bit 0 = segunda)
+DIAS = [('seg', 'Segunda'), ('ter', 'Terça'), ('qua', 'Quarta'), ('qui', 'Quinta'),
+        ('sex', 'Sexta'), ('sab', 'Sábado'), ('dom', 'Domingo')]
+
+
+def upgrade():
+    with op.batch_alter_table('aulas', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('dias_mask', sa.Integer(), nullable=True))
+
+    if op.get_bind().dialect.name == 'postgresql':
+        # Aceita os nomes com ou sem acento/maiúsculas ("Terça", "terca", "TER")
+        soma = ' + '.join(
+            f"(CASE WHEN EXISTS (SELECT 1 FROM unnest(dias_semana) d "
+            f"WHERE lower(left(translate(d, 'ÁáÇç', 'AaCc'), 3)) = '{chave}') THEN {1 << i} ELSE 0 END)"
+            for i, (chave, _) in enumerate(DIAS)
+        )
+        op.execute(f"UPDATE aulas SET dias_mask = {soma}")
+    op.execute("UPDATE aulas SET dias_mask = 0 WHERE dias_mask IS NULL")
+
+    with op.batch_alter_table('aulas', schema=None) as batch_op:
+        batch_op.alter_column('dias_mask', existing_type=sa.Integer(), nullable=False)
+        batch_op.drop_column('dias_semana')
+        batch_op.create_check_constraint('ck_aulas_dias_mask', 'dias_mask BETWEEN 0 AND 127')
+
+    if op.get_bind().dialect.name == 'postgresql':
+        # Um índice parcial por dia: "aulas de hoje" lê só as linhas do dia
+        for i, (chave, _) in enumerate(DIAS):
+            op.execute(
+                f"CREATE INDEX IF NOT EXISTS ix_aulas_dia_{chave} ON aulas (horario_inicio) "
+                f"WHERE (dias_mask & {1 << i}) <> 0"
+            )
+
+
+def downgrade():
+    if op.get_bind().dialect.name == 'postgresql':
+        for chave, _ in DIAS:
+            op.execute(f"DROP INDEX IF EXISTS ix_aulas_dia_{chave}")
+
+    with op.batch_alter_table('aulas', schema=None) as batch_op:
+        batch_op.drop_constraint('ck_aulas_dias_mask', type_='check')
+        batch_op.add_column(sa.Column('dias_semana', postgresql.ARRAY(sa.String(length=20)), nullable=True))
+
+    nomes = ', '.join(f"CASE WHEN dias_mask & {1 << i} <> 0 THEN '{nome}' END" for i, (_, nome) in enumerate(DIAS))
+    op.execute(f"UPDATE aulas SET dias_semana = array_remove(ARRAY[{nomes}]::varchar[], NULL)")
+
+    with op.batch_alter_table('aulas', schema=None) as batch_op:
+        batch_op.alter_column('dias_semana', existing_type=postgresql.ARRAY(sa.String(length=20)), nullable=False)
+        batch_op.drop_column('dias_mask')
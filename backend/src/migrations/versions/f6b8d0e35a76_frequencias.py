@@ -0,0 +1,52 @@
+"""Tabelas de frequência (registros brutos e totais mensais)
+
+Revision ID: f6b8d0e35a76
+Revises: e5a7c9d24f65
+Create Date: 2026-10-18 12:00:00.000000
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# Identificadores da revisão
+revision = 'f6b8d0e35a76'
+down_revision = 'e5a7c9d24f65'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        'frequencias',
+        sa.Column('id', sa.BigInteger().with_variant(sa.Integer(), 'sqlite'), nullable=False),
+        sa.Column('fk_aula', sa.Integer(), nullable=False),
+        sa.Column('fk_aluno', sa.Integer(), nullable=False),
+        sa.Column('data', sa.Date(), nullable=False),
+        sa.Column('presente', sa.Boolean(), nullable=False),
+        sa.Column('registrado_em', sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(['fk_aula'], ['aulas.id'], name='fk_frequencia_aula'),
+        sa.ForeignKeyConstraint(['fk_aluno'], ['alunos.id'], name='fk_frequencia_aluno'),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('fk_aula', 'data', 'fk_aluno', name='uq_frequencias_aula_data_aluno')
+    )
+    op.create_index('ix_frequencias_aluno_data', 'frequencias', ['fk_aluno', 'data'], unique=False)
+
+    op.create_table(
+        'frequencias_mensais',
+        sa.Column('fk_aluno', sa.Integer(), nullable=False),
+        sa.Column('fk_aula', sa.Integer(), nullable=False),
+        sa.Column('mes', sa.Date(), nullable=False),
+        sa.Column('presencas', sa.Integer(), nullable=False),
+        sa.Column('faltas', sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(['fk_aluno'], ['alunos.id'], name='fk_frequencia_mensal_aluno'),
+        sa.ForeignKeyConstraint(['fk_aula'], ['aulas.id'], name='fk_frequencia_mensal_aula'),
+        sa.PrimaryKeyConstraint('fk_aluno', 'fk_aula', 'mes')
+    )
+    op.create_index('ix_frequencias_mensais_mes', 'frequencias_mensais', ['mes'], unique=False)
+
+
+def downgrade():
+    op.drop_index('ix_frequencias_mensais_mes', table_name='frequencias_mensais')
+    op.drop_table('frequencias_mensais')
+    op.drop_index('ix_frequencias_aluno_data', table_name='frequencias')
+    op.drop_table('frequencias')
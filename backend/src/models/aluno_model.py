@@ -2,8 +2,17 @@ from ..database import db
 from datetime import datetime
 from .user_model import UserModel 
 
+# Ordem das faixas (da primeira à última graduação)
+FAIXAS = ['Branca', 'Amarela', 'Vermelha', 'Laranja', 'Verde', 'Roxa', 'Marrom', 'Preta']
+
 class AlunoModel(db.Model):
     __tablename__ = 'alunos' 
+    __table_args__ = (
+        # Índice da paginação por cursor (ORDER BY nome, id)
+        db.Index('ix_alunos_nome_id', 'nome', 'id'),
+        # Consulta de elegíveis (data_proxima_graduacao <= data do exame)
+        db.Index('ix_alunos_proxima_graduacao', 'data_proxima_graduacao', postgresql_where=db.text('ativo')),
+    )
 
     id = db.Column(db.Integer, primary_key=True)
     
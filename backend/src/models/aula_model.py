@@ -1,30 +1,104 @@
 from ..database import db
 from datetime import datetime
-from sqlalchemy.dialects.postgresql import ARRAY
+import unicodedata
+
+# Bit de cada dia em dias_mask, na ordem de date.weekday() (segunda = 0)
+DIAS_SEMANA = ['Segunda', 'Terça', 'Quarta', 'Quinta', 'Sexta', 'Sábado', 'Domingo']
+TODOS_OS_DIAS = (1 << len(DIAS_SEMANA)) - 1
+
+
+def _chave_dia(nome: str) -> str:
+    """'Terça' / 'terca' / 'TER' / 'terça-feira' -> 'ter'."""
+    sem_acento = unicodedata.normalize('NFKD', str(nome))
+    sem_acento = ''.join(c for c in sem_acento if not unicodedata.combining(c))
+    return sem_acento.strip().lower()[:3]
+
+
+_BIT_POR_DIA = {_chave_dia(dia): 1 << i for i, dia in enumerate(DIAS_SEMANA)}
+
+
+def bit_do_dia(nome: str) -> int:
+    """Bit do dia (aceita nome completo, sem acento ou abreviado). Lança ValueError."""
+    bit = _BIT_POR_DIA.get(_chave_dia(nome)) if isinstance(nome, str) and nome.strip() else None
+    if bit is None:
+        raise ValueError(f"Dia da semana inválido: {nome}")
+    return bit
+
+
+def dias_para_mascara(dias) -> int:
+    """Lista de nomes de dias -> máscara de bits. Lança ValueError se algum for inválido."""
+    mascara = 0
+    for dia in dias or []:
+        mascara |= bit_do_dia(dia)
+    return mascara
+
+
+def mascara_para_dias(mascara: int) -> list[str]:
+    """Máscara de bits -> nomes dos dias, de segunda a domingo."""
+    return [dia for i, dia in enumerate(DIAS_SEMANA) if (mascara or 0) & (1 << i)]
+
+
+def _indices_por_dia():
+    """Um índice parcial por dia (só PostgreSQL, como na migração e5a7c9d24f65):
+    "aulas de hoje" lê só as linhas do dia. Declarados aqui para o autogenerate
+    do ``flask db migrate`` não gerar DROP deles."""
+    return [
+        db.Index(
+            f'ix_aulas_dia_{_chave_dia(dia)}', 'horario_inicio',
+            postgresql_where=db.text(f'(dias_mask & {1 << i}) <> 0')
+        ).ddl_if(dialect='postgresql')
+        for i, dia in enumerate(DIAS_SEMANA)
+    ]
 
 
 class AulaModel(db.Model):
     __tablename__ = 'aulas'
+    __table_args__ = (
+        # Busca de conflitos: aulas de um professor que cruzam um intervalo
+        db.Index('ix_aulas_professor_horario', 'fk_professor', 'horario_inicio', 'horario_fim'),
+        *_indices_por_dia(),
+        db.CheckConstraint(f'dias_mask BETWEEN 0 AND {TODOS_OS_DIAS}', name='ck_aulas_dias_mask'),
+    )
 
     id = db.Column(db.Integer, primary_key=True)
     nome_turma = db.Column(db.String(100), nullable=False)
     modalidade = db.Column(db.String(50), nullable=False, default='Karatê')
-    dias_semana = db.Column(ARRAY(db.String(20)), nullable=False)
+    # Dias da aula como bits (segunda = 1, terça = 2, ... domingo = 64)
+    dias_mask = db.Column(db.Integer, nullable=False)
     horario_inicio = db.Column(db.Time, nullable=False)
     horario_fim = db.Column(db.Time, nullable=False)
+
     fk_professor = db.Column(
         db.Integer,
         db.ForeignKey('professores.id', name='fk_aula_professor'),
         nullable=False
     )
+
     professor = db.relationship('ProfessorModel', backref='aulas')
 
+    @property
+    def dias_semana(self):
+        return mascara_para_dias(self.dias_mask)
+
+    @dias_semana.setter
+    def dias_semana(self, dias):
+        self.dias_mask = dias_para_mascara(dias)
+
+    @classmethod
+    def filtro_dias(cls, mascara: int):
+        """Condição SQL "a aula acontece em algum dos dias de ``mascara``".
+
+        Com um único dia e o valor como literal, bate com os índices parciais
+        ``ix_aulas_dia_*`` (o planner só os usa se o predicado for idêntico).
+        """
+        return cls.dias_mask.op('&')(db.literal_column(str(int(mascara)))) != db.literal_column('0')
+
     def to_json(self):
         return {
             'id': self.id,
             'nome_turma': self.nome_turma,
             'modalidade': self.modalidade,
-            'dias_semana': self.dias_semana or [],
+            'dias_semana': self.dias_semana,
             'horario_inicio': self.horario_inicio.strftime('%H:%M'),
             'horario_fim': self.horario_fim.strftime('%H:%M'),
             'fk_professor': self.fk_professor,
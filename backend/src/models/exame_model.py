@@ -14,11 +14,17 @@ class ExameModel(db.Model):
     
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
 
+    # Encerrado: notas travadas e aprovados já promovidos (POST /exames/<id>/encerrar)
+    encerrado = db.Column(db.Boolean, nullable=False, default=False, server_default=db.false())
+    encerrado_em = db.Column(db.DateTime, nullable=True)
+
     def to_json(self):
         return {
             'id': self.id,
             'nome_evento': self.nome_evento,
             'data': self.data,
             'hora': self.hora,
-            'local': self.local
+            'local': self.local,
+            'encerrado': self.encerrado,
+            'encerrado_em': self.encerrado_em.isoformat() if self.encerrado_em else None
         }
\ No newline at end of file
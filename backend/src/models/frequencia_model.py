@@ -0,0 +1,59 @@
+from ..database import db
+from datetime import datetime
+
+# BIGINT no PostgreSQL (anos de chamadas diárias); no SQLite só INTEGER é autoincremento
+ID_FREQUENCIA = db.BigInteger().with_variant(db.Integer, 'sqlite')
+
+
+class FrequenciaModel(db.Model):
+    """Presença (ou falta) de um aluno em uma aula numa data. Só recebe INSERT."""
+    __tablename__ = 'frequencias'
+    __table_args__ = (
+        # Também atende "chamada da aula Y na data D" (prefixo fk_aula, data)
+        db.UniqueConstraint('fk_aula', 'data', 'fk_aluno', name='uq_frequencias_aula_data_aluno'),
+        # "Frequência do aluno X no período"
+        db.Index('ix_frequencias_aluno_data', 'fk_aluno', 'data'),
+    )
+
+    id = db.Column(ID_FREQUENCIA, primary_key=True)
+    fk_aula = db.Column(db.Integer, db.ForeignKey('aulas.id', name='fk_frequencia_aula'), nullable=False)
+    fk_aluno = db.Column(db.Integer, db.ForeignKey('alunos.id', name='fk_frequencia_aluno'), nullable=False)
+    data = db.Column(db.Date, nullable=False)
+    presente = db.Column(db.Boolean, nullable=False, default=True)
+    registrado_em = db.Column(db.DateTime, default=datetime.utcnow)
+
+    def to_json(self):
+        return {
+            'id': self.id,
+            'fk_aula': self.fk_aula,
+            'fk_aluno': self.fk_aluno,
+            'data': self.data.isoformat() if self.data else None,
+            'presente': self.presente,
+            'registrado_em': self.registrado_em.isoformat() if self.registrado_em else None
+        }
+
+
+class FrequenciaMensalModel(db.Model):
+    """Totais por aluno, aula e mês, atualizados junto com cada chamada.
+
+    Relatórios de meses inteiros leem daqui em vez de varrer ``frequencias``.
+    """
+    __tablename__ = 'frequencias_mensais'
+    __table_args__ = (
+        db.Index('ix_frequencias_mensais_mes', 'mes'),
+    )
+
+    fk_aluno = db.Column(db.Integer, db.ForeignKey('alunos.id', name='fk_frequencia_mensal_aluno'), primary_key=True)
+    fk_aula = db.Column(db.Integer, db.ForeignKey('aulas.id', name='fk_frequencia_mensal_aula'), primary_key=True)
+    mes = db.Column(db.Date, primary_key=True)  # sempre o dia 1 do mês
+    presencas = db.Column(db.Integer, nullable=False, default=0)
+    faltas = db.Column(db.Integer, nullable=False, default=0)
+
+    def to_json(self):
+        return {
+            'fk_aluno': self.fk_aluno,
+            'fk_aula': self.fk_aula,
+            'mes': self.mes.strftime('%Y-%m'),
+            'presencas': self.presencas,
+            'faltas': self.faltas
+        }
@@ -4,7 +4,7 @@ class InscricaoModel(db.Model):
     __tablename__ = 'inscricoes'
 
     id = db.Column(db.Integer, primary_key=True)
-    fk_exame = db.Column(db.Integer, db.ForeignKey('exames.id'), nullable=False)
+    fk_exame = db.Column(db.Integer, db.ForeignKey('exames.id'), nullable=False, index=True)
     fk_aluno = db.Column(db.Integer, db.ForeignKey('alunos.id'), nullable=False)
     
     nota_kihon = db.Column(db.Float, default=0.0)
@@ -14,6 +14,9 @@ class InscricaoModel(db.Model):
     media_final = db.Column(db.Float, default=0.0)
     aprovado = db.Column(db.Boolean, default=False)
     observacao = db.Column(db.String(255), nullable=True)
+    # Preenchidas ao encerrar o exame (histórico da promoção)
+    faixa_anterior = db.Column(db.String(50), nullable=True)
+    faixa_nova = db.Column(db.String(50), nullable=True)
 
     # Relacionamentos para facilitar pegar o nome do aluno depois
     aluno = db.relationship('AlunoModel', backref='inscricoes')
@@ -31,5 +34,7 @@ class InscricaoModel(db.Model):
             },
             "media": self.media_final,
             "aprovado": self.aprovado,
-            "observacao": self.observacao
+            "observacao": self.observacao,
+            "faixa_anterior": self.faixa_anterior,
+            "faixa_nova": self.faixa_nova
         }
\ No newline at end of file
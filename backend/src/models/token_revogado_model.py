@@ -0,0 +1,19 @@
+from ..database import db
+from datetime import datetime
+
+
+class TokenRevogadoModel(db.Model):
+    """Token JWT revogado antes de expirar.
+
+    Com ``jti`` a linha revoga só aquele token (logout). Sem ``jti`` revoga
+    todos os tokens de ``fk_usuario`` emitidos até ``revogado_em`` (professor
+    inativado, "sair de todos os dispositivos"). A linha pode ser apagada
+    depois de ``expira_em``: nenhum token que ela cobre ainda é aceito.
+    """
+    __tablename__ = 'tokens_revogados'
+
+    id = db.Column(db.Integer, primary_key=True)
+    jti = db.Column(db.String(36), unique=True, nullable=True)
+    fk_usuario = db.Column(db.Integer, nullable=True, index=True)
+    revogado_em = db.Column(db.DateTime, nullable=False, default=datetime.utcnow, index=True)
+    expira_em = db.Column(db.DateTime, nullable=False, index=True)
@@ -1,5 +1,5 @@
 from ..database import db
-from werkzeug.security import generate_password_hash, check_password_hash
+from ..services.hash_service import gerar_hash, verificar_hash
 
 class UserModel(db.Model):
     __tablename__ = 'usuarios' 
@@ -11,10 +11,10 @@ class UserModel(db.Model):
     nivel_acesso = db.Column(db.String(50), default='aluno')
 
     def set_password(self, senha):
-        self.senha_hash = generate_password_hash(senha)
+        self.senha_hash = gerar_hash(senha)
 
     def check_password(self, senha):
-        return check_password_hash(self.senha_hash, senha)
+        return verificar_hash(self.senha_hash, senha)
 
     def to_json(self):
         return {
@@ -0,0 +1,141 @@
+"""Grade semanal das aulas (JSON) e feed iCalendar para assinatura no celular.
+
+As duas saídas são montadas a partir de um único SELECT (aulas + nome do
+professor) e cacheadas pela versão da coleção ``aulas`` do cache de
+respostas, que toda escrita em aulas/professores invalida.
+"""
+from datetime import date, datetime, timedelta
+
+from ..database import db
+from ..models.aula_model import AulaModel, DIAS_SEMANA
+from ..models.professor_model import ProfessorModel
+
+SIGLAS = ['seg', 'ter', 'qua', 'qui', 'sex', 'sab', 'dom']
+BYDAY_ICAL = ['MO', 'TU', 'WE', 'TH', 'FR', 'SA', 'SU']
+FUSO_HORARIO = 'America/Sao_Paulo'
+DOMINIO_UID = 'gestao-karate'
+
+
+def _consultar_aulas():
+    return (
+        db.session.query(
+            AulaModel.id,
+            AulaModel.nome_turma,
+            AulaModel.modalidade,
+            AulaModel.dias_mask,
+            AulaModel.horario_inicio,
+            AulaModel.horario_fim,
+            AulaModel.fk_professor,
+            ProfessorModel.nome.label('professor_nome')
+        )
+        .join(ProfessorModel, ProfessorModel.id == AulaModel.fk_professor)
+        .order_by(AulaModel.horario_inicio, AulaModel.horario_fim, AulaModel.nome_turma)
+        .all()
+    )
+
+
+def montar_grade():
+    """Aulas agrupadas por dia da semana e por faixa de horário (início–fim).
+
+    ``horarios`` lista todas as faixas da semana, na ordem, para o frontend
+    montar as linhas da grade sem recalcular nada.
+    """
+    dias = [{'dia': nome, 'sigla': sigla, 'horarios': []} for nome, sigla in zip(DIAS_SEMANA, SIGLAS)]
+    faixas = {}
+
+    for aula in _consultar_aulas():
+        inicio, fim = aula.horario_inicio.strftime('%H:%M'), aula.horario_fim.strftime('%H:%M')
+        faixas[(inicio, fim)] = None
+        item = {
+            'id': aula.id,
+            'nome_turma': aula.nome_turma,
+            'modalidade': aula.modalidade,
+            'fk_professor': aula.fk_professor,
+            'professor_nome': aula.professor_nome,
+        }
+        for i, dia in enumerate(dias):
+            if not aula.dias_mask & (1 << i):
+                continue
+            # As linhas chegam ordenadas por horário: basta olhar a última faixa do dia
+            horarios = dia['horarios']
+            if not horarios or (horarios[-1]['inicio'], horarios[-1]['fim']) != (inicio, fim):
+                horarios.append({'inicio': inicio, 'fim': fim, 'aulas': []})
+            horarios[-1]['aulas'].append(item)
+
+    return {
+        'horarios': [{'inicio': inicio, 'fim': fim} for inicio, fim in faixas],
+        'dias': dias,
+    }
+
+
+# ==================== ICALENDAR ====================
+def _escapar(texto):
+    """Escapa texto conforme a RFC 5545 (\\, ; , e quebras de linha)."""
+    return (str(texto or '').replace('\\', '\\\\').replace(';', '\\;')
+            .replace(',', '\\,').replace('\r\n', '\\n').replace('\n', '\\n'))
+
+
+def _dobrar(linha):
+    """Quebra linhas com mais de 75 octetos (continuação começa com espaço)."""
+    bruto = linha.encode('utf-8')
+    if len(bruto) <= 75:
+        return [linha]
+    partes, atual = [], ''
+    for caractere in linha:
+        limite = 75 if not partes else 74
+        if len((atual + caractere).encode('utf-8')) > limite:
+            partes.append(atual)
+            atual = ''
+        atual += caractere
+    partes.append(atual)
+    return [partes[0]] + [' ' + parte for parte in partes[1:]]
+
+
+def gerar_ical(nome_calendario='Aulas de Karatê', hoje=None):
+    """Feed .ics com um evento semanal recorrente (RRULE) por aula."""
+    hoje = hoje or date.today()
+    segunda = hoje - timedelta(days=hoje.weekday())
+    carimbo = datetime.utcnow().strftime('%Y%m%dT%H%M%SZ')
+
+    linhas = [
+        'BEGIN:VCALENDAR',
+        'VERSION:2.0',
+        f'PRODID:-//{DOMINIO_UID}//Agenda de aulas//PT-BR',
+        'CALSCALE:GREGORIAN',
+        'METHOD:PUBLISH',
+        f'X-WR-CALNAME:{_escapar(nome_calendario)}',
+        f'X-WR-TIMEZONE:{FUSO_HORARIO}',
+        # Sem horário de verão desde 2019: um único STANDARD em -03:00
+        'BEGIN:VTIMEZONE',
+        f'TZID:{FUSO_HORARIO}',
+        'BEGIN:STANDARD',
+        'DTSTART:19700101T000000',
+        'TZOFFSETFROM:-0300',
+        'TZOFFSETTO:-0300',
+        'TZNAME:-03',
+        'END:STANDARD',
+        'END:VTIMEZONE',
+    ]
+
+    for aula in _consultar_aulas():
+        indices = [i for i in range(len(DIAS_SEMANA)) if aula.dias_mask & (1 << i)]
+        if not indices:
+            continue
+        # Primeira ocorrência: o primeiro dia da aula na semana atual
+        primeiro_dia = segunda + timedelta(days=indices[0])
+        inicio = datetime.combine(primeiro_dia, aula.horario_inicio)
+        fim = datetime.combine(primeiro_dia, aula.horario_fim)
+        linhas += [
+            'BEGIN:VEVENT',
+            f'UID:aula-{aula.id}@{DOMINIO_UID}',
+            f'DTSTAMP:{carimbo}',
+            f'DTSTART;TZID={FUSO_HORARIO}:{inicio:%Y%m%dT%H%M%S}',
+            f'DTEND;TZID={FUSO_HORARIO}:{fim:%Y%m%dT%H%M%S}',
+            f"RRULE:FREQ=WEEKLY;BYDAY={','.join(BYDAY_ICAL[i] for i in indices)}",
+            f'SUMMARY:{_escapar(aula.nome_turma)}',
+            f'DESCRIPTION:{_escapar(f"{aula.modalidade} com {aula.professor_nome}")}',
+            'END:VEVENT',
+        ]
+
+    linhas.append('END:VCALENDAR')
+    return '\r\n'.join(parte for linha in linhas for parte in _dobrar(linha)) + '\r\n'
@@ -0,0 +1,146 @@
+"""Autorização por papel (admin, professor, aluno) nas rotas protegidas.
+
+O ``nivel`` gravado no token no login pode ficar velho: o usuário muda de
+papel ou o professor é inativado enquanto o token ainda vale. Por isso
+``papel_requerido`` confere o papel e a situação *atuais* do usuário, que
+ficam em um cache por processo (LRU com TTL) — a checagem não faz ida ao
+banco a cada requisição, só na primeira de cada usuário dentro do TTL.
+
+Quem altera usuário ou professor chama ``autorizacao.invalidar(usuario_id)``.
+Com vários workers do gunicorn cada um tem seu cache: nos outros processos
+a mudança vale em até ``AUTH_CACHE_TTL`` segundos.
+"""
+import os
+import threading
+import time
+from collections import OrderedDict
+from functools import wraps
+
+from flask import current_app, jsonify
+from flask_jwt_extended import get_jwt_identity, verify_jwt_in_request
+
+from ..database import db
+from ..models.professor_model import ProfessorModel
+from ..models.user_model import UserModel
+
+PAPEIS = ('admin', 'professor', 'aluno')
+MAX_ITENS_PADRAO = 1024
+TTL_PADRAO = 60  # segundos
+
+
+class _CachePapeis:
+    """usuario_id -> (nivel, ativo), ou None para usuário inexistente."""
+
+    def __init__(self, max_itens, ttl):
+        self.max_itens = max_itens
+        self.ttl = ttl
+        self.itens = OrderedDict()
+        self.lock = threading.Lock()
+
+    def obter(self, usuario_id):
+        """Devolve ``(encontrado, situacao)``; itens vencidos contam como ausentes."""
+        agora = time.monotonic()
+        with self.lock:
+            item = self.itens.get(usuario_id)
+            if item is None:
+                return False, None
+            situacao, expira_em = item
+            if self.ttl and agora > expira_em:
+                del self.itens[usuario_id]
+                return False, None
+            self.itens.move_to_end(usuario_id)
+            return True, situacao
+
+    def guardar(self, usuario_id, situacao):
+        with self.lock:
+            self.itens[usuario_id] = (situacao, time.monotonic() + self.ttl)
+            self.itens.move_to_end(usuario_id)
+            while len(self.itens) > self.max_itens:
+                self.itens.popitem(last=False)
+
+    def invalidar(self, usuario_id):
+        with self.lock:
+            self.itens.pop(usuario_id, None)
+
+    def limpar(self):
+        with self.lock:
+            self.itens.clear()
+
+
+def consultar_situacao(usuario_id):
+    """(nivel, ativo) do usuário direto no banco; None se não existir.
+
+    A conta de um professor acompanha o cadastro de professor: inativar o
+    professor desativa o login dele.
+    """
+    linha = (
+        db.session.query(UserModel.nivel_acesso, ProfessorModel.ativo)
+        .outerjoin(ProfessorModel, ProfessorModel.fk_usuario == UserModel.id)
+        .filter(UserModel.id == usuario_id)
+        .first()
+    )
+    if linha is None:
+        return None
+    nivel, professor_ativo = linha
+    return nivel, professor_ativo is not False
+
+
+class ResolvedorPapeis:
+    """Extensão Flask (mesmo padrão do ``cache``: instância global + init_app)."""
+
+    def init_app(self, app):
+        max_itens = int(os.getenv('AUTH_CACHE_MAX_ITENS', MAX_ITENS_PADRAO))
+        ttl = float(os.getenv('AUTH_CACHE_TTL', TTL_PADRAO))
+        app.extensions['cache_papeis'] = _CachePapeis(max_itens, ttl)
+
+    @property
+    def _cache(self):
+        return current_app.extensions['cache_papeis']
+
+    def situacao(self, usuario_id):
+        """(nivel, ativo) do usuário, do cache ou do banco na primeira vez."""
+        encontrado, situacao = self._cache.obter(usuario_id)
+        if not encontrado:
+            situacao = consultar_situacao(usuario_id)
+            self._cache.guardar(usuario_id, situacao)
+        return situacao
+
+    def invalidar(self, *usuarios_ids):
+        for usuario_id in usuarios_ids:
+            self._cache.invalidar(usuario_id)
+
+    def limpar(self):
+        self._cache.limpar()
+
+
+autorizacao = ResolvedorPapeis()
+
+
+def papel_requerido(*papeis):
+    """Substitui ``@jwt_required()``: exige token válido, usuário existente e
+    ativo e, se ``papeis`` for informado, um desses níveis de acesso.
+
+    Responde 401 para usuário inexistente/inativo e 403 para nível sem
+    permissão.
+    """
+    desconhecidos = set(papeis) - set(PAPEIS)
+    if desconhecidos:
+        raise ValueError(f"Papéis desconhecidos: {', '.join(sorted(desconhecidos))}")
+
+    def decorador(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            verify_jwt_in_request()
+            try:
+                usuario_id = int(get_jwt_identity())
+            except (TypeError, ValueError):
+                return jsonify({'message': 'Token inválido.'}), 401
+
+            situacao = autorizacao.situacao(usuario_id)
+            if situacao is None or not situacao[1]:
+                return jsonify({'message': 'Usuário inexistente ou inativo.'}), 401
+            if papeis and situacao[0] not in papeis:
+                return jsonify({'message': 'Acesso negado para o seu nível de acesso.'}), 403
+            return view(*args, **kwargs)
+        return wrapper
+    return decorador
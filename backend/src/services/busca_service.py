@@ -0,0 +1,126 @@
+"""Busca aproximada (sem acento, tolerante a erro de digitação) de alunos.
+
+No PostgreSQL usa pg_trgm + unaccent com índice GIN (ver migração
+``c3e5a7b92d43``). Em outros bancos (SQLite dos testes) calcula a mesma
+similaridade por trigramas em memória.
+"""
+import heapq
+import re
+import unicodedata
+
+from sqlalchemy import case, func, literal, or_, select
+
+from ..database import db
+from ..models.aluno_model import AlunoModel
+
+LIMITE_PADRAO = 20
+LIMITE_MAXIMO = 100
+# Abaixo do padrão do pg_trgm (0.6) para tolerar um erro de digitação por palavra
+LIMIAR_SIMILARIDADE = 0.4
+MIN_DIGITOS_CPF = 3
+
+
+def normalizar(texto: str) -> str:
+    """Minúsculas, sem acentos e com espaços simples ("João " -> "joao")."""
+    sem_acento = unicodedata.normalize('NFKD', texto or '')
+    sem_acento = ''.join(c for c in sem_acento if not unicodedata.combining(c))
+    return ' '.join(sem_acento.lower().split())
+
+
+def trigramas(texto: str) -> set[str]:
+    """Trigramas no formato do pg_trgm (cada palavra com "  " antes e " " depois)."""
+    resultado = set()
+    for palavra in re.findall(r'\w+', texto):
+        com_bordas = f'  {palavra} '
+        resultado.update(com_bordas[i:i + 3] for i in range(len(com_bordas) - 2))
+    return resultado
+
+
+def similaridade(a: str, b: str) -> float:
+    """Índice de Jaccard entre os trigramas de ``a`` e ``b``."""
+    ta, tb = trigramas(a), trigramas(b)
+    if not ta or not tb:
+        return 0.0
+    return len(ta & tb) / len(ta | tb)
+
+
+def similaridade_palavra(termo: str, texto: str) -> float:
+    """Aproxima ``word_similarity`` do pg_trgm: melhor trecho de ``texto``
+    (palavras consecutivas) comparado ao ``termo``."""
+    palavras = texto.split()
+    tamanho = max(1, len(termo.split()))
+    if len(palavras) <= tamanho:
+        return similaridade(termo, texto)
+    return max(
+        similaridade(termo, ' '.join(palavras[i:i + tamanho]))
+        for i in range(len(palavras) - tamanho + 1)
+    )
+
+
+def _digitos(texto: str) -> str:
+    return re.sub(r'\D', '', texto or '')
+
+
+def _buscar_postgres(termo_norm, digitos, limite):
+    # Vale só para a transação corrente (is_local=true)
+    db.session.execute(select(func.set_config(
+        'pg_trgm.word_similarity_threshold', str(LIMIAR_SIMILARIDADE), True
+    )))
+    nome_norm = func.f_unaccent(func.lower(AlunoModel.nome))
+    filtros = [literal(termo_norm).op('<%')(nome_norm)]
+    if digitos:
+        filtros.append(AlunoModel.cpf.like(f'{digitos}%'))
+        relevancia = case(
+            (AlunoModel.cpf.like(f'{digitos}%'), 1.0),
+            else_=func.word_similarity(termo_norm, nome_norm)
+        )
+    else:
+        relevancia = func.word_similarity(termo_norm, nome_norm)
+
+    linhas = (
+        db.session.query(AlunoModel, relevancia.label('relevancia'))
+        .filter(AlunoModel.ativo.is_(True), or_(*filtros))
+        .order_by(relevancia.desc(), AlunoModel.nome)
+        .limit(limite)
+        .all()
+    )
+    return [(aluno, float(score)) for aluno, score in linhas]
+
+
+def _buscar_em_memoria(termo_norm, digitos, limite):
+    # Lê só as colunas necessárias para pontuar; as entidades vêm depois, por id
+    candidatos = (
+        db.session.query(AlunoModel.id, AlunoModel.nome, AlunoModel.cpf)
+        .filter(AlunoModel.ativo.is_(True))
+        .all()
+    )
+    pontuados = []
+    for aluno_id, nome, cpf in candidatos:
+        if digitos and (cpf or '').startswith(digitos):
+            score = 1.0
+        elif termo_norm:
+            score = similaridade_palavra(termo_norm, normalizar(nome))
+        else:
+            continue
+        if score >= LIMIAR_SIMILARIDADE:
+            pontuados.append((score, normalizar(nome), aluno_id))
+
+    melhores = heapq.nsmallest(limite, pontuados, key=lambda p: (-p[0], p[1]))
+    alunos = {a.id: a for a in AlunoModel.query.filter(AlunoModel.id.in_([p[2] for p in melhores])).all()}
+    return [(alunos[aluno_id], score) for score, _, aluno_id in melhores]
+
+
+def buscar_alunos(termo: str, limite: int = LIMITE_PADRAO) -> list[tuple[AlunoModel, float]]:
+    """Alunos ativos que casam com ``termo`` (nome aproximado ou prefixo de CPF),
+    do mais para o menos relevante."""
+    termo_norm = normalizar(termo)
+    digitos = _digitos(termo)
+    if len(digitos) < MIN_DIGITOS_CPF:
+        digitos = ''
+    if not termo_norm:
+        return []
+    limite = max(1, min(limite, LIMITE_MAXIMO))
+
+    if db.engine.dialect.name == 'postgresql':
+        return _buscar_postgres(termo_norm, digitos, limite)
+    return _buscar_em_memoria(termo_norm, digitos, limite)
@@ -0,0 +1,147 @@
+"""Cache de respostas das listagens com ETag e invalidação por escrita.
+
+Cada coleção (alunos, professores, aulas, exames) tem um contador de versão
+que as rotas de escrita incrementam com ``invalidar``. Coleções podem ser
+por registro (``exames:42``), para que a escrita em um exame não descarte as
+respostas dos outros. O ETag de uma
+listagem depende da coleção, da versão e da URL, então um ``If-None-Match``
+igual é respondido com 304 sem consultar o banco. O corpo já serializado
+fica em um LRU limitado (``CACHE_MAX_ITENS``).
+
+O estado é por processo: com vários workers do gunicorn cada um tem seu
+contador. Para limitar a defasagem entre workers, uma versão expira após
+``CACHE_TTL`` segundos (0 desativa a expiração).
+"""
+import hashlib
+import os
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from functools import wraps
+
+from flask import current_app, make_response, request
+
+MAX_ITENS_PADRAO = 256
+TTL_PADRAO = 300  # segundos
+
+
+def pede_stream() -> bool:
+    """``?stream=1`` (ou ``true``/``sim``): resposta em stream, fora do cache."""
+    return request.args.get('stream', '').lower() in ('1', 'true', 'sim')
+
+
+class _EstadoCache:
+    def __init__(self, max_itens, ttl):
+        self.max_itens = max_itens
+        self.ttl = ttl
+        # Diferencia os ETags de processos diferentes (contadores independentes)
+        self.token_processo = uuid.uuid4().hex
+        self.versoes = {}
+        self.respostas = OrderedDict()
+        self.lock = threading.Lock()
+
+    def versao(self, colecao):
+        agora = time.monotonic()
+        with self.lock:
+            numero, desde = self.versoes.get(colecao, (0, agora))
+            if self.ttl and agora - desde > self.ttl:
+                numero, desde = numero + 1, agora
+            self.versoes[colecao] = (numero, desde)
+            return numero
+
+    def invalidar(self, colecao):
+        with self.lock:
+            numero, _ = self.versoes.get(colecao, (0, 0))
+            self.versoes[colecao] = (numero + 1, time.monotonic())
+
+    def obter(self, chave):
+        with self.lock:
+            item = self.respostas.get(chave)
+            if item is not None:
+                self.respostas.move_to_end(chave)
+            return item
+
+    def guardar(self, chave, item):
+        with self.lock:
+            self.respostas[chave] = item
+            self.respostas.move_to_end(chave)
+            while len(self.respostas) > self.max_itens:
+                self.respostas.popitem(last=False)
+
+
+class CacheRespostas:
+    """Extensão Flask (mesmo padrão de ``db``/``jwt``: instância global + init_app)."""
+
+    def init_app(self, app):
+        max_itens = int(os.getenv('CACHE_MAX_ITENS', MAX_ITENS_PADRAO))
+        ttl = float(os.getenv('CACHE_TTL', TTL_PADRAO))
+        app.extensions['cache_respostas'] = _EstadoCache(max_itens, ttl)
+
+    @property
+    def _estado(self):
+        return current_app.extensions['cache_respostas']
+
+    def versao(self, colecao):
+        return self._estado.versao(colecao)
+
+    def invalidar(self, *colecoes):
+        for colecao in colecoes:
+            self._estado.invalidar(colecao)
+
+    def listagem(self, colecao, max_age=None):
+        """Decora uma rota GET de listagem da ``colecao``.
+
+        ``colecao`` pode ser uma tupla (a resposta depende de todas) e aceita
+        parâmetros da rota entre chaves, como ``'exames:{exame_id}'``.
+
+        Deve ficar abaixo de ``@papel_requerido(...)`` para a autenticação
+        continuar valendo. Respostas em stream (``?stream=1``) não passam pelo cache.
+        Com ``max_age`` (feeds que apps de calendário consultam sem revalidar)
+        o cliente pode reusar a resposta por esse tempo em segundos; continua
+        ``private``, fora de caches compartilhados.
+        """
+        colecoes = (colecao,) if isinstance(colecao, str) else tuple(colecao)
+
+        def decorador(view):
+            @wraps(view)
+            def wrapper(*args, **kwargs):
+                if pede_stream():
+                    return view(*args, **kwargs)
+
+                estado = self._estado
+                # A versão é lida antes da consulta: uma escrita concorrente
+                # muda a versão e o corpo antigo nunca mais é servido
+                nomes = tuple(nome.format(**kwargs) for nome in colecoes)
+                versao = tuple(estado.versao(nome) for nome in nomes)
+                chave = (nomes, versao, request.full_path)
+                etag = hashlib.sha1(
+                    f"{estado.token_processo}:{nomes}:{versao}:{request.full_path}".encode()
+                ).hexdigest()
+
+                if etag in request.if_none_match:
+                    resposta = current_app.response_class(status=304)
+                else:
+                    item = estado.obter(chave)
+                    if item is not None:
+                        corpo, mimetype = item
+                        resposta = current_app.response_class(corpo, mimetype=mimetype)
+                    else:
+                        resposta = make_response(view(*args, **kwargs))
+                        if resposta.status_code != 200 or resposta.is_streamed:
+                            return resposta
+                        estado.guardar(chave, (resposta.get_data(), resposta.mimetype))
+
+                resposta.set_etag(etag)
+                resposta.cache_control.private = True
+                if max_age is not None:
+                    resposta.cache_control.max_age = max_age
+                else:
+                    # O navegador guarda a resposta mas sempre revalida com If-None-Match
+                    resposta.cache_control.no_cache = True
+                return resposta
+            return wrapper
+        return decorador
+
+
+cache = CacheRespostas()
@@ -0,0 +1,212 @@
+"""Ranking e estatísticas de um exame, calculados no banco.
+
+Posição, posição na faixa e percentil saem de funções de janela
+(``rank``/``percent_rank``); médias por critério, aprovação por faixa e o
+histórico entre exames saem de agregações. Nenhuma inscrição vira objeto
+ORM: cada consulta traz só as colunas do resultado.
+
+A faixa considerada é a que o aluno tinha no exame: ``faixa_anterior`` nos
+aprovados de exames encerrados (já promovidos) e a faixa atual nos demais.
+"""
+from sqlalchemy import and_, case, func, or_, select
+
+from ..database import db
+from ..models.aluno_model import AlunoModel, FAIXAS
+from ..models.exame_model import ExameModel
+from ..models.inscricao_model import InscricaoModel
+
+HISTORICO_PADRAO = 5
+HISTORICO_MAXIMO = 50
+# Chave no JSON -> coluna de InscricaoModel (mesma ordem da banca)
+CRITERIOS = {
+    'kihon': InscricaoModel.nota_kihon,
+    'kata': InscricaoModel.nota_kata,
+    'kumite': InscricaoModel.nota_kumite,
+    'gerais': InscricaoModel.nota_gerais,
+}
+
+
+def _arredondar(valor, casas=2):
+    return None if valor is None else round(float(valor), casas)
+
+
+def _faixa_no_exame():
+    return func.coalesce(InscricaoModel.faixa_anterior, AlunoModel.grau_atual)
+
+
+def _taxa_aprovacao():
+    """Percentual de aprovados (0–100) do grupo agregado."""
+    return func.avg(case((InscricaoModel.aprovado.is_(True), 100.0), else_=0.0))
+
+
+def _ranking(exame_id):
+    media = func.coalesce(InscricaoModel.media_final, 0.0)
+    faixa = _faixa_no_exame()
+    posicao = func.rank().over(order_by=media.desc())
+    consulta = (
+        select(
+            InscricaoModel.id,
+            InscricaoModel.fk_aluno,
+            AlunoModel.nome,
+            faixa.label('faixa'),
+            media.label('media'),
+            InscricaoModel.aprovado,
+            posicao.label('posicao'),
+            func.rank().over(partition_by=faixa, order_by=media.desc()).label('posicao_faixa'),
+            # Fração dos inscritos com média menor (0 para o último, 100 para o primeiro)
+            func.percent_rank().over(order_by=media).label('percentil'),
+        )
+        .join(AlunoModel, AlunoModel.id == InscricaoModel.fk_aluno)
+        .where(InscricaoModel.fk_exame == exame_id)
+        .order_by(posicao, AlunoModel.nome)
+    )
+    return [{
+        'inscricao_id': linha.id,
+        'aluno_id': linha.fk_aluno,
+        'aluno_nome': linha.nome,
+        'faixa': linha.faixa,
+        'media': _arredondar(linha.media, 1),
+        'aprovado': bool(linha.aprovado),
+        'posicao': linha.posicao,
+        'posicao_faixa': linha.posicao_faixa,
+        'percentil': _arredondar(linha.percentil * 100, 1),
+    } for linha in db.session.execute(consulta)]
+
+
+def _resumo_e_criterios(exame_id):
+    colunas = [
+        func.count(InscricaoModel.id),
+        func.sum(case((InscricaoModel.aprovado.is_(True), 1), else_=0)),
+        _taxa_aprovacao(),
+        func.avg(InscricaoModel.media_final),
+        func.min(InscricaoModel.media_final),
+        func.max(InscricaoModel.media_final),
+    ]
+    for coluna in CRITERIOS.values():
+        colunas += [func.avg(coluna), func.min(coluna), func.max(coluna)]
+
+    linha = db.session.execute(select(*colunas).where(InscricaoModel.fk_exame == exame_id)).one()
+    qtd, aprovados, taxa, media, minima, maxima = linha[:6]
+    resumo = {
+        'qtd_inscritos': qtd,
+        'qtd_aprovados': int(aprovados or 0),
+        'taxa_aprovacao': _arredondar(taxa, 1),
+        'media_geral': _arredondar(media),
+        'media_minima': _arredondar(minima),
+        'media_maxima': _arredondar(maxima),
+    }
+    criterios = {}
+    for i, chave in enumerate(CRITERIOS):
+        media, minima, maxima = linha[6 + 3 * i: 9 + 3 * i]
+        criterios[chave] = {'media': _arredondar(media), 'minima': _arredondar(minima), 'maxima': _arredondar(maxima)}
+    return resumo, criterios
+
+
+def _por_faixa(exame_id):
+    faixa = _faixa_no_exame().label('faixa')
+    peso_faixa = case(
+        {f.lower(): i for i, f in enumerate(FAIXAS)},
+        value=func.lower(faixa),
+        else_=len(FAIXAS)
+    )
+    consulta = (
+        select(
+            faixa,
+            func.count(InscricaoModel.id),
+            func.sum(case((InscricaoModel.aprovado.is_(True), 1), else_=0)),
+            _taxa_aprovacao(),
+            func.avg(InscricaoModel.media_final),
+        )
+        .join(AlunoModel, AlunoModel.id == InscricaoModel.fk_aluno)
+        .where(InscricaoModel.fk_exame == exame_id)
+        .group_by(faixa)
+        .order_by(func.min(peso_faixa), faixa)
+    )
+    return [{
+        'faixa': nome,
+        'qtd_inscritos': qtd,
+        'qtd_aprovados': int(aprovados or 0),
+        'taxa_aprovacao': _arredondar(taxa, 1),
+        'media': _arredondar(media),
+    } for nome, qtd, aprovados, taxa, media in db.session.execute(consulta)]
+
+
+def _historico(exame, limite):
+    """Este exame comparado aos exames encerrados até a data dele.
+
+    Só entram exames encerrados (notas travadas), então o histórico de um
+    exame muda apenas quando outro exame é encerrado, editado ou excluído.
+    """
+    por_exame = (
+        select(
+            ExameModel.id.label('exame_id'),
+            ExameModel.nome_evento,
+            ExameModel.data,
+            func.count(InscricaoModel.id).label('qtd_inscritos'),
+            func.avg(InscricaoModel.media_final).label('media'),
+            _taxa_aprovacao().label('taxa_aprovacao'),
+        )
+        .join(InscricaoModel, InscricaoModel.fk_exame == ExameModel.id)
+        # A data é texto ISO: a comparação léxica é cronológica
+        .where(or_(ExameModel.id == exame.id, and_(ExameModel.encerrado.is_(True), ExameModel.data <= exame.data)))
+        .group_by(ExameModel.id, ExameModel.nome_evento, ExameModel.data)
+        .subquery()
+    )
+    ordem = (por_exame.c.data, por_exame.c.exame_id)
+    anteriores = {'order_by': ordem, 'rows': (None, -1)}
+    janela = (
+        select(
+            por_exame,
+            func.avg(por_exame.c.media).over(**anteriores).label('media_historica'),
+            func.avg(por_exame.c.taxa_aprovacao).over(**anteriores).label('taxa_historica'),
+            func.lag(por_exame.c.media).over(order_by=ordem).label('media_anterior'),
+            func.rank().over(order_by=por_exame.c.media.desc()).label('posicao_media'),
+            func.count().over().label('total_exames'),
+        )
+        .subquery()
+    )
+    linhas = db.session.execute(
+        select(janela)
+        .where(or_(janela.c.data < exame.data, and_(janela.c.data == exame.data, janela.c.exame_id <= exame.id)))
+        .order_by(janela.c.data.desc(), janela.c.exame_id.desc())
+        .limit(limite + 1)
+    ).all()
+
+    atual = linhas[0] if linhas and linhas[0].exame_id == exame.id else None
+    if atual is None:  # exame sem inscritos
+        return {'exames': [], 'media_historica': None, 'taxa_historica': None,
+                'diferenca_media': None, 'diferenca_anterior': None, 'posicao_media': None, 'total_exames': 0}
+
+    def diferenca(referencia):
+        return None if referencia is None or atual.media is None else _arredondar(atual.media - referencia)
+
+    return {
+        'exames': [{
+            'exame_id': linha.exame_id,
+            'nome_evento': linha.nome_evento,
+            'data': linha.data,
+            'qtd_inscritos': linha.qtd_inscritos,
+            'media': _arredondar(linha.media),
+            'taxa_aprovacao': _arredondar(linha.taxa_aprovacao, 1),
+        } for linha in reversed(linhas)],
+        'media_historica': _arredondar(atual.media_historica),
+        'taxa_historica': _arredondar(atual.taxa_historica, 1),
+        'diferenca_media': diferenca(atual.media_historica),
+        'diferenca_anterior': diferenca(atual.media_anterior),
+        'posicao_media': atual.posicao_media,
+        'total_exames': atual.total_exames,
+    }
+
+
+def estatisticas_exame(exame, historico=HISTORICO_PADRAO):
+    """Ranking, resumo, médias por critério, aprovação por faixa e histórico
+    do ``exame``. ``historico`` limita quantos exames anteriores são listados."""
+    resumo, criterios = _resumo_e_criterios(exame.id)
+    return {
+        'exame': {'id': exame.id, 'nome_evento': exame.nome_evento, 'data': exame.data, 'encerrado': exame.encerrado},
+        'resumo': resumo,
+        'criterios': criterios,
+        'por_faixa': _por_faixa(exame.id),
+        'ranking': _ranking(exame.id),
+        'historico': _historico(exame, max(0, min(historico, HISTORICO_MAXIMO))),
+    }
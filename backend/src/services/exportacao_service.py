@@ -0,0 +1,142 @@
+"""Exportação de alunos e resultados de exame em CSV/XLSX.
+
+As linhas saem de um cursor no servidor (``yield_per`` liga o
+``stream_results`` no PostgreSQL) só com as colunas exportadas, então a
+memória fica constante qualquer que seja o tamanho da exportação.
+
+Textos que começam com ``=``, ``+``, ``-`` ou ``@`` saem com um apóstrofo na
+frente, para o Excel/LibreOffice não os executar como fórmula.
+"""
+import csv
+import io
+import tempfile
+
+from sqlalchemy import func, select
+
+from ..database import db
+from ..models.aluno_model import AlunoModel
+from ..models.inscricao_model import InscricaoModel
+
+TAMANHO_LOTE = 1000
+SEPARADOR_CSV = ';'  # o Excel em pt-BR abre direto com ponto e vírgula
+# Acima disso o XLSX vai para o disco em vez de ficar na memória
+LIMITE_XLSX_MEMORIA = 5 * 1024 * 1024
+
+COLUNAS_ALUNOS = [
+    ('ID', AlunoModel.id),
+    ('Nome', AlunoModel.nome),
+    ('CPF', AlunoModel.cpf),
+    ('Data de nascimento', AlunoModel.data_nascimento),
+    ('Sexo', AlunoModel.sexo),
+    ('Telefone', AlunoModel.telefone),
+    ('Responsável', AlunoModel.nome_pais),
+    ('Faixa', AlunoModel.grau_atual),
+    ('Última graduação', AlunoModel.data_ultima_graduacao),
+    ('Ativo', AlunoModel.ativo),
+]
+
+# Faixa em que o aluno prestou o exame: depois do encerramento os aprovados já
+# estão na faixa nova, e a de antes fica na inscrição
+FAIXA_NO_EXAME = func.coalesce(InscricaoModel.faixa_anterior, AlunoModel.grau_atual)
+INICIOS_FORMULA = ('=', '+', '-', '@', '\t', '\r')
+
+COLUNAS_RESULTADOS = [
+    ('Inscrição', InscricaoModel.id),
+    ('Aluno', AlunoModel.nome),
+    ('CPF', AlunoModel.cpf),
+    ('Faixa', FAIXA_NO_EXAME),
+    ('Kihon', InscricaoModel.nota_kihon),
+    ('Kata', InscricaoModel.nota_kata),
+    ('Kumite', InscricaoModel.nota_kumite),
+    ('Gerais', InscricaoModel.nota_gerais),
+    ('Média', InscricaoModel.media_final),
+    ('Aprovado', InscricaoModel.aprovado),
+    ('Observação', InscricaoModel.observacao),
+]
+
+
+def consulta_alunos(ativo=None, faixa=None):
+    """SELECT das colunas de ``COLUNAS_ALUNOS`` com os filtros da exportação."""
+    consulta = select(*[coluna for _, coluna in COLUNAS_ALUNOS])
+    if ativo is not None:
+        consulta = consulta.where(AlunoModel.ativo.is_(ativo))
+    if faixa:
+        consulta = consulta.where(func.lower(AlunoModel.grau_atual) == faixa.strip().lower())
+    return consulta.order_by(AlunoModel.nome, AlunoModel.id)
+
+
+def consulta_resultados(exame_id, aprovado=None, faixa=None):
+    """SELECT das notas de um exame (``COLUNAS_RESULTADOS``)."""
+    consulta = (
+        select(*[coluna for _, coluna in COLUNAS_RESULTADOS])
+        .join(AlunoModel, AlunoModel.id == InscricaoModel.fk_aluno)
+        .where(InscricaoModel.fk_exame == exame_id)
+    )
+    if aprovado is not None:
+        consulta = consulta.where(InscricaoModel.aprovado.is_(True) if aprovado else InscricaoModel.aprovado.isnot(True))
+    if faixa:
+        consulta = consulta.where(func.lower(FAIXA_NO_EXAME) == faixa.strip().lower())
+    return consulta.order_by(AlunoModel.nome, InscricaoModel.id)
+
+
+def _linhas(consulta):
+    resultado = db.session.execute(consulta.execution_options(yield_per=TAMANHO_LOTE))
+    try:
+        yield from resultado
+    finally:
+        resultado.close()
+
+
+def _escapar(valor):
+    """Neutraliza texto que a planilha leria como fórmula (injeção via CSV/XLSX)."""
+    if isinstance(valor, str) and valor.startswith(INICIOS_FORMULA):
+        return "'" + valor
+    return valor
+
+
+def _formatar(valor):
+    if isinstance(valor, bool):
+        return 'Sim' if valor else 'Não'
+    if hasattr(valor, 'isoformat'):
+        return valor.isoformat()
+    return '' if valor is None else _escapar(valor)
+
+
+def gerar_csv(colunas, consulta):
+    """Gera o CSV (com BOM, para o Excel reconhecer UTF-8) pedaço a pedaço."""
+    buffer = io.StringIO()
+    escritor = csv.writer(buffer, delimiter=SEPARADOR_CSV)
+
+    def esvaziar():
+        texto = buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+        return texto
+
+    escritor.writerow([titulo for titulo, _ in colunas])
+    yield '\ufeff' + esvaziar()
+    for i, linha in enumerate(_linhas(consulta), start=1):
+        escritor.writerow([_formatar(valor) for valor in linha])
+        if i % TAMANHO_LOTE == 0:
+            yield esvaziar()
+    yield esvaziar()
+
+
+def gerar_xlsx(colunas, consulta, titulo_planilha):
+    """Planilha XLSX em modo ``write_only`` do openpyxl (linhas não ficam na memória).
+
+    Devolve um arquivo temporário posicionado no início. Lança ImportError
+    se o openpyxl não estiver instalado.
+    """
+    from openpyxl import Workbook
+
+    planilha = Workbook(write_only=True)
+    aba = planilha.create_sheet(titulo_planilha[:31])
+    aba.append([titulo for titulo, _ in colunas])
+    for linha in _linhas(consulta):
+        aba.append([_escapar(valor) for valor in linha])
+
+    arquivo = tempfile.SpooledTemporaryFile(max_size=LIMITE_XLSX_MEMORIA)
+    planilha.save(arquivo)
+    arquivo.seek(0)
+    return arquivo
@@ -0,0 +1,179 @@
+"""Registro de frequência (chamada) e consolidação mensal.
+
+``frequencias`` só recebe INSERT. Cada chamada grava todas as linhas da
+turma num único INSERT em lote e, na mesma transação, soma presenças/faltas
+em ``frequencias_mensais`` (UPSERT), que é de onde saem os relatórios por mês.
+Em bancos sem ON CONFLICT (fora PostgreSQL e SQLite) confere antes as linhas
+que já existem.
+"""
+from datetime import date
+
+from sqlalchemy import case, delete, func, insert, select, update
+
+from ..database import db
+from ..models.aluno_model import AlunoModel
+from ..models.frequencia_model import FrequenciaModel, FrequenciaMensalModel
+
+
+def inicio_do_mes(dia: date) -> date:
+    return dia.replace(day=1)
+
+
+def _proximo_mes(mes: date) -> date:
+    return date(mes.year + mes.month // 12, mes.month % 12 + 1, 1)
+
+
+def _insert_dialeto(tabela):
+    """INSERT com ON CONFLICT do banco em uso (PostgreSQL ou SQLite); None nos demais."""
+    dialeto = db.session.get_bind().dialect.name
+    if dialeto == 'postgresql':
+        from sqlalchemy.dialects.postgresql import insert
+    elif dialeto == 'sqlite':
+        from sqlalchemy.dialects.sqlite import insert
+    else:
+        return None
+    return insert(tabela)
+
+
+def _inserir_novas(linhas):
+    """Grava as linhas de frequência que ainda não existem. Devolve [(fk_aluno, presente)]."""
+    stmt = _insert_dialeto(FrequenciaModel.__table__)
+    if stmt is not None:
+        # ON CONFLICT DO NOTHING + RETURNING: chamadas simultâneas da mesma
+        # turma não duplicam linhas nem somam duas vezes no mês
+        stmt = (
+            stmt.on_conflict_do_nothing(index_elements=['fk_aula', 'data', 'fk_aluno'])
+            .returning(FrequenciaModel.fk_aluno, FrequenciaModel.presente)
+        )
+        return [tuple(linha) for linha in db.session.execute(stmt, linhas)]
+
+    # Outros bancos: confere o que já existe e insere o resto. Uma chamada
+    # simultânea da mesma turma esbarra na chave única e falha inteira
+    aula_id, data = linhas[0]['fk_aula'], linhas[0]['data']
+    existentes = {aluno_id for (aluno_id,) in db.session.query(FrequenciaModel.fk_aluno).filter(
+        FrequenciaModel.fk_aula == aula_id, FrequenciaModel.data == data,
+        FrequenciaModel.fk_aluno.in_([linha['fk_aluno'] for linha in linhas])
+    )}
+    novas = [linha for linha in linhas if linha['fk_aluno'] not in existentes]
+    if novas:
+        db.session.execute(insert(FrequenciaModel), novas)
+    return [(linha['fk_aluno'], linha['presente']) for linha in novas]
+
+
+def _somar_mensal(aula_id, mes, inseridas):
+    """Soma as linhas recém-gravadas nos totais do mês (1 UPSERT em lote)."""
+    if not inseridas:
+        return
+    tabela = FrequenciaMensalModel.__table__
+    somas = [{
+        'fk_aluno': aluno_id, 'fk_aula': aula_id, 'mes': mes,
+        'presencas': 1 if presente else 0, 'faltas': 0 if presente else 1
+    } for aluno_id, presente in inseridas]
+
+    stmt = _insert_dialeto(tabela)
+    if stmt is None:
+        _somar_mensal_sem_upsert(aula_id, mes, somas)
+        return
+    stmt = stmt.on_conflict_do_update(
+        index_elements=['fk_aluno', 'fk_aula', 'mes'],
+        set_={
+            'presencas': tabela.c.presencas + stmt.excluded.presencas,
+            'faltas': tabela.c.faltas + stmt.excluded.faltas,
+        }
+    )
+    db.session.execute(stmt, somas)
+
+
+def _somar_mensal_sem_upsert(aula_id, mes, somas):
+    """Mesmo efeito do UPSERT: UPDATE nos totais existentes, INSERT nos novos."""
+    tabela = FrequenciaMensalModel.__table__
+    existentes = {aluno_id for (aluno_id,) in db.session.query(FrequenciaMensalModel.fk_aluno).filter(
+        FrequenciaMensalModel.fk_aula == aula_id, FrequenciaMensalModel.mes == mes,
+        FrequenciaMensalModel.fk_aluno.in_([soma['fk_aluno'] for soma in somas])
+    )}
+    for soma in somas:
+        if soma['fk_aluno'] in existentes:
+            db.session.execute(
+                update(tabela)
+                .where(tabela.c.fk_aluno == soma['fk_aluno'], tabela.c.fk_aula == aula_id, tabela.c.mes == mes)
+                .values(presencas=tabela.c.presencas + soma['presencas'], faltas=tabela.c.faltas + soma['faltas'])
+            )
+    novas = [soma for soma in somas if soma['fk_aluno'] not in existentes]
+    if novas:
+        db.session.execute(tabela.insert(), novas)
+
+
+def registrar_chamada(aula, data, presentes, ausentes):
+    """Grava a chamada da ``aula`` em ``data``. Devolve (gravados, relatorio).
+
+    O relatório tem um status por aluno: registrado, ja_registrado (a chamada
+    daquele aluno já existia — não é alterada), duplicado, inexistente,
+    inativo ou invalido. Não faz commit.
+    """
+    relatorio = []
+    pedidos = {}
+    for presente, ids in ((True, presentes), (False, ausentes)):
+        for bruto in ids:
+            try:
+                aluno_id = int(bruto)
+            except (TypeError, ValueError):
+                relatorio.append({'aluno_id': bruto, 'status': 'invalido'})
+                continue
+            if aluno_id in pedidos:
+                relatorio.append({'aluno_id': aluno_id, 'status': 'duplicado'})
+                continue
+            pedidos[aluno_id] = presente
+
+    if not pedidos:
+        return 0, relatorio
+
+    ativos = dict(
+        db.session.query(AlunoModel.id, AlunoModel.ativo).filter(AlunoModel.id.in_(list(pedidos)))
+    )
+    linhas = []
+    for aluno_id, presente in pedidos.items():
+        if aluno_id not in ativos:
+            relatorio.append({'aluno_id': aluno_id, 'status': 'inexistente'})
+        elif not ativos[aluno_id]:
+            relatorio.append({'aluno_id': aluno_id, 'status': 'inativo'})
+        else:
+            linhas.append({'fk_aula': aula.id, 'fk_aluno': aluno_id, 'data': data, 'presente': presente})
+
+    inseridas = []
+    if linhas:
+        inseridas = _inserir_novas(linhas)
+        _somar_mensal(aula.id, inicio_do_mes(data), inseridas)
+
+    gravados = {aluno_id for aluno_id, _ in inseridas}
+    for linha in linhas:
+        status = 'registrado' if linha['fk_aluno'] in gravados else 'ja_registrado'
+        relatorio.append({'aluno_id': linha['fk_aluno'], 'status': status, 'presente': linha['presente']})
+
+    return len(inseridas), relatorio
+
+
+def consolidar_mes(mes: date) -> int:
+    """Recalcula ``frequencias_mensais`` de ``mes`` a partir das linhas brutas.
+
+    Os totais já são mantidos a cada chamada; isto serve para reconstruí-los
+    (carga histórica, correção manual no banco). Não faz commit.
+    """
+    mes = inicio_do_mes(mes)
+    fim = _proximo_mes(mes)
+    db.session.execute(delete(FrequenciaMensalModel).where(FrequenciaMensalModel.mes == mes))
+
+    totais = db.session.execute(
+        select(
+            FrequenciaModel.fk_aluno,
+            FrequenciaModel.fk_aula,
+            func.sum(case((FrequenciaModel.presente.is_(True), 1), else_=0)),
+            func.sum(case((FrequenciaModel.presente.is_(True), 0), else_=1)),
+        )
+        .where(FrequenciaModel.data >= mes, FrequenciaModel.data < fim)
+        .group_by(FrequenciaModel.fk_aluno, FrequenciaModel.fk_aula)
+    ).all()
+    if totais:
+        db.session.execute(FrequenciaMensalModel.__table__.insert(), [{
+            'fk_aluno': aluno_id, 'fk_aula': aula_id, 'mes': mes, 'presencas': presencas, 'faltas': faltas
+        } for aluno_id, aula_id, presencas, faltas in totais])
+    return len(totais)
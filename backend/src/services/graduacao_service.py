@@ -0,0 +1,193 @@
+"""Cálculo da data em que cada aluno fica apto à próxima graduação.
+
+data_proxima_graduacao = a mais tardia entre
+  - data_ultima_graduacao + carência mínima da faixa atual, e
+  - data em que o aluno atinge a idade mínima da próxima faixa.
+
+Fica NULL na última faixa (Preta) e para faixas fora de ``FAIXAS``.
+``recalcular`` faz a conta dentro do banco, em um único UPDATE com CASE
+montado a partir das tabelas de carência e idade (PostgreSQL e SQLite), e
+aceita um filtro para refazer só os alunos afetados.
+
+Carências e idades são configuráveis por variável de ambiente, no formato
+``Faixa=valor`` separado por vírgulas:
+    GRADUACAO_CARENCIA_MESES="Branca=3,Amarela=4"
+    GRADUACAO_IDADE_MINIMA="Marrom=15,Preta=16"
+"""
+import calendar
+import os
+from datetime import date
+
+from sqlalchemy import Date, Integer, case, cast, func, update
+
+from ..database import db
+from ..models.aluno_model import AlunoModel, FAIXAS
+
+# Meses mínimos na faixa atual antes do próximo exame
+CARENCIA_MESES_PADRAO = {
+    'Branca': 3, 'Amarela': 4, 'Vermelha': 5, 'Laranja': 6,
+    'Verde': 8, 'Roxa': 10, 'Marrom': 12,
+}
+# Idade mínima (anos) para receber a faixa
+IDADE_MINIMA_PADRAO = {'Marrom': 14, 'Preta': 16}
+TAMANHO_LOTE = 1000
+
+
+def _ler_config(variavel, padrao):
+    """``Faixa=inteiro,Faixa=inteiro`` da variável de ambiente sobre o padrão."""
+    config = dict(padrao)
+    for item in os.getenv(variavel, '').split(','):
+        if '=' not in item:
+            continue
+        faixa, valor = item.split('=', 1)
+        config[faixa.strip().capitalize()] = int(valor)
+    return config
+
+
+def proxima_faixa(faixa):
+    """Faixa seguinte em ``FAIXAS`` (None na última ou se a faixa for desconhecida)."""
+    normalizada = (faixa or '').strip().capitalize()
+    if normalizada not in FAIXAS or normalizada == FAIXAS[-1]:
+        return None
+    return FAIXAS[FAIXAS.index(normalizada) + 1]
+
+
+def _somar_meses(dia, meses):
+    mes = dia.month - 1 + meses
+    ano, mes = dia.year + mes // 12, mes % 12 + 1
+    return date(ano, mes, min(dia.day, calendar.monthrange(ano, mes)[1]))
+
+
+def calcular_data_proxima(faixa, data_ultima_graduacao, data_nascimento, carencias=None, idades=None):
+    """Data de aptidão para a próxima faixa (None se não houver próxima)."""
+    carencias = carencias if carencias is not None else _ler_config('GRADUACAO_CARENCIA_MESES', CARENCIA_MESES_PADRAO)
+    idades = idades if idades is not None else _ler_config('GRADUACAO_IDADE_MINIMA', IDADE_MINIMA_PADRAO)
+
+    seguinte = proxima_faixa(faixa)
+    if seguinte is None:
+        return None
+
+    candidatas = []
+    if data_ultima_graduacao:
+        candidatas.append(_somar_meses(data_ultima_graduacao, carencias.get(faixa.strip().capitalize(), 0)))
+    if data_nascimento and seguinte in idades:
+        candidatas.append(_somar_meses(data_nascimento, 12 * idades[seguinte]))
+    return max(candidatas) if candidatas else None
+
+
+def _somar_meses_sql(coluna, meses, dialeto):
+    """``coluna`` + ``meses`` em SQL, com o dia limitado ao fim do mês (como ``_somar_meses``)."""
+    if dialeto == 'postgresql':
+        # date + interval já limita o dia (31/01 + 1 mês = 28/02)
+        return cast(coluna + func.make_interval(0, meses), Date)
+    # SQLite: date(..., '+N months') transbordaria para o mês seguinte; parte do
+    # dia 1, soma os meses e os dias, e fica com o menor entre isso e o fim do mês
+    dia_no_mes = func.date(
+        coluna, 'start of month', func.printf('%+d months', meses),
+        func.printf('%+d days', cast(func.strftime('%d', coluna), Integer) - 1)
+    )
+    fim_do_mes = func.date(coluna, 'start of month', func.printf('%+d months', meses + 1), '-1 day')
+    # printf('%+d', NULL) dá '+0': sem meses o resultado tem de ser NULL
+    return case((meses.isnot(None), func.min(dia_no_mes, fim_do_mes)))
+
+
+def _expressao_data_proxima(dialeto, carencias, idades):
+    """Mesma regra de ``calcular_data_proxima`` como expressão SQL (NULL sem próxima faixa)."""
+    faixa = func.lower(func.trim(AlunoModel.grau_atual))
+    # CAST: com parâmetros no THEN o PostgreSQL não infere o tipo do CASE
+    carencia = cast(case(
+        {atual.lower(): carencias.get(atual, 0) for atual in FAIXAS[:-1]},
+        value=faixa, else_=None
+    ), Integer)
+    idade_meses = cast(case(
+        {atual.lower(): 12 * idades[seguinte] for atual, seguinte in zip(FAIXAS, FAIXAS[1:]) if seguinte in idades},
+        value=faixa, else_=None
+    ), Integer)
+    por_carencia = _somar_meses_sql(AlunoModel.data_ultima_graduacao, carencia, dialeto)
+    # Sem próxima faixa a carência é NULL: o resultado também precisa ser
+    por_idade = case((carencia.isnot(None), _somar_meses_sql(AlunoModel.data_nascimento, idade_meses, dialeto)))
+
+    if dialeto == 'postgresql':
+        return func.greatest(por_carencia, por_idade)  # GREATEST ignora NULL
+    # max() escalar do SQLite devolve NULL se algum argumento for NULL
+    return func.max(func.coalesce(por_carencia, por_idade), func.coalesce(por_idade, por_carencia))
+
+
+def recalcular(*filtros) -> int:
+    """Recalcula data_proxima_graduacao dos alunos que atendem ``filtros``
+    (todos, se nenhum) em um único UPDATE no banco. Só grava as linhas cujo
+    valor mudou e devolve quantas foram. Não faz commit."""
+    carencias = _ler_config('GRADUACAO_CARENCIA_MESES', CARENCIA_MESES_PADRAO)
+    idades = _ler_config('GRADUACAO_IDADE_MINIMA', IDADE_MINIMA_PADRAO)
+    dialeto = db.session.get_bind().dialect.name
+    if dialeto not in ('postgresql', 'sqlite'):
+        return _recalcular_linha_a_linha(filtros, carencias, idades)
+
+    nova = _expressao_data_proxima(dialeto, carencias, idades)
+    resultado = db.session.execute(
+        update(AlunoModel)
+        .where(*filtros, AlunoModel.data_proxima_graduacao.is_distinct_from(nova))
+        .values(data_proxima_graduacao=nova)
+        .execution_options(synchronize_session=False)
+    )
+    # Alunos já carregados na sessão releem a data na próxima leitura
+    for objeto in list(db.session.identity_map.values()):
+        if isinstance(objeto, AlunoModel):
+            db.session.expire(objeto, ['data_proxima_graduacao'])
+    return resultado.rowcount
+
+
+def _recalcular_linha_a_linha(filtros, carencias, idades):
+    """Outros bancos: calcula em Python e grava em lotes pela chave primária."""
+    consulta = (
+        db.session.query(
+            AlunoModel.id,
+            AlunoModel.grau_atual,
+            AlunoModel.data_ultima_graduacao,
+            AlunoModel.data_nascimento,
+            AlunoModel.data_proxima_graduacao
+        )
+        .filter(*filtros)
+        .order_by(AlunoModel.id)
+    )
+
+    alteracoes = []
+    total = 0
+    # Lê tudo antes de gravar: o UPDATE no meio do cursor aberto não é seguro em todo driver
+    for linha in consulta.all():
+        nova = calcular_data_proxima(linha.grau_atual, linha.data_ultima_graduacao, linha.data_nascimento,
+                                     carencias, idades)
+        if nova != linha.data_proxima_graduacao:
+            alteracoes.append({'id': linha.id, 'data_proxima_graduacao': nova})
+        if len(alteracoes) >= TAMANHO_LOTE:
+            db.session.execute(update(AlunoModel), alteracoes)
+            total += len(alteracoes)
+            alteracoes = []
+    if alteracoes:
+        db.session.execute(update(AlunoModel), alteracoes)
+        total += len(alteracoes)
+    return total
+
+
+def recalcular_alunos(ids) -> int:
+    """Recalcula só os alunos de ``ids`` (após cadastro, edição ou graduação)."""
+    ids = [i for i in set(ids or []) if i is not None]
+    if not ids:
+        return 0
+    return recalcular(AlunoModel.id.in_(ids))
+
+
+def consulta_elegiveis(ate=None, faixa=None):
+    """Alunos ativos aptos à próxima faixa em ``ate`` (padrão hoje).
+
+    Usa o índice ``ix_alunos_proxima_graduacao``.
+    """
+    ate = ate or date.today()
+    consulta = AlunoModel.query.filter(
+        AlunoModel.ativo.is_(True),
+        AlunoModel.data_proxima_graduacao.isnot(None),
+        AlunoModel.data_proxima_graduacao <= ate
+    )
+    if faixa:
+        consulta = consulta.filter(AlunoModel.grau_atual == faixa.strip().capitalize())
+    return consulta.order_by(AlunoModel.data_proxima_graduacao, AlunoModel.nome)
@@ -0,0 +1,95 @@
+"""Hash de senhas em um executor limitado.
+
+O PBKDF2/scrypt do werkzeug ocupa a CPU por dezenas de milissegundos. Em
+rajadas de login (início de aula) ou cadastros, todas as threads do
+gunicorn ficariam presas nele ao mesmo tempo. O gunicorn roda com workers
+``gthread`` (``GUNICORN_THREADS`` threads por worker, ver Procfile), e aqui
+no máximo ``HASH_MAX_CONCURRENCY`` hashes rodam em paralelo — por padrão
+metade das threads, limitado aos núcleos — para sobrar thread para as
+outras rotas durante a rajada. Quem espera mais que
+``HASH_QUEUE_TIMEOUT`` segundos por uma vaga recebe ``HashIndisponivelError``
+(as rotas respondem 503). ``HASH_MAX_CONCURRENCY=0`` desativa o executor
+e calcula o hash na própria thread da requisição.
+"""
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from werkzeug.security import generate_password_hash, check_password_hash
+
+THREADS_GUNICORN = int(os.getenv('GUNICORN_THREADS', 8))
+MAX_CONCORRENCIA_PADRAO = max(1, min(THREADS_GUNICORN // 2, os.cpu_count() or 1))
+TIMEOUT_FILA_PADRAO = 5.0  # segundos
+
+
+class HashIndisponivelError(RuntimeError):
+    """Nenhuma vaga de hashing liberou dentro do tempo limite."""
+
+
+class ExecutorHash:
+    def __init__(self, max_concorrencia: int, timeout_fila: float):
+        self.max_concorrencia = max_concorrencia
+        self.timeout_fila = timeout_fila
+        self._executor = None
+        self._vagas = None
+        if max_concorrencia > 0:
+            self._executor = ThreadPoolExecutor(max_workers=max_concorrencia, thread_name_prefix='hash')
+            # Vagas = threads do executor: a fila nunca cresce sem limite
+            self._vagas = threading.BoundedSemaphore(max_concorrencia)
+
+    def executar(self, funcao, *args):
+        if self._executor is None:
+            return funcao(*args)
+        if not self._vagas.acquire(timeout=self.timeout_fila):
+            raise HashIndisponivelError("Servidor ocupado calculando senhas. Tente novamente.")
+        try:
+            futuro = self._executor.submit(funcao, *args)
+        except Exception:
+            self._vagas.release()
+            raise
+        futuro.add_done_callback(lambda _: self._vagas.release())
+        return futuro.result()
+
+    def encerrar(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+
+
+_executor_atual = None
+_lock = threading.Lock()
+
+
+def _novo_executor(max_concorrencia=None, timeout_fila=None) -> ExecutorHash:
+    if max_concorrencia is None:
+        max_concorrencia = int(os.getenv('HASH_MAX_CONCURRENCY', MAX_CONCORRENCIA_PADRAO))
+    if timeout_fila is None:
+        timeout_fila = float(os.getenv('HASH_QUEUE_TIMEOUT', TIMEOUT_FILA_PADRAO))
+    return ExecutorHash(max_concorrencia, timeout_fila)
+
+
+def configurar(max_concorrencia: int | None = None, timeout_fila: float | None = None) -> ExecutorHash:
+    """(Re)cria o executor. Valores omitidos vêm de HASH_MAX_CONCURRENCY/HASH_QUEUE_TIMEOUT."""
+    global _executor_atual
+    novo = _novo_executor(max_concorrencia, timeout_fila)
+    with _lock:
+        anterior, _executor_atual = _executor_atual, novo
+    if anterior is not None:
+        anterior.encerrar()
+    return novo
+
+
+def _executor() -> ExecutorHash:
+    global _executor_atual
+    if _executor_atual is None:
+        with _lock:
+            if _executor_atual is None:
+                _executor_atual = _novo_executor()
+    return _executor_atual
+
+
+def gerar_hash(senha: str) -> str:
+    return _executor().executar(generate_password_hash, senha)
+
+
+def verificar_hash(senha_hash: str, senha: str) -> bool:
+    return _executor().executar(check_password_hash, senha_hash, senha)
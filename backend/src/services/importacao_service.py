@@ -0,0 +1,202 @@
+"""Importação em massa de alunos a partir de CSV.
+
+O arquivo é lido como stream (linha a linha) e processado em lotes: cada lote
+faz uma única consulta de CPFs já cadastrados e grava com INSERT/UPDATE em
+lote, usando as mesmas regras de validação do cadastro individual.
+
+Colunas aceitas (cabeçalho, em qualquer ordem): nome, cpf, data_nascimento,
+sexo, grau_atual, telefone, endereco, nome_pais, data_ultima_graduacao.
+Datas em ``AAAA-MM-DD`` ou ``DD/MM/AAAA``; separador ``,`` ou ``;``.
+
+Ao atualizar um CPF já cadastrado só mudam as colunas que estão no
+cabeçalho; ``data_ultima_graduacao`` vazia mantém a data atual do aluno (na
+inserção vale a data de hoje).
+"""
+import csv
+import re
+from datetime import datetime
+from itertools import islice
+
+from sqlalchemy import insert, update
+
+from ..database import db
+from ..models.aluno_model import AlunoModel
+from .cache_service import cache
+from .graduacao_service import recalcular
+from .validacao import validar_cpf, limpar_e_validar_telefone
+
+TAMANHO_LOTE = 500
+CAMPOS_OBRIGATORIOS = ['nome', 'cpf', 'data_nascimento', 'grau_atual', 'sexo']
+CAMPOS_OPCIONAIS = ['telefone', 'endereco', 'nome_pais', 'data_ultima_graduacao']
+FORMATOS_DATA = ('%Y-%m-%d', '%d/%m/%Y')
+
+
+def _converter_data(valor: str):
+    for formato in FORMATOS_DATA:
+        try:
+            return datetime.strptime(valor, formato).date()
+        except ValueError:
+            continue
+    raise ValueError(valor)
+
+
+def validar_linha(linha: dict, colunas=None) -> tuple[dict | None, list[str]]:
+    """Valida uma linha do CSV. Devolve (colunas do aluno, []) ou (None, erros).
+
+    Dos campos opcionais só entram os que estão em ``colunas`` (o cabeçalho
+    do arquivo; ``None`` = todos), para um UPDATE não apagar o que o arquivo
+    não trouxe.
+    """
+    valores = {campo: (linha.get(campo) or '').strip() for campo in CAMPOS_OBRIGATORIOS + CAMPOS_OPCIONAIS}
+    erros = []
+
+    faltando = [campo for campo in CAMPOS_OBRIGATORIOS if not valores[campo]]
+    if faltando:
+        erros.append(f"Campos obrigatórios faltando: {', '.join(faltando)}")
+
+    if valores['cpf'] and not validar_cpf(valores['cpf']):
+        erros.append("CPF inválido.")
+
+    telefone = None
+    if valores['telefone']:
+        telefone = limpar_e_validar_telefone(valores['telefone'])
+        if telefone is None:
+            erros.append("Telefone inválido. Deve conter 10 ou 11 dígitos.")
+
+    datas = {}
+    for campo in ('data_nascimento', 'data_ultima_graduacao'):
+        if valores[campo]:
+            try:
+                datas[campo] = _converter_data(valores[campo])
+            except ValueError:
+                erros.append(f"Data inválida em {campo}: {valores[campo]}")
+
+    if erros:
+        return None, erros
+
+    dados = {
+        'nome': valores['nome'],
+        'cpf': re.sub(r'\D', '', valores['cpf']),
+        'data_nascimento': datas['data_nascimento'],
+        'sexo': valores['sexo'],
+        'grau_atual': valores['grau_atual'],
+    }
+    opcionais = {
+        'telefone': telefone,
+        'endereco': valores['endereco'] or None,
+        'nome_pais': valores['nome_pais'] or None,
+    }
+    dados.update((campo, valor) for campo, valor in opcionais.items() if colunas is None or campo in colunas)
+    if 'data_ultima_graduacao' in datas:
+        dados['data_ultima_graduacao'] = datas['data_ultima_graduacao']
+    return dados, []
+
+
+def _para_insercao(dados, hoje):
+    """Completa com os padrões do cadastro as colunas que o arquivo não trouxe."""
+    return {'telefone': None, 'endereco': None, 'nome_pais': None, 'data_ultima_graduacao': hoje, **dados}
+
+
+def _leitor_csv(arquivo):
+    """DictReader com separador detectado pela primeira linha e cabeçalho normalizado."""
+    cabecalho = arquivo.readline()
+    delimitador = ';' if cabecalho.count(';') > cabecalho.count(',') else ','
+    campos = [c.strip().lower() for c in next(csv.reader([cabecalho], delimiter=delimitador), [])]
+    return csv.DictReader(arquivo, fieldnames=campos, delimiter=delimitador)
+
+
+def _gravar_lote(validas, atualizar, relatorio):
+    """Grava as linhas válidas de um lote: 1 SELECT de CPFs + INSERT/UPDATE em lote."""
+    existentes = dict(
+        db.session.query(AlunoModel.cpf, AlunoModel.id)
+        .filter(AlunoModel.cpf.in_([dados['cpf'] for _, dados in validas]))
+    )
+    novos, alterados = [], []
+    hoje = datetime.utcnow().date()
+    for numero, dados in validas:
+        aluno_id = existentes.get(dados['cpf'])
+        if aluno_id is None:
+            novos.append(_para_insercao(dados, hoje))
+        elif atualizar:
+            alterados.append({'id': aluno_id, **dados})
+        else:
+            relatorio['erros'].append({'linha': numero, 'erros': ["Este CPF já está cadastrado."]})
+
+    if not novos and not alterados:
+        return
+    if novos:
+        db.session.execute(insert(AlunoModel), novos)
+    if alterados:
+        db.session.execute(update(AlunoModel), alterados)
+    recalcular(AlunoModel.cpf.in_([dados['cpf'] for dados in novos + alterados]))
+    db.session.commit()
+    cache.invalidar('alunos')
+
+    relatorio['inseridos'] += len(novos)
+    relatorio['atualizados'] += len(alterados)
+
+
+def _linhas_numeradas(leitor, relatorio):
+    """(número da linha no arquivo, linha) até o fim ou até um trecho fora de UTF-8.
+
+    O erro de decodificação vira erro no relatório e encerra a leitura: os
+    lotes anteriores já foram gravados e o relatório deles não se perde.
+    """
+    try:
+        for linha in leitor:
+            # line_num conta a partir da linha depois do cabeçalho (lido à parte)
+            yield leitor.line_num + 1, linha
+    except UnicodeDecodeError:
+        relatorio['interrompido'] = True
+        relatorio['erros'].append({
+            'linha': leitor.line_num + 2,
+            'erros': ["Arquivo fora de UTF-8 a partir desta linha; importação interrompida aqui."],
+        })
+
+
+def importar_alunos_csv(arquivo, atualizar: bool = True, tamanho_lote: int = TAMANHO_LOTE) -> dict:
+    """Importa alunos de ``arquivo`` (texto aberto) e devolve o relatório por linha.
+
+    Com ``atualizar`` os CPFs já cadastrados têm os dados atualizados; sem ele
+    viram erro na linha. Um lote que falhe no banco é desfeito e reportado
+    sem interromper os seguintes. Um trecho do arquivo fora de UTF-8 encerra
+    a importação ali, com ``interrompido`` no relatório.
+    """
+    relatorio = {'total': 0, 'inseridos': 0, 'atualizados': 0, 'interrompido': False, 'erros': []}
+    leitor = _leitor_csv(arquivo)
+    colunas = set(leitor.fieldnames)
+    vistos = {}  # CPF -> linha onde apareceu, para repetidos dentro do arquivo
+    linhas = _linhas_numeradas(leitor, relatorio)
+
+    while True:
+        lote = list(islice(linhas, tamanho_lote))
+        if not lote:
+            break
+
+        validas = []
+        for numero, linha in lote:
+            if not any((valor or '').strip() for valor in linha.values() if isinstance(valor, str)):
+                continue  # linha em branco
+            relatorio['total'] += 1
+            dados, erros = validar_linha(linha, colunas)
+            if dados and dados['cpf'] in vistos:
+                erros = [f"CPF repetido no arquivo (linha {vistos[dados['cpf']]})."]
+            if erros:
+                relatorio['erros'].append({'linha': numero, 'erros': erros})
+                continue
+            vistos[dados['cpf']] = numero
+            validas.append((numero, dados))
+
+        if not validas:
+            continue
+        try:
+            _gravar_lote(validas, atualizar, relatorio)
+        except Exception as e:
+            db.session.rollback()
+            print(f"❌ Erro ao gravar lote da importação: {e}")
+            relatorio['erros'].extend(
+                {'linha': numero, 'erros': ["Erro ao gravar no banco."]} for numero, _ in validas
+            )
+
+    relatorio['erros'].sort(key=lambda erro: erro['linha'])
+    return relatorio
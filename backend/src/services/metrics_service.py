@@ -0,0 +1,186 @@
+"""Métricas por rota no formato texto do Prometheus (``GET /metrics``).
+
+Para cada rota registra latência, quantidade de comandos SQL, tempo gasto no
+banco e tamanho da resposta. Um N+1 aparece como um salto no histograma de
+``karate_sql_comandos_por_requisicao`` da rota. Os valores são por processo
+(cada worker do gunicorn expõe os seus). Se ``METRICS_TOKEN`` estiver
+definido, ``/metrics`` exige ``Authorization: Bearer <METRICS_TOKEN>``.
+"""
+import hmac
+import os
+import threading
+import time
+
+from flask import Response, current_app, g, has_request_context, request
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from ..database import estatisticas_pool
+
+BUCKETS_LATENCIA = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+BUCKETS_SQL = (0, 1, 2, 3, 5, 10, 20, 50, 100, 250)
+BUCKETS_BYTES = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304, 16777216)
+
+
+class Histograma:
+    def __init__(self, buckets):
+        self.buckets = buckets
+        self.contagens = [0] * len(buckets)
+        self.soma = 0.0
+        self.total = 0
+
+    def observar(self, valor):
+        self.soma += valor
+        self.total += 1
+        for i, limite in enumerate(self.buckets):
+            if valor <= limite:
+                self.contagens[i] += 1
+                break
+
+    def linhas(self, nome, rotulos):
+        acumulado = 0
+        for limite, qtd in zip(self.buckets, self.contagens):
+            acumulado += qtd
+            yield f'{nome}_bucket{{{rotulos},le="{limite:g}"}} {acumulado}'
+        yield f'{nome}_bucket{{{rotulos},le="+Inf"}} {self.total}'
+        yield f'{nome}_sum{{{rotulos}}} {self.soma:.6f}'
+        yield f'{nome}_count{{{rotulos}}} {self.total}'
+
+
+def _escapar(valor):
+    return str(valor).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+class _EstadoMetricas:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.requisicoes = {}   # (metodo, rota, status) -> total
+        self.por_rota = {}      # (metodo, rota) -> {nome: Histograma}
+
+
+class Metricas:
+    """Extensão Flask (instância global + ``init_app``, como ``db`` e ``cache``)."""
+
+    def __init__(self):
+        self._listeners_sql = False
+
+    @property
+    def _estado(self):
+        return current_app.extensions['metricas']
+
+    def init_app(self, app):
+        app.extensions['metricas'] = _EstadoMetricas()
+        app.before_request(self._inicio_requisicao)
+        app.after_request(self._fim_requisicao)
+        app.teardown_request(self._registrar_requisicao)
+        app.add_url_rule('/metrics', 'metrics', self._view_metricas)
+        self._registrar_listeners_sql()
+
+    # ---------- SQL ----------
+    def _registrar_listeners_sql(self):
+        if self._listeners_sql:
+            return
+        # Escuta todas as engines (principal e réplica)
+        event.listen(Engine, 'before_cursor_execute', self._antes_sql)
+        event.listen(Engine, 'after_cursor_execute', self._depois_sql)
+        self._listeners_sql = True
+
+    @staticmethod
+    def _antes_sql(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault('_metricas_inicio_sql', []).append(time.perf_counter())
+
+    @staticmethod
+    def _depois_sql(conn, cursor, statement, parameters, context, executemany):
+        pilha = conn.info.get('_metricas_inicio_sql')
+        if not pilha:
+            return
+        duracao = time.perf_counter() - pilha.pop()
+        if has_request_context() and 'metricas_inicio' in g:
+            g.metricas_sql_qtd += 1
+            g.metricas_sql_tempo += duracao
+
+    # ---------- Requisições ----------
+    @staticmethod
+    def _inicio_requisicao():
+        g.metricas_inicio = time.perf_counter()
+        g.metricas_sql_qtd = 0
+        g.metricas_sql_tempo = 0.0
+
+    @staticmethod
+    def _fim_requisicao(response):
+        g.metricas_status = response.status_code
+        g.metricas_bytes = None if response.is_streamed else response.calculate_content_length()
+        return response
+
+    def _registrar_requisicao(self, exc=None):
+        inicio = g.pop('metricas_inicio', None)
+        if inicio is None:
+            return
+        latencia = time.perf_counter() - inicio
+        rota = request.url_rule.rule if request.url_rule else 'nao_encontrada'
+        status = g.get('metricas_status', 500)
+        chave = (request.method, rota)
+
+        estado = self._estado
+        with estado.lock:
+            estado.requisicoes[chave + (status,)] = estado.requisicoes.get(chave + (status,), 0) + 1
+            hist = estado.por_rota.get(chave)
+            if hist is None:
+                hist = estado.por_rota[chave] = {
+                    'karate_http_latencia_segundos': Histograma(BUCKETS_LATENCIA),
+                    'karate_sql_comandos_por_requisicao': Histograma(BUCKETS_SQL),
+                    'karate_sql_tempo_segundos': Histograma(BUCKETS_LATENCIA),
+                    'karate_http_resposta_bytes': Histograma(BUCKETS_BYTES),
+                }
+            hist['karate_http_latencia_segundos'].observar(latencia)
+            hist['karate_sql_comandos_por_requisicao'].observar(g.get('metricas_sql_qtd', 0))
+            hist['karate_sql_tempo_segundos'].observar(g.get('metricas_sql_tempo', 0.0))
+            if g.get('metricas_bytes') is not None:
+                hist['karate_http_resposta_bytes'].observar(g.metricas_bytes)
+
+    # ---------- Exposição ----------
+    def texto_prometheus(self) -> str:
+        linhas = [
+            '# HELP karate_http_requisicoes_total Requisições atendidas por rota e status.',
+            '# TYPE karate_http_requisicoes_total counter',
+        ]
+        estado = self._estado
+        with estado.lock:
+            for (metodo, rota, status), total in sorted(estado.requisicoes.items()):
+                linhas.append(
+                    f'karate_http_requisicoes_total{{metodo="{metodo}",rota="{_escapar(rota)}",status="{status}"}} {total}'
+                )
+            por_nome = {}
+            for (metodo, rota), hists in sorted(estado.por_rota.items()):
+                rotulos = f'metodo="{metodo}",rota="{_escapar(rota)}"'
+                for nome, hist in hists.items():
+                    por_nome.setdefault(nome, []).extend(hist.linhas(nome, rotulos))
+
+        descricoes = {
+            'karate_http_latencia_segundos': 'Latência da requisição.',
+            'karate_sql_comandos_por_requisicao': 'Comandos SQL executados por requisição.',
+            'karate_sql_tempo_segundos': 'Tempo gasto no banco por requisição.',
+            'karate_http_resposta_bytes': 'Tamanho do corpo da resposta (sem stream).',
+        }
+        for nome, descricao in descricoes.items():
+            linhas.append(f'# HELP {nome} {descricao}')
+            linhas.append(f'# TYPE {nome} histogram')
+            linhas.extend(por_nome.get(nome, []))
+
+        for bind, stats in estatisticas_pool().items():
+            for campo, valor in stats.items():
+                if isinstance(valor, (int, float)) and not isinstance(valor, bool):
+                    linhas.append(f'karate_db_pool_{campo}{{bind="{bind}"}} {valor}')
+
+        return '\n'.join(linhas) + '\n'
+
+    def _view_metricas(self):
+        token = os.getenv('METRICS_TOKEN')
+        if token:
+            enviado = request.headers.get('Authorization', '')
+            if not hmac.compare_digest(enviado, f'Bearer {token}'):
+                return Response('Não autorizado\n', status=401, mimetype='text/plain')
+        return Response(self.texto_prometheus(), mimetype='text/plain; version=0.0.4')
+
+
+metricas = Metricas()
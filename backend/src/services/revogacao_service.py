@@ -0,0 +1,228 @@
+"""Revogação de tokens JWT (logout, professor inativado), checada a cada requisição.
+
+As revogações ficam em ``tokens_revogados``. Cada processo mantém na memória:
+  - um filtro de Bloom com os ``jti`` revogados ainda não expirados — o
+    "não está" é exato e custa só alguns acessos a bits;
+  - um conjunto exato e pequeno: os cortes por usuário (tokens emitidos até
+    um instante) e as respostas do banco para os ``jti`` que o filtro apontou.
+Só um "talvez" do filtro vai ao banco, e uma única vez por ``jti``.
+
+Cada processo traz as revogações novas a cada ``JWT_REVOGACAO_SINCRONIA``
+segundos (uma consulta pelo índice de ``revogado_em``) e refaz o filtro a
+cada ``JWT_REVOGACAO_RECONSTRUIR`` segundos, deixando de fora o que já
+expirou. O processo que revoga sincroniza na hora.
+"""
+import hashlib
+import math
+import os
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
+
+from flask import current_app
+from sqlalchemy import delete
+
+from ..database import db
+from ..models.token_revogado_model import TokenRevogadoModel
+
+SINCRONIA_PADRAO = 5  # segundos
+RECONSTRUIR_PADRAO = 3600  # segundos
+CAPACIDADE_PADRAO = 10000
+TAXA_FALSO_POSITIVO = 0.01
+MAX_CONFERIDOS = 4096
+# Sobreposição entre sincronizações: pega linhas cuja transação terminou
+# depois da consulta anterior, mas com revogado_em um pouco mais antigo
+MARGEM_SINCRONIA = timedelta(seconds=60)
+
+
+class FiltroBloom:
+    """Conjunto probabilístico: sem falso negativo, ~``taxa_erro`` de falso positivo."""
+
+    def __init__(self, capacidade, taxa_erro=TAXA_FALSO_POSITIVO):
+        self.capacidade = max(1, capacidade)
+        self.tamanho = max(8, math.ceil(-self.capacidade * math.log(taxa_erro) / math.log(2) ** 2))
+        self.funcoes = max(1, round(self.tamanho / self.capacidade * math.log(2)))
+        self.bits = bytearray((self.tamanho + 7) // 8)
+        self.quantidade = 0
+
+    def _posicoes(self, chave):
+        # Hash duplo: as k posições saem de dois hashes de 64 bits
+        resumo = hashlib.blake2b(chave.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(resumo[:8], 'little')
+        h2 = int.from_bytes(resumo[8:], 'little') | 1
+        return [(h1 + i * h2) % self.tamanho for i in range(self.funcoes)]
+
+    def adicionar(self, chave):
+        for posicao in self._posicoes(chave):
+            self.bits[posicao >> 3] |= 1 << (posicao & 7)
+        self.quantidade += 1
+
+    def __contains__(self, chave):
+        return all(self.bits[posicao >> 3] & (1 << (posicao & 7)) for posicao in self._posicoes(chave))
+
+
+def _timestamp(momento):
+    """datetime ingênuo em UTC (como gravado no banco) -> segundos Unix."""
+    return momento.replace(tzinfo=timezone.utc).timestamp()
+
+
+class _EstadoRevogacao:
+    def __init__(self, sincronia, reconstruir, capacidade):
+        self.sincronia = sincronia
+        self.reconstruir = reconstruir
+        self.capacidade = capacidade
+        self.filtro = FiltroBloom(capacidade)
+        self.cortes = {}  # identity -> segundo Unix: tokens emitidos antes dele estão revogados
+        self.conferidos = OrderedDict()  # jti -> revogado? (resposta do banco)
+        self.ultima_sincronia = None  # time.monotonic()
+        self.ultima_reconstrucao = None
+        self.sincronizado_ate = None  # datetime UTC da última consulta
+        self.lock = threading.Lock()
+        self.lock_sincronia = threading.Lock()
+
+    def aplicar(self, linhas, reconstrucao, agora, consultado_em):
+        jtis = [linha.jti for linha in linhas if linha.jti]
+        cortes = {}
+        for linha in linhas:
+            if linha.jti is None and linha.fk_usuario is not None:
+                chave = str(linha.fk_usuario)
+                # ``iat`` é em segundos inteiros: o corte também, comparado com ``<``
+                # (um login no mesmo segundo do corte não nasce revogado)
+                cortes[chave] = max(cortes.get(chave, 0), int(_timestamp(linha.revogado_em)))
+
+        with self.lock:
+            if reconstrucao:
+                # Troca o filtro inteiro: quem está lendo continua no anterior até aqui
+                filtro = FiltroBloom(max(self.capacidade, 2 * len(jtis)))
+                for jti in jtis:
+                    filtro.adicionar(jti)
+                self.filtro, self.cortes = filtro, cortes
+                self.conferidos.clear()
+                self.ultima_reconstrucao = agora
+            else:
+                for jti in jtis:
+                    self.filtro.adicionar(jti)
+                    # Uma resposta "não revogado" guardada antes deixa de valer
+                    self.conferidos.pop(jti, None)
+                for chave, corte in cortes.items():
+                    self.cortes[chave] = max(self.cortes.get(chave, 0), corte)
+                if self.filtro.quantidade > self.filtro.capacidade:
+                    self.ultima_reconstrucao = None  # cheio demais: refaz na próxima
+            self.ultima_sincronia = agora
+            self.sincronizado_ate = consultado_em
+
+    def conferido(self, jti):
+        with self.lock:
+            revogado = self.conferidos.get(jti)
+            if revogado is not None:
+                self.conferidos.move_to_end(jti)
+            return revogado
+
+    def guardar_conferido(self, jti, revogado):
+        with self.lock:
+            self.conferidos[jti] = revogado
+            while len(self.conferidos) > MAX_CONFERIDOS:
+                self.conferidos.popitem(last=False)
+
+
+class ListaRevogacao:
+    """Extensão Flask (mesmo padrão do ``cache``: instância global + init_app)."""
+
+    def init_app(self, app, jwt):
+        sincronia = float(os.getenv('JWT_REVOGACAO_SINCRONIA', SINCRONIA_PADRAO))
+        reconstruir = float(os.getenv('JWT_REVOGACAO_RECONSTRUIR', RECONSTRUIR_PADRAO))
+        capacidade = int(os.getenv('JWT_REVOGACAO_CAPACIDADE', CAPACIDADE_PADRAO))
+        app.extensions['revogacao_tokens'] = _EstadoRevogacao(sincronia, reconstruir, capacidade)
+        jwt.token_in_blocklist_loader(lambda _cabecalho, payload: self.revogado(payload))
+
+    @property
+    def _estado(self):
+        return current_app.extensions['revogacao_tokens']
+
+    def revogado(self, payload):
+        """True se o token (payload já decodificado) foi revogado."""
+        estado = self._estado
+        self._sincronizar_se_preciso(estado)
+
+        corte = estado.cortes.get(str(payload.get('sub')))
+        if corte is not None and payload.get('iat', 0) < corte:
+            return True
+
+        jti = payload.get('jti')
+        if not jti or jti not in estado.filtro:
+            return False
+        revogado = estado.conferido(jti)
+        if revogado is None:
+            revogado = db.session.query(
+                db.session.query(TokenRevogadoModel.id).filter(TokenRevogadoModel.jti == jti).exists()
+            ).scalar()
+            estado.guardar_conferido(jti, revogado)
+        return revogado
+
+    def sincronizar(self):
+        """Traz já as revogações novas (quem revoga chama depois do commit)."""
+        estado = self._estado
+        with estado.lock_sincronia:
+            self._sincronizar(estado)
+
+    def _sincronizar_se_preciso(self, estado):
+        if estado.ultima_sincronia is not None and time.monotonic() - estado.ultima_sincronia < estado.sincronia:
+            return
+        # Na primeira carga todos esperam; depois, uma thread sincroniza e as
+        # outras seguem com o estado atual
+        if not estado.lock_sincronia.acquire(blocking=estado.ultima_sincronia is None):
+            return
+        try:
+            self._sincronizar(estado)
+        finally:
+            estado.lock_sincronia.release()
+
+    def _sincronizar(self, estado):
+        agora = time.monotonic()
+        reconstrucao = (estado.ultima_reconstrucao is None
+                        or agora - estado.ultima_reconstrucao >= estado.reconstruir)
+        consultado_em = datetime.utcnow()
+        try:
+            consulta = db.session.query(
+                TokenRevogadoModel.jti, TokenRevogadoModel.fk_usuario, TokenRevogadoModel.revogado_em
+            ).filter(TokenRevogadoModel.expira_em > consultado_em)
+            if not reconstrucao:
+                consulta = consulta.filter(TokenRevogadoModel.revogado_em >= estado.sincronizado_ate - MARGEM_SINCRONIA)
+            linhas = consulta.all()
+        except Exception as e:
+            db.session.rollback()
+            print(f"❌ Erro ao sincronizar tokens revogados: {e}")
+            estado.ultima_sincronia = agora  # tenta de novo no próximo intervalo
+            return
+        estado.aplicar(linhas, reconstrucao, agora, consultado_em)
+
+
+revogacao = ListaRevogacao()
+
+
+def _validade_token():
+    return current_app.config.get('JWT_ACCESS_TOKEN_EXPIRES') or timedelta(days=365)
+
+
+def revogar_token(jti, usuario_id, expira_em):
+    """Revoga um token (logout). ``expira_em`` é o ``exp`` do token. Não faz commit."""
+    db.session.add(TokenRevogadoModel(
+        jti=jti,
+        fk_usuario=usuario_id,
+        expira_em=datetime.fromtimestamp(expira_em, timezone.utc).replace(tzinfo=None)
+    ))
+
+
+def revogar_usuario(usuario_id):
+    """Revoga todos os tokens já emitidos para o usuário. Não faz commit."""
+    agora = datetime.utcnow()
+    db.session.add(TokenRevogadoModel(fk_usuario=usuario_id, revogado_em=agora, expira_em=agora + _validade_token()))
+
+
+def limpar_expirados() -> int:
+    """Apaga revogações cujos tokens já expiraram. Não faz commit."""
+    resultado = db.session.execute(
+        delete(TokenRevogadoModel).where(TokenRevogadoModel.expira_em <= datetime.utcnow())
+    )
+    return resultado.rowcount
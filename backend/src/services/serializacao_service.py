@@ -0,0 +1,54 @@
+"""Projeção de colunas para as listagens: SELECT só do que vai no JSON.
+
+Listar com ``Model.query.all()`` + ``to_json`` cria um objeto ORM por linha
+(identity map, estado de atributos) e chama ``isoformat`` campo a campo. Aqui
+a consulta traz só as colunas projetadas, cada linha vira um ``dict`` direto
+e as datas ficam como ``date`` para o provider JSON (orjson) codificar.
+
+A saída é a mesma do ``to_json`` correspondente.
+"""
+from sqlalchemy import select
+
+from ..database import db
+from ..models.aluno_model import AlunoModel
+from ..models.professor_model import ProfessorModel
+
+
+class Projecao:
+    """Chaves do JSON -> colunas do modelo, na ordem do ``to_json``."""
+
+    def __init__(self, modelo, campos):
+        self.modelo = modelo
+        self.chaves = tuple(campos)
+        self.colunas = [getattr(modelo, campo) for campo in self.chaves]
+
+    def select(self):
+        return select(*self.colunas)
+
+    def linha(self, valores):
+        return dict(zip(self.chaves, valores))
+
+    def linhas(self, consulta):
+        """Executa ``consulta`` (vinda de ``select()``) e devolve a lista de dicts."""
+        chaves = self.chaves
+        return [dict(zip(chaves, valores)) for valores in db.session.execute(consulta)]
+
+    def iterar(self, consulta, lote):
+        """Como ``linhas``, mas em stream pelo cursor do banco (``yield_per``)."""
+        resultado = db.session.execute(consulta.execution_options(yield_per=lote))
+        try:
+            for valores in resultado:
+                yield self.linha(valores)
+        finally:
+            resultado.close()
+
+
+ALUNO_JSON = Projecao(AlunoModel, [
+    'id', 'nome', 'cpf', 'data_nascimento', 'sexo', 'telefone', 'endereco', 'nome_pais',
+    'grau_atual', 'data_ultima_graduacao', 'data_proxima_graduacao', 'ativo', 'fk_usuario',
+])
+
+PROFESSOR_JSON = Projecao(ProfessorModel, [
+    'id', 'nome', 'cpf', 'data_nascimento', 'telefone', 'endereco', 'grau_faixa',
+    'data_contratacao', 'ativo', 'fk_usuario',
+])
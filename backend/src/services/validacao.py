@@ -0,0 +1,28 @@
+"""Validação de documentos e contatos usada pelo cadastro e pela importação de alunos."""
+import re
+
+
+def validar_cpf(cpf_str: str) -> bool:
+    """Valida um CPF brasileiro."""
+    if not isinstance(cpf_str, str):
+        return False
+    numeros = [int(d) for d in cpf_str if d.isdigit()]
+    if len(numeros) != 11 or len(set(numeros)) == 1:
+        return False
+
+    soma_produtos1 = sum(a * b for a, b in zip(numeros[0:9], range(10, 1, -1)))
+    digito_esperado1 = (soma_produtos1 * 10 % 11) % 10
+    if numeros[9] != digito_esperado1:
+        return False
+
+    soma_produtos2 = sum(a * b for a, b in zip(numeros[0:10], range(11, 1, -1)))
+    digito_esperado2 = (soma_produtos2 * 10 % 11) % 10
+    return numeros[10] == digito_esperado2
+
+
+def limpar_e_validar_telefone(telefone_str: str) -> str | None:
+    """Limpa e valida o número de telefone (10 ou 11 dígitos)."""
+    if not isinstance(telefone_str, str):
+        return None
+    numeros = re.sub(r'\D', '', telefone_str)
+    return numeros if 10 <= len(numeros) <= 11 else None
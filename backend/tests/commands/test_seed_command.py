@@ -0,0 +1,41 @@
+from src.services.validacao import validar_cpf
+from src.database import db
+from src.models.aluno_model import AlunoModel
+from src.models.exame_model import ExameModel
+from src.models.inscricao_model import InscricaoModel
+from src.models.professor_model import ProfessorModel
+from src.models.user_model import UserModel
+
+
+def _seed(app, *args):
+    return app.test_cli_runner().invoke(args=['seed', *args])
+
+
+def test_seed_tudo_gera_dados_validos(app):
+    resultado = _seed(app, 'tudo', '--alunos', '60', '--professores', '3', '--aulas', '0',
+                      '--exames', '4', '--inscricoes-por-exame', '10', '--lote', '25')
+    assert resultado.exit_code == 0, resultado.output
+
+    with app.app_context():
+        cpfs = [c for (c,) in db.session.query(AlunoModel.cpf)]
+        assert len(cpfs) == 60 and all(validar_cpf(c) for c in cpfs)
+        assert ProfessorModel.query.count() == 3
+        assert UserModel.query.filter_by(nivel_acesso='professor').count() == 3
+        assert ExameModel.query.count() == 4
+        assert InscricaoModel.query.count() == 40
+
+        professor = UserModel.query.filter_by(nivel_acesso='professor').first()
+        assert professor.check_password('karate123')
+
+
+def test_seed_e_deterministico_e_nao_repete_cpf(app):
+    assert _seed(app, 'alunos', '--quantidade', '20', '--semente', '7').exit_code == 0
+    with app.app_context():
+        primeiros = [n for (n,) in db.session.query(AlunoModel.nome).order_by(AlunoModel.id)]
+
+    # Mesma semente de novo: mesmos nomes, mas CPFs ainda livres
+    assert _seed(app, 'alunos', '--quantidade', '20', '--semente', '7').exit_code == 0
+    with app.app_context():
+        nomes = [n for (n,) in db.session.query(AlunoModel.nome).order_by(AlunoModel.id)]
+        assert nomes[20:] == primeiros
+        assert db.session.query(AlunoModel.cpf).distinct().count() == 40
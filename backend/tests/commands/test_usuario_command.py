@@ -0,0 +1,17 @@
+from src.models.user_model import UserModel
+
+
+def test_criar_admin_e_alterar_nivel(app):
+    runner = app.test_cli_runner()
+    resultado = runner.invoke(args=['usuarios', 'criar-admin', 'chefe@dojo.com', '--nome', 'Chefe', '--senha', 'segredo'])
+    assert resultado.exit_code == 0, resultado.output
+
+    with app.app_context():
+        usuario = UserModel.query.filter_by(email='chefe@dojo.com').one()
+        assert usuario.nivel_acesso == 'admin' and usuario.check_password('segredo')
+
+    assert runner.invoke(args=['usuarios', 'nivel', 'chefe@dojo.com', 'aluno']).exit_code == 0
+    assert runner.invoke(args=['usuarios', 'nivel', 'chefe@dojo.com', 'sensei']).exit_code != 0
+    assert runner.invoke(args=['usuarios', 'nivel', 'ninguem@dojo.com', 'aluno']).exit_code != 0
+    with app.app_context():
+        assert UserModel.query.filter_by(email='chefe@dojo.com').one().nivel_acesso == 'aluno'
@@ -9,19 +9,23 @@ SRC_PATH = os.path.join(BASE_DIR, 'src')
 if SRC_PATH not in sys.path:
     sys.path.insert(0, SRC_PATH)
 
+# ✅ Variáveis mínimas para o create_app rodar sem o .env de produção
+os.environ.setdefault("DATABASE_URL", "sqlite:///:memory:")
+os.environ.setdefault("JWT_SECRET_KEY", "chave-de-testes-com-32-bytes-no-minimo")
+# Sincronização da lista de revogação só quando o teste pede (contagens de SQL estáveis)
+os.environ.setdefault("JWT_REVOGACAO_SINCRONIA", "3600")
+
 from src.app import create_app
 
 
 def _config_sqlite_memory(app):
     """Configura banco SQLite em memória para testes isolados."""
-    try:
-        app.config["SQLALCHEMY_DATABASE_URI"] = "sqlite:///:memory:"
-        app.config["SQLALCHEMY_TRACK_MODIFICATIONS"] = False
-        from src.database import db
-        with app.app_context():
-            db.create_all()
-    except Exception as e:
-        print(f"⚠️ Aviso: Banco de dados não inicializado nos testes: {e}")
+    app.config["SQLALCHEMY_DATABASE_URI"] = "sqlite:///:memory:"
+    app.config["SQLALCHEMY_TRACK_MODIFICATIONS"] = False
+    from src.database import db
+    with app.app_context():
+        # Sem try: um modelo ou DDL quebrado tem de falhar aqui, não virar erro em outro teste
+        db.create_all()
 
 
 @pytest.fixture
@@ -36,3 +40,47 @@ def app():
 def client(app):
     """Cliente HTTP para simular requisições"""
     return app.test_client()
+
+
+@pytest.fixture(scope="session")
+def _hash_senha_teste():
+    """Hash calculado uma vez só: gerar um por teste deixaria a suíte lenta."""
+    from werkzeug.security import generate_password_hash
+    return generate_password_hash("senha-de-teste")
+
+
+def _headers_usuario(app, hash_senha, nivel):
+    """Cria um usuário real com ``nivel`` e devolve o Authorization do token dele.
+
+    O papel já fica no cache de autorização e a lista de revogação já vem
+    carregada, como num worker em uso, para as contagens de consultas dos
+    testes medirem só a rota.
+    """
+    from flask_jwt_extended import create_access_token
+    from sqlalchemy import insert
+    from src.database import db
+    from src.models.user_model import UserModel
+    from src.services.auth_service import autorizacao
+    from src.services.revogacao_service import revogacao
+    with app.app_context():
+        usuario_id = db.session.execute(
+            insert(UserModel).returning(UserModel.id),
+            {"nome": nivel.capitalize(), "email": f"{nivel}@teste.com", "senha_hash": hash_senha, "nivel_acesso": nivel}
+        ).scalar_one()
+        db.session.commit()
+        autorizacao.situacao(usuario_id)
+        revogacao.sincronizar()
+        token = create_access_token(identity=str(usuario_id), additional_claims={"nivel": nivel, "nome": nivel})
+    return {"Authorization": f"Bearer {token}"}
+
+
+@pytest.fixture
+def auth_headers(app, _hash_senha_teste):
+    """Cabeçalho Authorization de um usuário admin."""
+    return _headers_usuario(app, _hash_senha_teste, "admin")
+
+
+@pytest.fixture
+def aluno_headers(app, _hash_senha_teste):
+    """Cabeçalho Authorization de um usuário com nível aluno."""
+    return _headers_usuario(app, _hash_senha_teste, "aluno")
@@ -9,3 +9,111 @@ def test_criar_aluno_smoke(client):
     # se a rota existir, esperamos 201; se ainda não, não pode ser 500
     assert resp.status_code in (201, 400, 404)
     assert resp.status_code != 500
+
+
+def _criar_alunos(app, nomes):
+    from datetime import date
+    from src.database import db
+    from src.models.aluno_model import AlunoModel
+    with app.app_context():
+        for nome in nomes:
+            db.session.add(AlunoModel(nome=nome, data_nascimento=date(2012, 5, 1), grau_atual="Branca"))
+        db.session.commit()
+
+
+def test_listar_alunos_paginado_por_cursor(app, client, auth_headers):
+    _criar_alunos(app, ["Carla", "Ana", "Bruno", "Ana", "Davi"])
+
+    resp = client.get("/api/v1/alunos/?limit=2", headers=auth_headers)
+    assert resp.status_code == 200
+    pagina = resp.get_json()
+    assert [a["nome"] for a in pagina["alunos"]] == ["Ana", "Ana"]
+    assert pagina["next_cursor"]
+
+    vistos = [a["id"] for a in pagina["alunos"]]
+    while pagina["next_cursor"]:
+        resp = client.get(f"/api/v1/alunos/?limit=2&cursor={pagina['next_cursor']}", headers=auth_headers)
+        pagina = resp.get_json()
+        vistos += [a["id"] for a in pagina["alunos"]]
+    assert len(vistos) == len(set(vistos)) == 5
+
+
+def test_listar_alunos_cursor_invalido(client, auth_headers):
+    resp = client.get("/api/v1/alunos/?limit=2&cursor=lixo", headers=auth_headers)
+    assert resp.status_code == 400
+
+
+def test_listar_alunos_limit_invalido(client, auth_headers):
+    for limite in ("-5", "0", "abc"):
+        assert client.get(f"/api/v1/alunos/?limit={limite}", headers=auth_headers).status_code == 400
+        assert client.get(f"/api/v1/alunos/?stream=1&limit={limite}", headers=auth_headers).status_code == 400
+
+
+def test_listar_alunos_stream(app, client, auth_headers):
+    _criar_alunos(app, ["Bruno", "Ana"])
+    resp = client.get("/api/v1/alunos/?stream=1", headers=auth_headers)
+    assert resp.status_code == 200
+    assert resp.is_streamed
+    assert [a["nome"] for a in resp.get_json()] == ["Ana", "Bruno"]
+
+    # stream=0 é a listagem normal, que passa pelo cache (ETag)
+    resp = client.get("/api/v1/alunos/?stream=0", headers=auth_headers)
+    assert resp.headers.get("ETag") and [a["nome"] for a in resp.get_json()] == ["Ana", "Bruno"]
+
+
+def test_busca_alunos_sem_acento_e_por_relevancia(app, client, auth_headers):
+    _criar_alunos(app, ["João Pedro", "Joana Lima", "Maria Souza"])
+
+    resp = client.get("/api/v1/alunos/busca?q=joao", headers=auth_headers)
+    assert resp.status_code == 200
+    resultado = resp.get_json()
+    assert resultado[0]["nome"] == "João Pedro"
+    assert "Maria Souza" not in [a["nome"] for a in resultado]
+    assert resultado == sorted(resultado, key=lambda a: -a["relevancia"])
+
+    resp = client.get("/api/v1/alunos/busca", headers=auth_headers)
+    assert resp.status_code == 400
+
+
+def test_listar_alunos_etag_e_invalidacao(app, client, auth_headers):
+    from sqlalchemy import event
+    from src.database import db
+    _criar_alunos(app, ["Ana"])
+
+    resp = client.get("/api/v1/alunos/", headers=auth_headers)
+    etag = resp.headers["ETag"]
+
+    with app.app_context():
+        comandos = []
+        event.listen(db.engine, "before_cursor_execute", lambda *a: comandos.append(a[2]))
+        resp = client.get("/api/v1/alunos/", headers={**auth_headers, "If-None-Match": etag})
+        assert resp.status_code == 304
+        resp = client.get("/api/v1/alunos/", headers=auth_headers)
+        assert resp.status_code == 200 and len(resp.get_json()) == 1
+    assert comandos == []
+
+    novo = {"nome": "Bia", "cpf": "529.982.247-25", "data_nascimento": "2012-01-01", "grau_atual": "Branca", "sexo": "Feminino"}
+    assert client.post("/api/v1/alunos/", json=novo, headers=auth_headers).status_code == 201
+
+    resp = client.get("/api/v1/alunos/", headers={**auth_headers, "If-None-Match": etag})
+    assert resp.status_code == 200
+    assert resp.headers["ETag"] != etag
+    assert len(resp.get_json()) == 2
+
+
+def test_elegiveis_calculados_no_cadastro_e_na_edicao(client, auth_headers):
+    base = {"cpf": "52998224725", "sexo": "Feminino", "data_nascimento": "2012-05-01"}
+    resp = client.post("/api/v1/alunos/", json={**base, "nome": "Ana", "grau_atual": "Branca",
+                                                "data_ultima_graduacao": "2025-01-10"}, headers=auth_headers)
+    aluno = resp.get_json()["aluno"]
+    assert aluno["data_proxima_graduacao"] == "2025-04-10"
+
+    elegiveis = client.get("/api/v1/alunos/elegiveis?data=2025-05-01", headers=auth_headers).get_json()
+    assert [(a["nome"], a["proxima_faixa"]) for a in elegiveis] == [("Ana", "Amarela")]
+    assert client.get("/api/v1/alunos/elegiveis?data=2025-04-01", headers=auth_headers).get_json() == []
+
+    # Graduou: a data passa a contar da nova faixa
+    resp = client.put(f"/api/v1/alunos/{aluno['id']}", json={"grau_atual": "Amarela", "data_ultima_graduacao": "2025-04-20"},
+                      headers=auth_headers)
+    assert resp.get_json()["aluno"]["data_proxima_graduacao"] == "2025-08-20"
+    assert client.get("/api/v1/alunos/elegiveis?data=2025-05-01", headers=auth_headers).get_json() == []
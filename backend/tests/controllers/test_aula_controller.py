@@ -8,3 +8,146 @@ def test_criar_aula_smoke(client):
     resp = client.post("/aulas", json=payload)
     assert resp.status_code in (201, 400, 404)
     assert resp.status_code != 500
+
+
+def _criar_professor(app, nome="Sensei"):
+    from datetime import date
+    from src.database import db
+    from src.models.professor_model import ProfessorModel
+    from src.models.user_model import UserModel
+    with app.app_context():
+        usuario = UserModel(nome=nome, email=f"{nome.lower()}@karate.com", senha="x", nivel_acesso="professor")
+        db.session.add(usuario)
+        db.session.flush()
+        professor = ProfessorModel(nome=nome, cpf=f"{usuario.id:011d}", data_nascimento=date(1980, 1, 1),
+                                   fk_usuario=usuario.id)
+        db.session.add(professor)
+        db.session.commit()
+        return professor.id
+
+
+def _aula(professor_id, dias, inicio, fim, nome="Turma"):
+    return {"nome_turma": nome, "modalidade": "Karatê", "fk_professor": professor_id,
+            "dias_semana": dias, "horario_inicio": inicio, "horario_fim": fim}
+
+
+def test_criar_aula_com_conflito_de_horario(client, app, auth_headers):
+    prof = _criar_professor(app)
+    resp = client.post("/api/v1/aulas/", json=_aula(prof, ["Segunda", "Quarta"], "18:00", "19:00"), headers=auth_headers)
+    assert resp.status_code == 201
+    assert resp.get_json()["aula"]["dias_semana"] == ["Segunda", "Quarta"]
+
+    # Quarta 18:30 cruza a aula anterior
+    resp = client.post("/api/v1/aulas/", json=_aula(prof, ["quarta", "Sexta"], "18:30", "19:30"), headers=auth_headers)
+    assert resp.status_code == 409
+    assert [a["horario_inicio"] for a in resp.get_json()["conflitos"]] == ["18:00"]
+
+    # Encostar no fim não é conflito, nem outro dia no mesmo horário
+    assert client.post("/api/v1/aulas/", json=_aula(prof, ["Quarta"], "19:00", "20:00"), headers=auth_headers).status_code == 201
+    assert client.post("/api/v1/aulas/", json=_aula(prof, ["Terça"], "18:00", "19:00"), headers=auth_headers).status_code == 201
+    # Outro professor no mesmo horário também pode
+    outro = _criar_professor(app, "Outro")
+    assert client.post("/api/v1/aulas/", json=_aula(outro, ["Segunda"], "18:00", "19:00"), headers=auth_headers).status_code == 201
+
+
+def test_atualizar_aula_checa_conflito(client, app, auth_headers):
+    prof = _criar_professor(app)
+    client.post("/api/v1/aulas/", json=_aula(prof, ["Segunda"], "08:00", "09:00"), headers=auth_headers)
+    resp = client.post("/api/v1/aulas/", json=_aula(prof, ["Segunda"], "10:00", "11:00"), headers=auth_headers)
+    aula_id = resp.get_json()["aula"]["id"]
+
+    resp = client.patch(f"/api/v1/aulas/{aula_id}", json={"horario_inicio": "08:30"}, headers=auth_headers)
+    assert resp.status_code == 409
+
+    # Mudar só o nome não conflita com a própria aula
+    resp = client.patch(f"/api/v1/aulas/{aula_id}", json={"nome_turma": "Avançada"}, headers=auth_headers)
+    assert resp.status_code == 200
+
+    resp = client.put(f"/api/v1/aulas/{aula_id}", json={"dias_semana": ["Sábado"], "horario_inicio": "08:30"},
+                      headers=auth_headers)
+    assert resp.status_code == 200
+    assert resp.get_json()["aula"]["dias_semana"] == ["Sábado"]
+
+
+def test_dias_invalidos_e_filtro_por_dia(client, app, auth_headers):
+    prof = _criar_professor(app)
+    resp = client.post("/api/v1/aulas/", json=_aula(prof, ["Feriado"], "08:00", "09:00"), headers=auth_headers)
+    assert resp.status_code == 400
+
+    client.post("/api/v1/aulas/", json=_aula(prof, ["Segunda", "Sexta"], "19:00", "20:00", "Noite"), headers=auth_headers)
+    client.post("/api/v1/aulas/", json=_aula(prof, ["Sexta"], "08:00", "09:00", "Manhã"), headers=auth_headers)
+    client.post("/api/v1/aulas/", json=_aula(prof, ["Terça"], "08:00", "09:00", "Terça"), headers=auth_headers)
+
+    nomes = lambda url: [a["nome_turma"] for a in client.get(url, headers=auth_headers).get_json()]
+    assert nomes("/api/v1/aulas/?dia=sex") == ["Manhã", "Noite"]
+    assert nomes("/api/v1/aulas/?dia=seg,terca") == ["Terça", "Noite"]
+    assert client.get("/api/v1/aulas/?dia=xyz", headers=auth_headers).status_code == 400
+
+
+def test_agenda_agrupada_por_dia_e_horario(client, app, auth_headers):
+    prof = _criar_professor(app)
+    client.post("/api/v1/aulas/", json=_aula(prof, ["Segunda", "Quarta"], "18:00", "19:00", "Adultos"), headers=auth_headers)
+    outro = _criar_professor(app, "Outro")
+    client.post("/api/v1/aulas/", json=_aula(outro, ["Segunda"], "18:00", "19:00", "Kids"), headers=auth_headers)
+    client.post("/api/v1/aulas/", json=_aula(outro, ["Segunda"], "08:00", "09:00", "Manhã"), headers=auth_headers)
+
+    resp = client.get("/api/v1/aulas/agenda", headers=auth_headers)
+    assert resp.status_code == 200
+    agenda = resp.get_json()
+    assert agenda["horarios"] == [{"inicio": "08:00", "fim": "09:00"}, {"inicio": "18:00", "fim": "19:00"}]
+    segunda = agenda["dias"][0]
+    assert segunda["dia"] == "Segunda"
+    assert [h["inicio"] for h in segunda["horarios"]] == ["08:00", "18:00"]
+    noite = segunda["horarios"][1]["aulas"]
+    assert [(a["nome_turma"], a["professor_nome"]) for a in noite] == [("Adultos", "Sensei"), ("Kids", "Outro")]
+    assert agenda["dias"][1]["horarios"] == []
+
+    # Criar uma aula invalida a grade em cache
+    etag = resp.headers["ETag"]
+    client.post("/api/v1/aulas/", json=_aula(prof, ["Terça"], "10:00", "11:00"), headers=auth_headers)
+    resp = client.get("/api/v1/aulas/agenda", headers={**auth_headers, "If-None-Match": etag})
+    assert resp.status_code == 200
+    assert resp.get_json()["dias"][1]["horarios"][0]["inicio"] == "10:00"
+
+
+def test_agenda_ical(client, app, auth_headers, monkeypatch):
+    prof = _criar_professor(app)
+    client.post("/api/v1/aulas/", json=_aula(prof, ["Terça", "Quinta"], "19:00", "20:30", "Turma, noite"), headers=auth_headers)
+
+    # Sem token configurado o feed fica desligado
+    assert client.get("/api/v1/aulas/agenda.ics").status_code == 404
+
+    monkeypatch.setenv("AGENDA_ICS_TOKEN", "segredo")
+    assert client.get("/api/v1/aulas/agenda.ics").status_code == 401
+    assert client.get("/api/v1/aulas/agenda.ics?token=errado").status_code == 401
+
+    resp = client.get("/api/v1/aulas/agenda.ics?token=segredo")
+    assert resp.status_code == 200
+    assert resp.mimetype == "text/calendar"
+    assert "private" in resp.headers["Cache-Control"] and "public" not in resp.headers["Cache-Control"]
+    texto = resp.get_data(as_text=True)
+    assert texto.startswith("BEGIN:VCALENDAR\r\n") and texto.endswith("END:VCALENDAR\r\n")
+    assert "RRULE:FREQ=WEEKLY;BYDAY=TU,TH" in texto
+    assert "SUMMARY:Turma\\, noite" in texto
+    assert "T190000" in texto and "T203000" in texto
+
+
+def test_aula_com_professor_invalido_ou_inativo(client, app, auth_headers):
+    from src.database import db
+    from src.models.professor_model import ProfessorModel
+    prof = _criar_professor(app)
+    for invalido in ("abc", [1], 0):
+        resp = client.post("/api/v1/aulas/", json=_aula(invalido, ["Segunda"], "18:00", "19:00"), headers=auth_headers)
+        assert resp.status_code == 400
+
+    resp = client.post("/api/v1/aulas/", json=_aula(prof, ["Segunda"], "18:00", "19:00"), headers=auth_headers)
+    aula_id = resp.get_json()["aula"]["id"]
+    assert client.put(f"/api/v1/aulas/{aula_id}", json={"fk_professor": "x"}, headers=auth_headers).status_code == 400
+
+    inativo = _criar_professor(app, "Inativo")
+    with app.app_context():
+        db.session.get(ProfessorModel, inativo).ativo = False
+        db.session.commit()
+    resp = client.post("/api/v1/aulas/", json=_aula(inativo, ["Terça"], "18:00", "19:00"), headers=auth_headers)
+    assert resp.status_code == 400
+    assert client.put(f"/api/v1/aulas/{aula_id}", json={"fk_professor": inativo}, headers=auth_headers).status_code == 400
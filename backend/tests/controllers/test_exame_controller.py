@@ -0,0 +1,275 @@
+from datetime import date
+
+from sqlalchemy import event
+
+
+def _criar_exame(app, data, aprovacoes):
+    """Cria um exame com uma inscrição por item de ``aprovacoes``."""
+    from src.database import db
+    from src.models.aluno_model import AlunoModel
+    from src.models.exame_model import ExameModel
+    from src.models.inscricao_model import InscricaoModel
+    with app.app_context():
+        exame = ExameModel(nome_evento=f"Exame {data}", data=data, hora="09:00", local="Dojo")
+        db.session.add(exame)
+        db.session.flush()
+        for i, aprovado in enumerate(aprovacoes):
+            aluno = AlunoModel(nome=f"Aluno {data} {i}", data_nascimento=date(2010, 1, 1))
+            db.session.add(aluno)
+            db.session.flush()
+            db.session.add(InscricaoModel(fk_exame=exame.id, fk_aluno=aluno.id, aprovado=aprovado))
+        db.session.commit()
+        return exame.id
+
+
+def test_listar_exames_com_contagens_em_consulta_unica(app, client, auth_headers):
+    from src.database import db
+    _criar_exame(app, "2025-03-10", [True, False, True])
+    _criar_exame(app, "2025-06-10", [False])
+    _criar_exame(app, "2025-09-10", [])
+
+    with app.app_context():
+        comandos = []
+        event.listen(db.engine, "before_cursor_execute", lambda *a: comandos.append(a[2]))
+        resp = client.get("/api/v1/exames/", headers=auth_headers)
+    assert resp.status_code == 200
+    assert len(comandos) == 1
+
+    exames = {e["data"]: e for e in resp.get_json()}
+    assert exames["2025-03-10"]["qtd_alunos"] == 3
+    assert exames["2025-03-10"]["qtd_aprovados"] == 2
+    assert exames["2025-03-10"]["qtd_pendentes"] == 1
+    assert exames["2025-09-10"]["qtd_alunos"] == 0
+
+
+def test_listar_exames_filtra_por_periodo(app, client, auth_headers):
+    _criar_exame(app, "2025-03-10", [])
+    _criar_exame(app, "2025-06-10", [])
+
+    resp = client.get("/api/v1/exames/?data_inicio=2025-04-01&data_fim=2025-12-31", headers=auth_headers)
+    assert [e["data"] for e in resp.get_json()] == ["2025-06-10"]
+
+    resp = client.get("/api/v1/exames/?data_inicio=01/04/2025", headers=auth_headers)
+    assert resp.status_code == 400
+
+
+def test_banca_em_consulta_unica_com_filtros(app, client, auth_headers):
+    from src.database import db
+    exame_id = _criar_exame(app, "2025-03-10", [True, False, True])
+
+    with app.app_context():
+        comandos = []
+        event.listen(db.engine, "before_cursor_execute", lambda *a: comandos.append(a[2]))
+        resp = client.get(f"/api/v1/exames/{exame_id}/banca?ordem=nome", headers=auth_headers)
+    assert resp.status_code == 200
+    assert len(comandos) == 1
+
+    banca = resp.get_json()
+    assert [b["aluno_nome"] for b in banca] == sorted(b["aluno_nome"] for b in banca)
+    assert set(banca[0]) == {"id", "aluno_nome", "aluno_faixa", "notas", "media", "aprovado", "observacao"}
+
+    resp = client.get(f"/api/v1/exames/{exame_id}/banca?status=pendente", headers=auth_headers)
+    assert [b["aprovado"] for b in resp.get_json()] == [False]
+
+    resp = client.get(f"/api/v1/exames/{exame_id}/banca?ordem=xyz", headers=auth_headers)
+    assert resp.status_code == 400
+
+
+def test_criar_exame_inscreve_em_lote_com_relatorio(app, client, auth_headers):
+    from src.database import db
+    from src.models.aluno_model import AlunoModel
+    from src.models.inscricao_model import InscricaoModel
+    with app.app_context():
+        ativo = AlunoModel(nome="Ativo", data_nascimento=date(2010, 1, 1))
+        inativo = AlunoModel(nome="Inativo", data_nascimento=date(2010, 1, 1), ativo=False)
+        db.session.add_all([ativo, inativo])
+        db.session.commit()
+        ativo_id, inativo_id = ativo.id, inativo.id
+
+    payload = {
+        "nome_evento": "Graduação", "data": "2025-12-01", "hora": "09:00", "local": "Dojo",
+        "alunos_ids": [ativo_id, str(ativo_id), inativo_id, 999, "x"]
+    }
+    resp = client.post("/api/v1/exames/", json=payload, headers=auth_headers)
+    assert resp.status_code == 201
+    corpo = resp.get_json()
+    assert corpo["inscritos"] == 1
+    assert [r["status"] for r in corpo["relatorio"]] == ["inscrito", "duplicado", "inativo", "inexistente", "invalido"]
+
+    resp = client.post(f"/api/v1/exames/{corpo['exame_id']}/inscricoes", json={"alunos_ids": [ativo_id]}, headers=auth_headers)
+    assert resp.get_json()["relatorio"] == [{"aluno_id": ativo_id, "status": "ja_inscrito"}]
+    with app.app_context():
+        assert InscricaoModel.query.filter_by(fk_exame=corpo["exame_id"]).count() == 1
+
+
+def test_criar_exame_sem_alunos_validos(client, auth_headers):
+    payload = {"nome_evento": "X", "data": "2025-12-01", "hora": "09:00", "local": "Dojo", "alunos_ids": [999]}
+    resp = client.post("/api/v1/exames/", json=payload, headers=auth_headers)
+    assert resp.status_code == 400
+
+
+def test_salvar_notas_em_lote(app, client, auth_headers):
+    from src.database import db
+    from src.models.inscricao_model import InscricaoModel
+    exame_id = _criar_exame(app, "2025-03-10", [False, False])
+    outro_exame_id = _criar_exame(app, "2025-04-10", [False])
+    with app.app_context():
+        ids = [i.id for i in InscricaoModel.query.filter_by(fk_exame=exame_id).order_by(InscricaoModel.id)]
+        id_outro_exame = InscricaoModel.query.filter_by(fk_exame=outro_exame_id).first().id
+
+    payload = {"notas": [
+        {"inscricao_id": ids[0], "kihon": 8, "kata": 7, "kumite": 6, "gerais": 9},
+        {"inscricao_id": ids[1], "kihon": 11},
+        {"inscricao_id": id_outro_exame, "kihon": 5},
+    ]}
+    resp = client.post(f"/api/v1/exames/{exame_id}/notas", json=payload, headers=auth_headers)
+    assert resp.status_code == 200
+    resultados = resp.get_json()["resultados"]
+    assert resultados[0] == {"inscricao_id": ids[0], "status": "salvo", "media": 7.5, "aprovado": True}
+    assert [r["status"] for r in resultados[1:]] == ["erro", "nao_encontrada"]
+
+    with app.app_context():
+        inscricao = db.session.get(InscricaoModel, ids[0])
+        assert (inscricao.media_final, inscricao.aprovado) == (7.5, True)
+        assert db.session.get(InscricaoModel, ids[1]).nota_kihon == 0.0
+
+
+def test_nota_nao_numerica_e_erro_da_linha(app, client, auth_headers):
+    from src.database import db
+    from src.models.inscricao_model import InscricaoModel
+    exame_id = _criar_exame(app, "2025-03-10", [False, False])
+    with app.app_context():
+        ids = [i.id for i in InscricaoModel.query.filter_by(fk_exame=exame_id).order_by(InscricaoModel.id)]
+
+    payload = {"notas": [{"inscricao_id": ids[0], "kihon": 8}, {"inscricao_id": ids[1], "kihon": [1]}]}
+    resp = client.post(f"/api/v1/exames/{exame_id}/notas", json=payload, headers=auth_headers)
+    assert resp.status_code == 200
+    assert [r["status"] for r in resp.get_json()["resultados"]] == ["salvo", "erro"]
+    with app.app_context():
+        assert db.session.get(InscricaoModel, ids[0]).nota_kihon == 8.0
+
+    resp = client.post(f"/api/v1/exames/notas/{ids[1]}", json={"kata": {"a": 1}}, headers=auth_headers)
+    assert resp.status_code == 400
+
+
+def test_encerrar_exame_promove_aprovados_e_trava_notas(app, client, auth_headers):
+    from src.database import db
+    from src.models.aluno_model import AlunoModel
+    from src.models.inscricao_model import InscricaoModel
+    exame_id = _criar_exame(app, "2025-06-15", [True, True, False, True])
+    with app.app_context():
+        inscricoes = InscricaoModel.query.filter_by(fk_exame=exame_id).order_by(InscricaoModel.id).all()
+        faixas = ["Branca", "roxa", "Branca", "Preta"]
+        for inscricao, faixa in zip(inscricoes, faixas):
+            db.session.get(AlunoModel, inscricao.fk_aluno).grau_atual = faixa
+        db.session.commit()
+        alunos = [i.fk_aluno for i in inscricoes]
+        inscricao_id = inscricoes[0].id
+
+    resp = client.post(f"/api/v1/exames/{exame_id}/encerrar", headers=auth_headers)
+    assert resp.status_code == 200
+    relatorio = resp.get_json()
+    assert relatorio["qtd_promovidos"] == 2 and relatorio["qtd_reprovados"] == 1
+    assert {(p["aluno_id"], p["faixa_anterior"], p["faixa_nova"]) for p in relatorio["promovidos"]} == {
+        (alunos[0], "Branca", "Amarela"), (alunos[1], "roxa", "Marrom")}
+    assert relatorio["sem_proxima_faixa"] == [alunos[3]]
+
+    with app.app_context():
+        graus = {a.id: (a.grau_atual, a.data_ultima_graduacao.isoformat()) for a in AlunoModel.query}
+        assert graus[alunos[0]] == ("Amarela", "2025-06-15")
+        assert graus[alunos[1]][0] == "Marrom"
+        assert graus[alunos[2]][0] == "Branca" and graus[alunos[3]][0] == "Preta"
+        assert db.session.get(AlunoModel, alunos[0]).data_proxima_graduacao is not None
+
+    # Idempotente: encerrar de novo não promove outra vez
+    resp = client.post(f"/api/v1/exames/{exame_id}/encerrar", headers=auth_headers)
+    assert resp.status_code == 200 and resp.get_json()["qtd_promovidos"] == 2
+    with app.app_context():
+        assert db.session.get(AlunoModel, alunos[0]).grau_atual == "Amarela"
+
+    # Notas e inscrições travadas
+    assert client.post(f"/api/v1/exames/notas/{inscricao_id}", json={"kihon": 1}, headers=auth_headers).status_code == 409
+    resp = client.post(f"/api/v1/exames/{exame_id}/notas", json={"notas": [{"inscricao_id": inscricao_id, "kihon": 1}]},
+                       headers=auth_headers)
+    assert resp.status_code == 409
+    assert client.post(f"/api/v1/exames/{exame_id}/inscricoes", json={"alunos_ids": [alunos[2]]},
+                       headers=auth_headers).status_code == 409
+
+
+def test_estatisticas_ranking_por_faixa_e_historico(app, client, auth_headers):
+    from src.database import db
+    from src.models.aluno_model import AlunoModel
+    from src.models.exame_model import ExameModel
+    from src.models.inscricao_model import InscricaoModel
+    anterior_id = _criar_exame(app, "2025-03-10", [True, False])
+    exame_id = _criar_exame(app, "2025-06-10", [True, True, False])
+    with app.app_context():
+        db.session.query(InscricaoModel).filter_by(fk_exame=anterior_id).update({"media_final": 5.0})
+        db.session.get(ExameModel, anterior_id).encerrado = True
+        inscricoes = InscricaoModel.query.filter_by(fk_exame=exame_id).order_by(InscricaoModel.id).all()
+        for inscricao, media, faixa in zip(inscricoes, [8.0, 9.0, 8.0], ["Branca", "Amarela", "Branca"]):
+            inscricao.media_final = inscricao.nota_kihon = media
+            db.session.get(AlunoModel, inscricao.fk_aluno).grau_atual = faixa
+        db.session.commit()
+        ids = [i.id for i in inscricoes]
+
+    with app.app_context():
+        comandos = []
+        event.listen(db.engine, "before_cursor_execute", lambda *a: comandos.append(a[2]))
+        resp = client.get(f"/api/v1/exames/{exame_id}/estatisticas", headers=auth_headers)
+        # Inscrições nunca são carregadas como objetos: só consultas agregadas/janela
+        assert len(comandos) == 5
+    assert resp.status_code == 200
+    estat = resp.get_json()
+
+    ranking = {r["inscricao_id"]: r for r in estat["ranking"]}
+    assert [r["inscricao_id"] for r in estat["ranking"]][0] == ids[1]
+    assert (ranking[ids[1]]["posicao"], ranking[ids[1]]["percentil"]) == (1, 100.0)
+    assert ranking[ids[0]]["posicao"] == ranking[ids[2]]["posicao"] == 2
+    assert ranking[ids[1]]["posicao_faixa"] == 1 and ranking[ids[0]]["posicao_faixa"] == 1
+
+    assert estat["resumo"]["qtd_inscritos"] == 3 and estat["resumo"]["qtd_aprovados"] == 2
+    assert estat["resumo"]["taxa_aprovacao"] == 66.7
+    assert estat["criterios"]["kihon"] == {"media": 8.33, "minima": 8.0, "maxima": 9.0}
+    assert [(f["faixa"], f["qtd_inscritos"], f["qtd_aprovados"]) for f in estat["por_faixa"]] == [
+        ("Branca", 2, 1), ("Amarela", 1, 1)]
+
+    historico = estat["historico"]
+    assert [e["exame_id"] for e in historico["exames"]] == [anterior_id, exame_id]
+    assert historico["media_historica"] == 5.0 and historico["diferenca_media"] == 3.33
+    assert historico["posicao_media"] == 1 and historico["total_exames"] == 2
+
+    # Cache por exame: notas de outro exame não invalidam; deste exame, sim
+    etag = resp.headers["ETag"]
+    outro_id = _criar_exame(app, "2025-07-10", [False])
+    with app.app_context():
+        id_outro = InscricaoModel.query.filter_by(fk_exame=outro_id).first().id
+    client.post(f"/api/v1/exames/notas/{id_outro}", json={"kihon": 5}, headers=auth_headers)
+    resp = client.get(f"/api/v1/exames/{exame_id}/estatisticas", headers={**auth_headers, "If-None-Match": etag})
+    assert resp.status_code == 304
+
+    client.post(f"/api/v1/exames/notas/{ids[2]}", json={"kihon": 10, "kata": 10, "kumite": 10, "gerais": 10},
+                headers=auth_headers)
+    resp = client.get(f"/api/v1/exames/{exame_id}/estatisticas", headers={**auth_headers, "If-None-Match": etag})
+    assert resp.status_code == 200
+    assert resp.get_json()["ranking"][0]["inscricao_id"] == ids[2]
+
+    assert client.get("/api/v1/exames/999/estatisticas", headers=auth_headers).status_code == 404
+
+
+def test_encerrar_exame_com_data_invalida_nao_promove(app, client, auth_headers):
+    from src.database import db
+    from src.models.exame_model import ExameModel
+    exame_id = _criar_exame(app, "15/06/2025", [True])
+
+    resp = client.post(f"/api/v1/exames/{exame_id}/encerrar", headers=auth_headers)
+    assert resp.status_code == 400
+    resp = client.post(f"/api/v1/exames/{exame_id}/encerrar", json={"data_graduacao": "2025-13-01"},
+                       headers=auth_headers)
+    assert resp.status_code == 400
+    with app.app_context():
+        assert db.session.get(ExameModel, exame_id).encerrado is False
+
+    resp = client.post(f"/api/v1/exames/{exame_id}/encerrar", json={"data_graduacao": "2025-06-15"},
+                       headers=auth_headers)
+    assert resp.status_code == 200 and resp.get_json()["data_graduacao"] == "2025-06-15"
@@ -0,0 +1,88 @@
+import csv
+import io
+from datetime import date
+
+import pytest
+
+from src.database import db
+from src.models.aluno_model import AlunoModel
+from src.models.exame_model import ExameModel
+from src.models.inscricao_model import InscricaoModel
+
+
+def _popular(app):
+    with app.app_context():
+        exame = ExameModel(nome_evento="Exame", data="2025-05-01", hora="09:00", local="Dojo")
+        db.session.add(exame)
+        alunos = [
+            AlunoModel(nome="Ana", cpf="52998224725", data_nascimento=date(2012, 1, 1), grau_atual="Branca"),
+            AlunoModel(nome="Bruno", data_nascimento=date(2011, 1, 1), grau_atual="Amarela"),
+            AlunoModel(nome="Carla", data_nascimento=date(2010, 1, 1), grau_atual="Branca", ativo=False),
+        ]
+        db.session.add_all(alunos)
+        db.session.flush()
+        db.session.add(InscricaoModel(fk_exame=exame.id, fk_aluno=alunos[0].id, media_final=8.5, aprovado=True))
+        db.session.add(InscricaoModel(fk_exame=exame.id, fk_aluno=alunos[1].id, media_final=4.0, aprovado=False))
+        db.session.commit()
+        return exame.id
+
+
+def _ler_csv(resp):
+    texto = resp.get_data(as_text=True)
+    assert texto.startswith("\ufeff")
+    return list(csv.reader(io.StringIO(texto[1:]), delimiter=";"))
+
+
+def test_exporta_alunos_csv_com_filtros(app, client, auth_headers):
+    _popular(app)
+
+    resp = client.get("/api/v1/exportacao/alunos?ativo=1&faixa=branca", headers=auth_headers)
+    assert resp.status_code == 200
+    assert resp.mimetype == "text/csv"
+    assert "attachment" in resp.headers["Content-Disposition"]
+    linhas = _ler_csv(resp)
+    assert linhas[0][:3] == ["ID", "Nome", "CPF"]
+    assert [linha[1] for linha in linhas[1:]] == ["Ana"]
+    assert linhas[1][3] == "2012-01-01" and linhas[1][-1] == "Sim"
+
+    linhas = _ler_csv(client.get("/api/v1/exportacao/alunos", headers=auth_headers))
+    assert len(linhas) == 4
+
+
+def test_exporta_resultados_do_exame(app, client, auth_headers):
+    exame_id = _popular(app)
+
+    linhas = _ler_csv(client.get(f"/api/v1/exportacao/exames/{exame_id}/resultados", headers=auth_headers))
+    assert [(linha[1], linha[8], linha[9]) for linha in linhas[1:]] == [("Ana", "8.5", "Sim"), ("Bruno", "4.0", "Não")]
+
+    linhas = _ler_csv(client.get(f"/api/v1/exportacao/exames/{exame_id}/resultados?aprovado=0", headers=auth_headers))
+    assert [linha[1] for linha in linhas[1:]] == ["Bruno"]
+
+    assert client.get("/api/v1/exportacao/exames/999/resultados", headers=auth_headers).status_code == 404
+    assert client.get("/api/v1/exportacao/alunos?formato=pdf", headers=auth_headers).status_code == 400
+
+
+def test_exporta_alunos_xlsx(app, client, auth_headers):
+    openpyxl = pytest.importorskip("openpyxl")
+    _popular(app)
+
+    resp = client.get("/api/v1/exportacao/alunos?formato=xlsx&ativo=0", headers=auth_headers)
+    assert resp.status_code == 200
+    planilha = openpyxl.load_workbook(io.BytesIO(resp.data))
+    linhas = list(planilha.active.iter_rows(values_only=True))
+    assert linhas[0][1] == "Nome" and [linha[1] for linha in linhas[1:]] == ["Carla"]
+
+
+def test_exporta_faixa_do_exame_encerrado_e_escapa_formulas(app, client, auth_headers):
+    exame_id = _popular(app)
+    with app.app_context():
+        db.session.query(AlunoModel).filter_by(nome="Bruno").update({"nome": "=HYPERLINK(\"x\")"})
+        db.session.commit()
+    assert client.post(f"/api/v1/exames/{exame_id}/encerrar", headers=auth_headers).status_code == 200
+
+    linhas = _ler_csv(client.get(f"/api/v1/exportacao/exames/{exame_id}/resultados", headers=auth_headers))
+    # Ana foi promovida a Amarela no encerramento, mas prestou o exame de Branca
+    assert [(linha[1], linha[3]) for linha in linhas[1:]] == [("'=HYPERLINK(\"x\")", "Amarela"), ("Ana", "Branca")]
+
+    linhas = _ler_csv(client.get(f"/api/v1/exportacao/exames/{exame_id}/resultados?faixa=branca", headers=auth_headers))
+    assert [linha[1] for linha in linhas[1:]] == ["Ana"]
@@ -0,0 +1,122 @@
+from datetime import date, timedelta
+
+from src.database import db
+from src.models.aluno_model import AlunoModel
+from src.models.aula_model import AulaModel
+from src.models.frequencia_model import FrequenciaModel, FrequenciaMensalModel
+from src.models.professor_model import ProfessorModel
+from src.models.user_model import UserModel
+from src.services.frequencia_service import consolidar_mes
+
+# Uma segunda-feira no passado
+SEGUNDA = date.today() - timedelta(days=date.today().weekday() + 7)
+
+
+def _criar_turma(app, qtd_alunos=3):
+    from datetime import time
+    with app.app_context():
+        usuario = UserModel(nome="Sensei", email="sensei@karate.com", senha="x", nivel_acesso="professor")
+        db.session.add(usuario)
+        db.session.flush()
+        professor = ProfessorModel(nome="Sensei", cpf="12345678909", data_nascimento=date(1980, 1, 1), fk_usuario=usuario.id)
+        db.session.add(professor)
+        db.session.flush()
+        aula = AulaModel(nome_turma="Kids", modalidade="Karatê", dias_semana=["Segunda", "Quarta"],
+                         horario_inicio=time(18), horario_fim=time(19), fk_professor=professor.id)
+        alunos = [AlunoModel(nome=f"Aluno {i}", data_nascimento=date(2014, 1, 1)) for i in range(qtd_alunos)]
+        db.session.add_all([aula, *alunos])
+        db.session.commit()
+        return aula.id, [a.id for a in alunos]
+
+
+def test_chamada_em_lote_com_relatorio(client, app, auth_headers):
+    aula_id, (a1, a2, a3) = _criar_turma(app)
+    with app.app_context():
+        db.session.get(AlunoModel, a3).ativo = False
+        db.session.commit()
+
+    payload = {"data": SEGUNDA.isoformat(), "presentes": [a1, a1, 999, "x"], "ausentes": [a2, a3]}
+    resp = client.post(f"/api/v1/frequencias/aulas/{aula_id}/chamada", json=payload, headers=auth_headers)
+    assert resp.status_code == 201
+    corpo = resp.get_json()
+    assert corpo["registrados"] == 2
+    status = {(r["aluno_id"], r["status"]) for r in corpo["relatorio"]}
+    assert status == {(a1, "registrado"), (a1, "duplicado"), (999, "inexistente"), ("x", "invalido"),
+                      (a2, "registrado"), (a3, "inativo")}
+
+    # Reenviar a mesma chamada não grava nem soma de novo
+    resp = client.post(f"/api/v1/frequencias/aulas/{aula_id}/chamada",
+                       json={"data": SEGUNDA.isoformat(), "presentes": [a2]}, headers=auth_headers)
+    assert resp.get_json()["relatorio"] == [{"aluno_id": a2, "status": "ja_registrado", "presente": True}]
+
+    resp = client.get(f"/api/v1/frequencias/aulas/{aula_id}?data={SEGUNDA.isoformat()}", headers=auth_headers)
+    chamada = resp.get_json()
+    assert (chamada["presentes"], chamada["ausentes"]) == (1, 1)
+
+    with app.app_context():
+        assert FrequenciaModel.query.count() == 2
+        totais = {(t.fk_aluno, t.presencas, t.faltas) for t in FrequenciaMensalModel.query}
+        assert totais == {(a1, 1, 0), (a2, 0, 1)}
+
+
+def test_chamada_valida_dia_e_data(client, app, auth_headers):
+    aula_id, (a1, *_) = _criar_turma(app, 1)
+    url = f"/api/v1/frequencias/aulas/{aula_id}/chamada"
+    terca = SEGUNDA + timedelta(days=1)
+    assert client.post(url, json={"data": terca.isoformat(), "presentes": [a1]}, headers=auth_headers).status_code == 400
+    futuro = SEGUNDA + timedelta(days=14)
+    assert client.post(url, json={"data": futuro.isoformat(), "presentes": [a1]}, headers=auth_headers).status_code == 400
+    assert client.post(url, json={"data": SEGUNDA.isoformat()}, headers=auth_headers).status_code == 400
+    assert client.post("/api/v1/frequencias/aulas/999/chamada", json={"presentes": [a1]}, headers=auth_headers).status_code == 404
+
+
+def test_historico_do_aluno_e_totais_mensais(client, app, auth_headers):
+    aula_id, (a1, a2) = _criar_turma(app, 2)
+    quarta = SEGUNDA + timedelta(days=2)
+    url = f"/api/v1/frequencias/aulas/{aula_id}/chamada"
+    client.post(url, json={"data": SEGUNDA.isoformat(), "presentes": [a1, a2]}, headers=auth_headers)
+    client.post(url, json={"data": quarta.isoformat(), "presentes": [a2], "ausentes": [a1]}, headers=auth_headers)
+
+    resp = client.get(f"/api/v1/frequencias/alunos/{a1}?inicio={SEGUNDA.isoformat()}&fim={quarta.isoformat()}",
+                      headers=auth_headers)
+    historico = resp.get_json()
+    assert (historico["presencas"], historico["faltas"], historico["percentual_presenca"]) == (1, 1, 50.0)
+    assert [r["data"] for r in historico["registros"]] == [quarta.isoformat(), SEGUNDA.isoformat()]
+
+    with app.app_context():
+        esperado = {(t.fk_aluno, t.mes, t.presencas, t.faltas) for t in FrequenciaMensalModel.query}
+        # Reconstruir a partir das linhas brutas dá os mesmos totais
+        for mes in {SEGUNDA.replace(day=1), quarta.replace(day=1)}:
+            consolidar_mes(mes)
+        db.session.commit()
+        assert {(t.fk_aluno, t.mes, t.presencas, t.faltas) for t in FrequenciaMensalModel.query} == esperado
+
+    resp = client.get(f"/api/v1/frequencias/mensal?mes={quarta:%Y-%m}&aluno_id={a2}", headers=auth_headers)
+    totais = resp.get_json()["totais"]
+    assert totais[0]["aluno_nome"] == "Aluno 1" and totais[0]["nome_turma"] == "Kids"
+
+    # Aula com frequência não pode ser apagada
+    assert client.delete(f"/api/v1/aulas/{aula_id}", headers=auth_headers).status_code == 409
+
+
+def test_chamada_sem_on_conflict_confere_linhas_existentes(client, app, auth_headers, monkeypatch):
+    # Simula um banco sem ON CONFLICT: mesmo resultado pelo caminho genérico
+    monkeypatch.setattr("src.services.frequencia_service._insert_dialeto", lambda tabela: None)
+    aula_id, (a1, a2) = _criar_turma(app, 2)
+    url = f"/api/v1/frequencias/aulas/{aula_id}/chamada"
+    quarta = SEGUNDA + timedelta(days=2)
+
+    assert client.post(url, json={"data": SEGUNDA.isoformat(), "presentes": [a1]}, headers=auth_headers).status_code == 201
+    resp = client.post(url, json={"data": SEGUNDA.isoformat(), "presentes": [a1], "ausentes": [a2]}, headers=auth_headers)
+    assert {(r["aluno_id"], r["status"]) for r in resp.get_json()["relatorio"]} == {(a1, "ja_registrado"), (a2, "registrado")}
+    client.post(url, json={"data": quarta.isoformat(), "presentes": [a1, a2]}, headers=auth_headers)
+
+    with app.app_context():
+        assert FrequenciaModel.query.count() == 4
+        totais = {(t.fk_aluno, t.mes, t.presencas, t.faltas) for t in FrequenciaMensalModel.query}
+        assert sum(t[2] for t in totais) == 3 and sum(t[3] for t in totais) == 1
+        # Reconstruir a partir das linhas brutas dá os mesmos totais
+        for mes in {SEGUNDA.replace(day=1), quarta.replace(day=1)}:
+            consolidar_mes(mes)
+        db.session.commit()
+        assert {(t.fk_aluno, t.mes, t.presencas, t.faltas) for t in FrequenciaMensalModel.query} == totais
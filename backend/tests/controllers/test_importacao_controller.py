@@ -0,0 +1,91 @@
+import io
+
+from src.commands.seed_command import gerar_cpf
+from src.database import db
+from src.models.aluno_model import AlunoModel
+
+CABECALHO = "nome;cpf;data_nascimento;sexo;grau_atual;telefone\n"
+
+
+def _enviar(client, headers, conteudo, query=""):
+    dados = {"arquivo": (io.BytesIO(conteudo.encode("utf-8")), "alunos.csv")}
+    return client.post(f"/api/v1/importacao/alunos{query}", data=dados, headers=headers,
+                       content_type="multipart/form-data")
+
+
+def test_importa_csv_com_relatorio_por_linha(app, client, auth_headers):
+    cpf_a, cpf_b = gerar_cpf(123456789), gerar_cpf(987654321)
+    conteudo = CABECALHO + (
+        f"Ana Souza;{cpf_a};2014-03-02;Feminino;Branca;(11) 98888-7777\n"
+        f"Bruno Lima;{cpf_b};15/08/2012;Masculino;Amarela;\n"
+        "Carla Reis;111.111.111-11;2013-01-01;Feminino;Branca;\n"
+        f"Davi Costa;{cpf_a};2013-01-01;Masculino;Branca;\n"
+        ";;2013-13-40;;;123\n"
+    )
+
+    resp = _enviar(client, auth_headers, conteudo)
+    assert resp.status_code == 200
+    relatorio = resp.get_json()
+    assert (relatorio["total"], relatorio["inseridos"], relatorio["atualizados"]) == (5, 2, 0)
+    assert [e["linha"] for e in relatorio["erros"]] == [4, 5, 6]
+    assert "CPF inválido." in relatorio["erros"][0]["erros"]
+    assert "repetido" in relatorio["erros"][1]["erros"][0]
+    assert len(relatorio["erros"][2]["erros"]) == 3  # obrigatórios, telefone e data
+
+    with app.app_context():
+        bruno = AlunoModel.query.filter_by(cpf=cpf_b).one()
+        assert bruno.data_nascimento.isoformat() == "2012-08-15"
+        assert AlunoModel.query.filter_by(cpf=cpf_a).one().telefone == "11988887777"
+
+
+def test_importa_atualiza_ou_rejeita_cpf_existente(app, client, auth_headers):
+    cpf = gerar_cpf(222333444)
+    _enviar(client, auth_headers, CABECALHO + f"Ana;{cpf};2014-03-02;Feminino;Branca;\n")
+
+    linha = CABECALHO + f"Ana Paula;{cpf};2014-03-02;Feminino;Amarela;\n"
+    relatorio = _enviar(client, auth_headers, linha, "?atualizar=0").get_json()
+    assert relatorio["inseridos"] == relatorio["atualizados"] == 0
+    assert relatorio["erros"][0]["erros"] == ["Este CPF já está cadastrado."]
+
+    relatorio = _enviar(client, auth_headers, linha).get_json()
+    assert relatorio["atualizados"] == 1
+    with app.app_context():
+        assert db.session.query(AlunoModel.grau_atual).filter_by(cpf=cpf).scalar() == "Amarela"
+
+
+def test_importacao_sem_arquivo(client, auth_headers):
+    resp = client.post("/api/v1/importacao/alunos", headers=auth_headers)
+    assert resp.status_code == 400
+
+
+def test_reimportacao_parcial_mantem_colunas_ausentes(app, client, auth_headers):
+    cpf = gerar_cpf(555666777)
+    completo = ("nome;cpf;data_nascimento;sexo;grau_atual;telefone;endereco;nome_pais;data_ultima_graduacao\n"
+                f"Ana;{cpf};2014-03-02;Feminino;Branca;(11) 98888-7777;Rua A, 1;Maria;2023-05-10\n")
+    _enviar(client, auth_headers, completo)
+
+    relatorio = _enviar(client, auth_headers, CABECALHO + f"Ana Paula;{cpf};2014-03-02;Feminino;Cinza;\n").get_json()
+    assert relatorio["atualizados"] == 1
+
+    with app.app_context():
+        aluno = AlunoModel.query.filter_by(cpf=cpf).one()
+        assert (aluno.nome, aluno.grau_atual) == ("Ana Paula", "Cinza")
+        assert (aluno.endereco, aluno.nome_pais) == ("Rua A, 1", "Maria")
+        assert aluno.data_ultima_graduacao.isoformat() == "2023-05-10"
+        assert aluno.telefone is None  # coluna presente e vazia: apaga
+
+
+def test_importacao_interrompida_por_trecho_fora_de_utf8(app, client, auth_headers):
+    linhas = "".join(f"Aluno {i};{gerar_cpf(100000000 + i)};2014-03-02;Feminino;Branca;\n" for i in range(400))
+    conteudo = (CABECALHO + linhas).encode("utf-8") + "João;1;2014-03-02;M;Branca;\n".encode("latin-1")
+    dados = {"arquivo": (io.BytesIO(conteudo), "alunos.csv")}
+    resp = client.post("/api/v1/importacao/alunos", data=dados, headers=auth_headers,
+                       content_type="multipart/form-data")
+
+    assert resp.status_code == 200
+    relatorio = resp.get_json()
+    assert relatorio["interrompido"] is True
+    assert 0 < relatorio["inseridos"] <= 400
+    assert "UTF-8" in relatorio["erros"][-1]["erros"][0]
+    with app.app_context():
+        assert AlunoModel.query.count() == relatorio["inseridos"]
@@ -8,3 +8,40 @@ def test_criar_professor_smoke(client):
     resp = client.post("/professores", json=payload)
     assert resp.status_code in (201, 400, 404)
     assert resp.status_code != 500
+
+
+def _professor_payload():
+    return {"nome": "Sensei", "email": "sensei@dojo.com", "senha": "123456", "cpf": "529.982.247-25",
+            "data_nascimento": "1980-05-01", "telefone": "11999998888", "grau": "Preta"}
+
+
+def test_niveis_de_acesso_nas_rotas(client, auth_headers, aluno_headers):
+    assert client.get("/api/v1/aulas/", headers=aluno_headers).status_code == 200
+    assert client.get("/api/v1/professores/", headers=aluno_headers).status_code == 403
+    assert client.post("/api/v1/professores/", json=_professor_payload(), headers=aluno_headers).status_code == 403
+
+    resp = client.post("/api/v1/professores/", json=_professor_payload(), headers=auth_headers)
+    assert resp.status_code == 201
+    professor_id = resp.get_json()["professor"]["id"]
+    assert client.delete(f"/api/v1/professores/{professor_id}", headers=aluno_headers).status_code == 403
+
+
+def test_professor_inativado_perde_acesso_na_hora(app, client, auth_headers):
+    from sqlalchemy import event
+    from src.database import db
+
+    professor_id = client.post("/api/v1/professores/", json=_professor_payload(), headers=auth_headers).get_json()["professor"]["id"]
+    login = client.post("/api/v1/users/login", json={"email": "sensei@dojo.com", "senha": "123456"})
+    headers = {"Authorization": f"Bearer {login.get_json()['token']}"}
+
+    # Papel já em cache desde o login: a checagem não vai ao banco
+    with app.app_context():
+        comandos = []
+        event.listen(db.engine, "before_cursor_execute", lambda *a: comandos.append(a[2]))
+        assert client.get("/api/v1/exames/", headers=headers).status_code == 200
+        assert not any("usuarios" in sql for sql in comandos)
+
+    assert client.delete(f"/api/v1/professores/{professor_id}", headers=headers).status_code == 403
+    assert client.delete(f"/api/v1/professores/{professor_id}", headers=auth_headers).status_code == 200
+    assert client.get("/api/v1/exames/", headers=headers).status_code == 401
+    assert client.post("/api/v1/users/login", json={"email": "sensei@dojo.com", "senha": "123456"}).status_code == 403
@@ -0,0 +1,26 @@
+from datetime import date
+
+
+def test_stats_agrega_no_banco(app, client, auth_headers):
+    from src.database import db
+    from src.models.aluno_model import AlunoModel
+    ano = date.today().year
+    with app.app_context():
+        db.session.add_all([
+            AlunoModel(nome="A", data_nascimento=date(ano - 8, 1, 1), sexo="Masculino"),
+            AlunoModel(nome="B", data_nascimento=date(ano - 12, 1, 1), sexo="Feminino"),
+            AlunoModel(nome="C", data_nascimento=date(ano - 30, 1, 1), sexo="Feminino"),
+            AlunoModel(nome="D", data_nascimento=date(ano - 17, 1, 1), sexo="Feminino", ativo=False),
+        ])
+        db.session.commit()
+
+    resp = client.get("/api/v1/stats/", headers=auth_headers)
+    assert resp.status_code == 200
+    dados = resp.get_json()
+    assert dados["total_alunos"] == 3
+    assert dados["faixa_etaria"] == {"Até 10": 1, "11-15": 1, "16-18": 0, "19+": 1}
+    assert dados["sexo"] == {"Masculino": 1, "Feminino": 2}
+
+    etag = resp.headers["ETag"]
+    resp = client.get("/api/v1/stats/", headers={**auth_headers, "If-None-Match": etag})
+    assert resp.status_code == 304
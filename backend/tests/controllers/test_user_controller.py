@@ -8,3 +8,46 @@ def test_criar_user_smoke(client):
     resp = client.post("/users", json=payload)
     assert resp.status_code in (201, 400, 404)
     assert resp.status_code != 500
+
+
+def test_registrar_e_logar(client):
+    dados = {"nome": "Sensei", "email": "sensei@test.com", "senha": "123456"}
+    assert client.post("/api/v1/users/register", json=dados).status_code == 201
+
+    resp = client.post("/api/v1/users/login", json={"email": dados["email"], "senha": dados["senha"]})
+    assert resp.status_code == 200
+    assert resp.get_json()["token"]
+
+    resp = client.post("/api/v1/users/login", json={"email": dados["email"], "senha": "errada"})
+    assert resp.status_code == 401
+
+
+def test_login_responde_503_com_fila_de_hash_cheia(client, monkeypatch):
+    from src.models.user_model import UserModel
+    from src.services.hash_service import HashIndisponivelError
+
+    client.post("/api/v1/users/register", json={"nome": "A", "email": "a@test.com", "senha": "123456"})
+
+    def fila_cheia(self, senha):
+        raise HashIndisponivelError("ocupado")
+
+    monkeypatch.setattr(UserModel, "check_password", fila_cheia)
+    resp = client.post("/api/v1/users/login", json={"email": "a@test.com", "senha": "123456"})
+    assert resp.status_code == 503
+    assert resp.headers["Retry-After"] == "1"
+
+
+def test_logout_revoga_so_o_token_usado(client):
+    dados = {"nome": "Sensei", "email": "sensei@test.com", "senha": "123456"}
+    client.post("/api/v1/users/register", json=dados)
+    tokens = [client.post("/api/v1/users/login", json={"email": dados["email"], "senha": dados["senha"]}).get_json()["token"]
+              for _ in range(2)]
+    headers = [{"Authorization": f"Bearer {token}"} for token in tokens]
+
+    assert client.post("/api/v1/users/logout", headers=headers[0]).status_code == 200
+    assert client.get("/api/v1/aulas/", headers=headers[0]).status_code == 401
+    assert client.get("/api/v1/aulas/", headers=headers[1]).status_code == 200
+
+    # Sair de todos os dispositivos
+    assert client.post("/api/v1/users/logout", json={"todos": True}, headers=headers[1]).status_code == 200
+    assert client.get("/api/v1/aulas/", headers=headers[1]).status_code == 401
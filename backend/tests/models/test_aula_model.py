@@ -1,3 +1,8 @@
+import pytest
+
+from src.models.aula_model import AulaModel, bit_do_dia, dias_para_mascara, mascara_para_dias
+
+
 def test_model_aula_criacao(app):
     try:
         from src.database import db
@@ -10,3 +15,23 @@ def test_model_aula_criacao(app):
         db.session.add(aula)
         db.session.commit()
         assert aula.id is not None
+
+
+def test_conversao_dias_mascara():
+    assert dias_para_mascara(["Segunda", "Quarta"]) == 0b101
+    assert dias_para_mascara(["terça", "SAB", "Domingo"]) == 2 | 32 | 64
+    assert mascara_para_dias(2 | 32 | 64) == ["Terça", "Sábado", "Domingo"]
+    assert bit_do_dia("sexta-feira") == 16
+    with pytest.raises(ValueError):
+        dias_para_mascara(["Segunda", "Feriado"])
+
+
+def test_indices_parciais_por_dia_declarados_no_modelo():
+    from sqlalchemy.dialects import postgresql
+    from sqlalchemy.schema import CreateIndex
+
+    indices = {ix.name: ix for ix in AulaModel.__table__.indexes if ix.name.startswith('ix_aulas_dia_')}
+    assert sorted(indices) == sorted(f'ix_aulas_dia_{c}' for c in ('seg', 'ter', 'qua', 'qui', 'sex', 'sab', 'dom'))
+    ddl = str(CreateIndex(indices['ix_aulas_dia_qua']).compile(dialect=postgresql.dialect()))
+    # Mesmo predicado da migração e de AulaModel.filtro_dias, senão o planner não usa o índice
+    assert ddl.endswith('WHERE (dias_mask & 4) <> 0')
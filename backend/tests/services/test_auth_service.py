@@ -0,0 +1,29 @@
+import pytest
+
+from src.services.auth_service import _CachePapeis, papel_requerido
+
+
+def test_cache_papeis_expira_e_descarta_o_menos_usado(monkeypatch):
+    agora = [100.0]
+    monkeypatch.setattr("src.services.auth_service.time.monotonic", lambda: agora[0])
+    cache = _CachePapeis(max_itens=2, ttl=60)
+    cache.guardar(1, ("admin", True))
+    cache.guardar(2, None)  # usuário inexistente também fica em cache
+    assert cache.obter(2) == (True, None)
+
+    cache.obter(1)
+    cache.guardar(3, ("aluno", True))
+    assert cache.obter(2) == (False, None)
+    assert cache.obter(1) == (True, ("admin", True))
+
+    agora[0] += 61
+    assert cache.obter(1) == (False, None)
+
+    cache.guardar(3, ("aluno", True))
+    cache.invalidar(3)
+    assert cache.obter(3) == (False, None)
+
+
+def test_papel_desconhecido_falha_na_declaracao():
+    with pytest.raises(ValueError):
+        papel_requerido("sensei")
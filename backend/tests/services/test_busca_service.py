@@ -0,0 +1,18 @@
+from src.services.busca_service import normalizar, similaridade, similaridade_palavra, trigramas
+
+
+def test_normalizar_remove_acentos_e_espacos():
+    assert normalizar("  João   DA Silva ") == "joao da silva"
+
+
+def test_trigramas_no_formato_pg_trgm():
+    assert trigramas("cat") == {"  c", " ca", "cat", "at "}
+
+
+def test_similaridade_tolera_erro_de_digitacao():
+    assert similaridade("silva", "silva") == 1.0
+    assert similaridade("silvia", "silva") > similaridade("souza", "silva")
+
+
+def test_similaridade_palavra_acha_trecho_do_nome():
+    assert similaridade_palavra("joao", "maria joao silva") == 1.0
@@ -0,0 +1,19 @@
+from src.services.cache_service import _EstadoCache
+
+
+def test_lru_descarta_o_menos_usado():
+    estado = _EstadoCache(max_itens=2, ttl=0)
+    estado.guardar("a", 1)
+    estado.guardar("b", 2)
+    estado.obter("a")
+    estado.guardar("c", 3)
+    assert estado.obter("b") is None
+    assert estado.obter("a") == 1 and estado.obter("c") == 3
+
+
+def test_invalidar_incrementa_a_versao():
+    estado = _EstadoCache(max_itens=2, ttl=0)
+    assert estado.versao("alunos") == 0
+    estado.invalidar("alunos")
+    assert estado.versao("alunos") == 1
+    assert estado.versao("aulas") == 0
@@ -0,0 +1,64 @@
+from datetime import date
+
+from src.database import db
+from src.models.aluno_model import AlunoModel
+from src.services.graduacao_service import calcular_data_proxima, proxima_faixa, recalcular
+
+CARENCIAS = {'Branca': 3, 'Roxa': 10, 'Marrom': 12}
+IDADES = {'Marrom': 14, 'Preta': 16}
+
+
+def test_proxima_faixa():
+    assert proxima_faixa('Branca') == 'Amarela'
+    assert proxima_faixa(' roxa ') == 'Marrom'
+    assert proxima_faixa('Preta') is None
+    assert proxima_faixa('Azul') is None
+
+
+def test_data_proxima_usa_carencia_e_idade_minima():
+    # Carência: 3 meses na branca (31/01 + 3 meses -> 30/04)
+    assert calcular_data_proxima('Branca', date(2025, 1, 31), date(2015, 1, 1), CARENCIAS, IDADES) == date(2025, 4, 30)
+    # Idade mínima da marrom (14 anos) é mais tardia que a carência da roxa
+    assert calcular_data_proxima('Roxa', date(2025, 1, 1), date(2013, 6, 10), CARENCIAS, IDADES) == date(2027, 6, 10)
+    assert calcular_data_proxima('Preta', date(2025, 1, 1), date(1990, 1, 1), CARENCIAS, IDADES) is None
+
+
+def test_recalcular_em_lote_grava_so_o_que_mudou(app, monkeypatch):
+    monkeypatch.setenv('GRADUACAO_CARENCIA_MESES', 'Branca=6')
+    with app.app_context():
+        db.session.add_all([
+            AlunoModel(nome='A', data_nascimento=date(2015, 1, 1), grau_atual='Branca', data_ultima_graduacao=date(2025, 1, 10)),
+            AlunoModel(nome='B', data_nascimento=date(1990, 1, 1), grau_atual='Preta', data_ultima_graduacao=date(2020, 1, 1)),
+        ])
+        db.session.commit()
+
+        assert recalcular() == 1
+        db.session.commit()
+        assert db.session.query(AlunoModel.data_proxima_graduacao).filter_by(nome='A').scalar() == date(2025, 7, 10)
+        assert recalcular() == 0
+
+
+def test_recalcular_no_banco_igual_ao_calculo_em_python(app):
+    import random
+    from datetime import timedelta
+    from src.models.aluno_model import FAIXAS
+    from src.services.graduacao_service import CARENCIA_MESES_PADRAO, IDADE_MINIMA_PADRAO
+
+    rnd = random.Random(3)
+    faixas = FAIXAS + [' roxa ', 'MARROM', 'Azul', None]
+    with app.app_context():
+        for i in range(300):
+            db.session.add(AlunoModel(
+                nome=f'A{i}', grau_atual=rnd.choice(faixas),
+                # Muitos fins de mês (29 a 31) para conferir o limite do dia
+                data_nascimento=date(2000, 1, 1) + timedelta(days=rnd.randint(0, 6000)),
+                data_ultima_graduacao=rnd.choice([None, date(2024, rnd.randint(1, 12), 1) + timedelta(days=rnd.randint(27, 30))]),
+            ))
+        db.session.commit()
+        recalcular()
+        db.session.commit()
+
+        for aluno in AlunoModel.query:
+            esperado = calcular_data_proxima(aluno.grau_atual, aluno.data_ultima_graduacao, aluno.data_nascimento,
+                                             CARENCIA_MESES_PADRAO, IDADE_MINIMA_PADRAO)
+            assert aluno.data_proxima_graduacao == esperado, (aluno.grau_atual, aluno.data_ultima_graduacao)
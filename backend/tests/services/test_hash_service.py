@@ -0,0 +1,33 @@
+import threading
+import time
+
+import pytest
+
+from src.services.hash_service import ExecutorHash, HashIndisponivelError, configurar, gerar_hash, verificar_hash
+
+
+def test_hash_e_verificacao_pelo_executor():
+    configurar(max_concorrencia=2, timeout_fila=1)
+    senha_hash = gerar_hash("segredo")
+    assert verificar_hash(senha_hash, "segredo")
+    assert not verificar_hash(senha_hash, "outra")
+
+
+def test_executor_desativado_roda_na_thread_atual():
+    executor = ExecutorHash(max_concorrencia=0, timeout_fila=1)
+    assert executor.executar(threading.current_thread) is threading.current_thread()
+
+
+def test_fila_cheia_estoura_timeout():
+    executor = ExecutorHash(max_concorrencia=1, timeout_fila=0.05)
+    liberar = threading.Event()
+    ocupante = threading.Thread(target=executor.executar, args=(liberar.wait,))
+    ocupante.start()
+    time.sleep(0.05)
+    try:
+        with pytest.raises(HashIndisponivelError):
+            executor.executar(lambda: None)
+    finally:
+        liberar.set()
+        ocupante.join()
+        executor.encerrar()
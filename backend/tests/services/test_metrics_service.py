@@ -0,0 +1,27 @@
+from src.services.metrics_service import Histograma
+
+
+def test_histograma_acumula_buckets():
+    hist = Histograma((1, 5))
+    for valor in (0, 3, 3, 9):
+        hist.observar(valor)
+    linhas = list(hist.linhas("m", 'rota="/"'))
+    assert 'm_bucket{rota="/",le="1"} 1' in linhas
+    assert 'm_bucket{rota="/",le="5"} 3' in linhas
+    assert 'm_bucket{rota="/",le="+Inf"} 4' in linhas
+    assert 'm_count{rota="/"} 4' in linhas
+
+
+def test_metrics_conta_sql_por_rota(client, auth_headers):
+    client.get("/api/v1/exames/", headers=auth_headers)
+    texto = client.get("/metrics").get_data(as_text=True)
+    assert 'karate_http_requisicoes_total{metodo="GET",rota="/api/v1/exames/",status="200"} 1' in texto
+    # list_exames roda exatamente um SELECT
+    assert 'karate_sql_comandos_por_requisicao_bucket{metodo="GET",rota="/api/v1/exames/",le="0"} 0' in texto
+    assert 'karate_sql_comandos_por_requisicao_bucket{metodo="GET",rota="/api/v1/exames/",le="1"} 1' in texto
+
+
+def test_metrics_exige_token_quando_configurado(client, monkeypatch):
+    monkeypatch.setenv("METRICS_TOKEN", "segredo")
+    assert client.get("/metrics").status_code == 401
+    assert client.get("/metrics", headers={"Authorization": "Bearer segredo"}).status_code == 200
@@ -0,0 +1,55 @@
+import time
+import uuid
+
+from src.services.revogacao_service import FiltroBloom
+
+
+def test_filtro_bloom_sem_falso_negativo_e_poucos_falsos_positivos():
+    filtro = FiltroBloom(1000, taxa_erro=0.01)
+    revogados = [uuid.uuid4().hex for _ in range(1000)]
+    for jti in revogados:
+        filtro.adicionar(jti)
+    assert all(jti in filtro for jti in revogados)
+    falsos = sum(uuid.uuid4().hex in filtro for _ in range(10000))
+    assert falsos < 300
+
+
+def test_revogacao_vista_por_outro_worker_depois_da_sincronia(app):
+    from src.database import db
+    from src.services.revogacao_service import revogacao, revogar_token, revogar_usuario
+    with app.app_context():
+        revogacao.sincronizar()
+        payload = {"sub": "7", "jti": uuid.uuid4().hex, "iat": int(time.time()) - 1, "exp": int(time.time()) + 3600}
+        outro = {**payload, "sub": "8", "jti": uuid.uuid4().hex}
+
+        # Gravado por "outro worker": este só enxerga depois de sincronizar
+        revogar_token(payload["jti"], 7, payload["exp"])
+        revogar_usuario(8)
+        db.session.commit()
+        assert not revogacao.revogado(payload) and not revogacao.revogado(outro)
+
+        revogacao.sincronizar()
+        assert revogacao.revogado(payload) and revogacao.revogado(outro)
+        assert not revogacao.revogado({**payload, "jti": uuid.uuid4().hex})
+        # Token emitido depois do corte do usuário continua valendo
+        assert not revogacao.revogado({**outro, "jti": uuid.uuid4().hex, "iat": int(time.time()) + 5})
+
+
+def test_login_no_mesmo_segundo_do_corte_nao_nasce_revogado(app):
+    from datetime import datetime, timezone
+    from src.database import db
+    from src.models.token_revogado_model import TokenRevogadoModel
+    from src.services.revogacao_service import revogacao, revogar_usuario
+    with app.app_context():
+        revogar_usuario(9)
+        db.session.commit()
+        # Corte no meio de um segundo, como no "sair de todos" seguido de novo login
+        corte = datetime(2030, 1, 1, 12, 0, 0, 700000)
+        TokenRevogadoModel.query.filter_by(fk_usuario=9).update({"revogado_em": corte})
+        db.session.commit()
+        revogacao.sincronizar()
+
+        segundo = int(corte.replace(tzinfo=timezone.utc).timestamp())
+        token = {"sub": "9", "jti": uuid.uuid4().hex, "exp": segundo + 3600}
+        assert revogacao.revogado({**token, "iat": segundo - 1})
+        assert not revogacao.revogado({**token, "iat": segundo})
@@ -0,0 +1,53 @@
+import dataclasses
+import uuid
+from datetime import date, datetime, time
+from decimal import Decimal
+
+import pytest
+
+
+def test_projecao_igual_ao_to_json(app):
+    from src.database import db
+    from src.models.aluno_model import AlunoModel
+    from src.models.professor_model import ProfessorModel
+    from src.models.user_model import UserModel
+    from src.services.serializacao_service import ALUNO_JSON, PROFESSOR_JSON
+    with app.app_context():
+        usuario = UserModel(nome="Sensei", email="s@dojo.com", senha="123456", nivel_acesso="professor")
+        db.session.add(usuario)
+        db.session.flush()
+        db.session.add_all([
+            AlunoModel(nome="Ana", cpf="52998224725", data_nascimento=date(2010, 1, 2), sexo="Feminino",
+                       data_proxima_graduacao=None),
+            ProfessorModel(nome="Sensei", cpf="11144477735", data_nascimento=date(1980, 5, 1), fk_usuario=usuario.id),
+        ])
+        db.session.commit()
+
+        for projecao, modelo in ((ALUNO_JSON, AlunoModel), (PROFESSOR_JSON, ProfessorModel)):
+            projetadas = app.json.loads(app.json.dumps(projecao.linhas(projecao.select())))
+            assert projetadas == [obj.to_json() for obj in modelo.query]
+
+
+@dataclasses.dataclass
+class Faixa:
+    nome: str
+    meses: int
+
+
+@pytest.mark.parametrize("sem_orjson", [False, True])
+def test_provider_json_datas_em_iso(app, monkeypatch, sem_orjson):
+    if sem_orjson:
+        monkeypatch.setattr("src.json_provider.orjson", None)
+    dados = {"d": date(2025, 3, 1), "dt": datetime(2025, 3, 1, 9, 30), "h": time(18, 0), "v": Decimal("7.5")}
+    assert app.json.loads(app.json.dumps(dados)) == {
+        "d": "2025-03-01", "dt": "2025-03-01T09:30:00", "h": "18:00:00", "v": "7.5"}
+    with app.test_request_context():
+        resposta = app.json.response(dados)
+    assert resposta.mimetype == "application/json"
+    assert resposta.get_json()["d"] == "2025-03-01"
+
+    ident = uuid.UUID(int=1)
+    assert app.json.loads(app.json.dumps({"id": ident, "faixa": Faixa("Roxa", 10)})) == {
+        "id": str(ident), "faixa": {"nome": "Roxa", "meses": 10}}
+    with pytest.raises(TypeError):
+        app.json.dumps({"x": object()})
@@ -0,0 +1,57 @@
+from datetime import date
+
+from src.database import QueuePoolMedido, opcoes_engine
+
+
+def test_opcoes_engine_postgres_lidas_do_ambiente(monkeypatch):
+    monkeypatch.setenv("DB_POOL_SIZE", "3")
+    monkeypatch.setenv("DB_STATEMENT_TIMEOUT_MS", "5000")
+    monkeypatch.setenv("DB_POOL_PRE_PING", "false")
+    opcoes = opcoes_engine("postgresql+psycopg2://u:s@host:5432/karate")
+    assert opcoes["poolclass"] is QueuePoolMedido
+    assert opcoes["pool_size"] == 3
+    assert opcoes["pool_pre_ping"] is False
+    assert opcoes["connect_args"]["options"] == "-c statement_timeout=5000"
+
+
+def test_opcoes_engine_sqlite_usa_padroes():
+    assert opcoes_engine("sqlite:///:memory:") == {}
+
+
+def test_status_pool(client, auth_headers):
+    resp = client.get("/api/v1/status/pool", headers=auth_headers)
+    assert resp.status_code == 200
+    assert "principal" in resp.get_json()
+
+
+def test_rotas_somente_leitura_usam_a_replica(tmp_path, monkeypatch):
+    from flask_jwt_extended import create_access_token
+    from sqlalchemy import insert
+    from src.app import create_app
+    from src.database import db
+    from src.models.aluno_model import AlunoModel
+    from src.models.professor_model import ProfessorModel
+    from src.models.token_revogado_model import TokenRevogadoModel
+    from src.models.user_model import UserModel
+
+    monkeypatch.setenv("DATABASE_URL", f"sqlite:///{tmp_path / 'primario.db'}")
+    monkeypatch.setenv("DATABASE_REPLICA_URL", f"sqlite:///{tmp_path / 'replica.db'}")
+    monkeypatch.setenv("DB_REPLICA_JANELA", "0")
+    app = create_app()
+    with app.app_context():
+        for engine in db.engines.values():
+            for tabela in (UserModel.__table__, ProfessorModel.__table__, TokenRevogadoModel.__table__,
+                           AlunoModel.__table__):
+                tabela.create(engine)
+        with db.engines["replica"].begin() as conn:
+            conn.execute(AlunoModel.__table__.insert(), {"nome": "Só na réplica", "data_nascimento": date(2010, 1, 1), "ativo": True})
+        # O papel do usuário é conferido no primário
+        usuario_id = db.session.execute(
+            insert(UserModel).returning(UserModel.id),
+            {"nome": "Admin", "email": "admin@teste.com", "senha_hash": "-", "nivel_acesso": "admin"}
+        ).scalar_one()
+        db.session.commit()
+        token = create_access_token(identity=str(usuario_id))
+
+    resp = app.test_client().get("/api/v1/alunos/", headers={"Authorization": f"Bearer {token}"})
+    assert [a["nome"] for a in resp.get_json()] == ["Só na réplica"]
@@ -27,6 +27,7 @@ document.addEventListener('DOMContentLoaded', () => {
 });
 
 function handleLogout() {
+    revogarToken(); // revoga o token no servidor (js/logout.js)
     localStorage.removeItem('token');
     localStorage.removeItem('user');
     alert("Sessão encerrada.");
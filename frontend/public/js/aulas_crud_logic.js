@@ -205,12 +205,14 @@ async function salvarEdicao() {
       body: JSON.stringify(data),
     });
 
+    const result = await response.json();
     if (response.ok) {
         showFeedback("Aula atualizada com sucesso!");
         document.getElementById("edit-modal").classList.add("hidden");
         carregarAulas();
     } else {
-        showFeedback("Erro ao atualizar.", "error");
+        // 409: o backend informa a aula do professor que conflita com o horário
+        showFeedback(result.message || "Erro ao atualizar.", "error");
     }
   } catch {
     showFeedback("Erro de conexão.", "error");
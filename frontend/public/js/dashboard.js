@@ -71,46 +71,17 @@ document.addEventListener('DOMContentLoaded', async () => {
     }
   }
 
-  // ==================== ESTATÍSTICAS DE ALUNOS ====================
-  async function loadAlunoStats() {
-    const API = 'https://gestao-karate-backend.onrender.com/api/v1/alunos/';
+  // ==================== ESTATÍSTICAS (CALCULADAS NO SERVIDOR) ====================
+  async function loadStats() {
+    const API = 'https://gestao-karate-backend.onrender.com/api/v1/stats/';
 
-    const alunos = await fetchData(API);
-    if (!alunos) return;
+    const stats = await fetchData(API);
+    if (!stats || Array.isArray(stats)) return;
 
-    statsAlunosElement.textContent = alunos.length;
+    statsAlunosElement.textContent = stats.total_alunos;
+    statsProfessoresElement.textContent = stats.total_professores;
 
-    const agora = new Date();
-    const faixas = { "Até 10": 0, "11-15": 0, "16-18": 0, "19+": 0 };
-    const sexos = { Masculino: 0, Feminino: 0 };
-
-    alunos.forEach(a => {
-      // Sexo
-      if (a.sexo === "Masculino") sexos.Masculino++;
-      else if (a.sexo === "Feminino") sexos.Feminino++;
-
-      // Idade
-      if (!a.data_nascimento) return;
-      const nasc = new Date(a.data_nascimento);
-      const idade = agora.getFullYear() - nasc.getFullYear();
-
-      if (idade <= 10) faixas["Até 10"]++;
-      else if (idade <= 15) faixas["11-15"]++;
-      else if (idade <= 18) faixas["16-18"]++;
-      else faixas["19+"]++;
-    });
-
-    renderCharts(faixas, sexos);
-  }
-
-  // ==================== ESTATÍSTICAS DE PROFESSORES ====================
-  async function loadProfessorStats() {
-    const API = 'https://gestao-karate-backend.onrender.com/api/v1/professores/';
-    const professores = await fetchData(API);
-
-    if (professores) {
-      statsProfessoresElement.textContent = professores.length;
-    }
+    renderCharts(stats.faixa_etaria, stats.sexo);
   }
 
   // ==================== GRÁFICOS ====================
@@ -171,8 +142,7 @@ document.addEventListener('DOMContentLoaded', async () => {
   }
 
   // ==================== INICIALIZAÇÃO ====================
-  await loadAlunoStats();
-  await loadProfessorStats();
+  await loadStats();
 
   // --- MENU MOBILE ---
   const sidebar = document.getElementById('sidebar');
@@ -15,6 +15,7 @@ function showFeedback(msg, type = 'success') {
 let allAlunos = [];
 let selectedStudents = [];
 let dadosBancaAtual = [];
+let exameBancaAtual = null;
 
 // ==================== 1. LOADERS ====================
 async function loadAlunos() {
@@ -22,7 +23,13 @@ async function loadAlunos() {
     if(!tbody) return;
     tbody.innerHTML = `<tr><td colspan="3" class="text-center py-4 text-gray-500">Carregando alunos...</td></tr>`;
     try {
-        const res = await fetch(`${API_BASE}/alunos/`, { headers: { Authorization: `Bearer ${getToken()}` } });
+        // Com o filtro marcado, só os alunos aptos até a data escolhida para o exame
+        const soElegiveis = document.getElementById('filtro-elegiveis')?.checked;
+        const dataExame = document.getElementById('exame_data')?.value;
+        const url = soElegiveis
+            ? `${API_BASE}/alunos/elegiveis${dataExame ? `?data=${dataExame}` : ''}`
+            : `${API_BASE}/alunos/`;
+        const res = await fetch(url, { headers: { Authorization: `Bearer ${getToken()}` } });
         if (!res.ok) throw new Error();
         allAlunos = await res.json();
         renderAlunos();
@@ -61,6 +68,11 @@ async function loadExames() {
                         <button onclick="abrirBanca(${ex.id})" class="bg-indigo-600 text-white px-3 py-1.5 rounded text-sm hover:bg-indigo-700 flex items-center gap-1 shadow-sm transition">
                            <i data-feather="award" class="w-4 h-4"></i> Banca
                         </button>
+                        ${ex.encerrado
+                            ? `<span class="bg-gray-200 text-gray-600 px-3 py-1.5 rounded text-sm flex items-center gap-1"><i data-feather="lock" class="w-4 h-4"></i> Encerrado</span>`
+                            : `<button onclick="window.encerrarExame(${ex.id})" class="bg-green-100 text-green-700 px-3 py-1.5 rounded text-sm hover:bg-green-200 flex items-center gap-1 transition">
+                                  <i data-feather="check-circle" class="w-4 h-4"></i> Encerrar
+                               </button>`}
                         <button onclick="window.excluirExame(${ex.id})" class="text-red-600 hover:text-red-800 text-sm flex items-center gap-1 px-2 border border-red-200 rounded hover:bg-red-50 transition">
                            <i data-feather="trash-2" class="w-4 h-4"></i> Excluir
                         </button>
@@ -112,6 +124,16 @@ window.excluirExame = async function(id) {
     } catch { alert("Erro de conexão ao tentar excluir."); }
 };
 
+window.encerrarExame = async function(id) {
+    if(!confirm("Encerrar o exame? Os aprovados serão promovidos à próxima faixa e as notas ficarão travadas.")) return;
+    try {
+        const res = await fetch(`${API_BASE}/exames/${id}/encerrar`, { method: 'POST', headers: { Authorization: `Bearer ${getToken()}` } });
+        const json = await res.json();
+        if(res.ok) { showFeedback(json.message); loadExames(); loadAlunos(); }
+        else alert("Erro ao encerrar: " + (json.message || "Erro desconhecido"));
+    } catch { alert("Erro de conexão ao tentar encerrar."); }
+};
+
 async function createExame() {
     const nome = document.getElementById('exame_nome').value;
     const data = document.getElementById('exame_data').value;
@@ -187,6 +209,7 @@ async function salvarEdicaoExame() {
 
 // ==================== 5. BANCA AVALIADORA ====================
 async function abrirBanca(exameId) {
+    exameBancaAtual = exameId;
     document.getElementById('modal-banca').classList.remove('hidden');
     const tbody = document.getElementById('tbody-banca');
     tbody.innerHTML = '<tr><td colspan="6" class="text-center py-10 text-gray-500">Carregando...</td></tr>';
@@ -300,6 +323,57 @@ async function salvarNota(btn, inscricaoId) {
     }
 }
 
+// SALVAR TODAS AS NOTAS (UMA REQUISIÇÃO)
+async function salvarTodasNotas(btn) {
+    if (!exameBancaAtual || dadosBancaAtual.length === 0) return;
+
+    const notas = dadosBancaAtual.map(item => ({
+        inscricao_id: item.id,
+        kihon: document.getElementById(`k-${item.id}`).value || 0,
+        kata: document.getElementById(`ka-${item.id}`).value || 0,
+        kumite: document.getElementById(`ku-${item.id}`).value || 0,
+        gerais: document.getElementById(`g-${item.id}`).value || 0
+    }));
+
+    const originalHTML = btn.innerHTML;
+    btn.innerHTML = "...";
+    btn.disabled = true;
+
+    try {
+        const res = await fetch(`${API_BASE}/exames/${exameBancaAtual}/notas`, {
+            method: 'POST',
+            headers: { "Content-Type": "application/json", Authorization: `Bearer ${getToken()}` },
+            body: JSON.stringify({ notas })
+        });
+
+        const result = await res.json();
+
+        if (res.ok) {
+            const erros = result.resultados.filter(r => r.status !== 'salvo');
+            result.resultados.filter(r => r.status === 'salvo').forEach(r => {
+                const idx = dadosBancaAtual.findIndex(i => i.id === r.inscricao_id);
+                const enviado = notas.find(n => n.inscricao_id === r.inscricao_id);
+                if (idx !== -1) {
+                    dadosBancaAtual[idx].notas = { kihon: enviado.kihon, kata: enviado.kata, kumite: enviado.kumite, gerais: enviado.gerais };
+                    dadosBancaAtual[idx].media = r.media;
+                    dadosBancaAtual[idx].aprovado = r.aprovado;
+                }
+            });
+            renderizarRanking();
+            if (erros.length) showFeedback(`${result.salvos} salvas, ${erros.length} com erro.`, "error");
+            else showFeedback("Todas as notas foram salvas!", "success");
+        } else {
+            alert("Erro: " + result.message);
+        }
+    } catch {
+        alert("Erro de conexão.");
+    } finally {
+        btn.innerHTML = originalHTML;
+        btn.disabled = false;
+        if(typeof feather !== 'undefined') feather.replace();
+    }
+}
+
 // MAXIMIZAR
 let isMaximized = false;
 function toggleMaximizar() {
@@ -369,6 +443,12 @@ function fecharBanca() {
 // INICIALIZAÇÃO
 document.addEventListener("DOMContentLoaded", () => {
     if(getToken()) { loadAlunos(); loadExames(); }
+
+    // Filtro de aptos: recarrega ao marcar/desmarcar ou ao mudar a data do exame
+    document.getElementById("filtro-elegiveis")?.addEventListener("change", loadAlunos);
+    document.getElementById("exame_data")?.addEventListener("change", () => {
+        if (document.getElementById("filtro-elegiveis")?.checked) loadAlunos();
+    });
     
     const btnView = document.getElementById("btn-visualizar-selecionados");
     if(btnView) {
@@ -0,0 +1,12 @@
+/* ---------- Logout: revoga o token no servidor ---------- */
+// Usado pelo logout() de todas as telas internas. Não espera a resposta para sair
+// (keepalive mantém a requisição viva enquanto a página troca).
+function revogarToken() {
+  const token = localStorage.getItem('token');
+  if (!token) return;
+  fetch('https://gestao-karate-backend.onrender.com/api/v1/users/logout', {
+    method: 'POST',
+    headers: { Authorization: `Bearer ${token}` },
+    keepalive: true
+  }).catch(() => {});
+}